@@ -0,0 +1,27 @@
+"""
+Benchmarks package.
+
+Benchmarks package contains performance measurements of the game package.
+
+Each benchmark is run from the repository root as a module:
+    python3 -m benchmarks.<benchmark name>
+
+Benchmarks package includes following modules:
+    - bench_board_setup - GameBoard setup time.
+    - bench_mine_placement - mine placement time across densities.
+    - bench_board_memory - memory held by the boards of a game.
+    - bench_flood_fill - reveal time on boards without mines.
+    - bench_render - board display time.
+    - bench_render_bytes - bytes written per rendered frame.
+    - bench_engine - moves per second played by the game engine.
+    - bench_snapshot - snapshot size, dump and restore time.
+    - bench_solver - hint latency on mid-game positions.
+    - bench_probability - mine chance latency on mid-game positions.
+    - bench_board_pool - time to the first frame and move of a new game.
+    - bench_no_guess - no guess board generation time and success rate.
+    - bench_server - game server sessions per GB and per core.
+    - bench_prefork - connection to welcome screen latency of warm workers.
+    - bench_startup - import time and time to the banner of a new process.
+    - bench_session_memory - memory per idle game server session.
+    - bench_leaderboard - score submissions per second of many sessions.
+"""
@@ -0,0 +1,67 @@
+"""
+Board memory benchmark.
+
+Measures memory held by a game (GameBoard and PlayerBoard) with
+list storage and with compact storage, across board sizes.
+
+The script requires:
+    - Built in utility "tracemalloc" for memory measurement.
+    - "board" module from the game package, and it's classes:
+        - GameBoard,
+        - PlayerBoard.
+
+Functions:
+    - game_memory()
+    - main()
+"""
+
+import tracemalloc
+from modules.board import GameBoard, PlayerBoard
+
+
+# Benchmarked board sizes (rows, cols), mine density is 15%.
+SIZES = [(10, 10), (30, 16), (100, 100), (300, 300)]
+DENSITY = .15
+
+
+def game_memory(rows, cols, compact):
+    """
+    Measures memory held by the boards of one game.
+
+    :param rows: Number of board rows.
+    :type rows: int
+    :param cols: Number of board columns.
+    :type cols: int
+    :param compact: Use compact storage of the boards.
+    :type compact: bool
+    :return: Allocated bytes.
+    :rtype: int
+    """
+
+    mines = int(rows * cols * DENSITY)
+
+    tracemalloc.start()
+    gm_board = GameBoard(rows, cols, mines, seed=0, compact=compact)
+    pl_board = PlayerBoard(rows, cols, gm_board.board, compact)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del gm_board, pl_board
+    return size
+
+
+def main():
+    """
+    Prints memory held by a game for every board size and storage.
+    """
+
+    print(f"{'size':>10}{'list':>14}{'compact':>14}{'ratio':>8}")
+    for rows, cols in SIZES:
+        lists = game_memory(rows, cols, False)
+        compact = game_memory(rows, cols, True)
+        print(f"{f'{rows}x{cols}':>10}{lists:>12,}B{compact:>12,}B"
+              f"{lists / compact:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
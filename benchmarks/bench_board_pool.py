@@ -0,0 +1,111 @@
+"""
+Board pool benchmark.
+
+Measures the time from "play again" to the first frame of the new
+game, and to the frame after it's first move, with and without
+the pool of pregenerated boards. The pool is refilled between the
+games, as it is while the player plays.
+
+The script requires:
+    - Built in utility "io" for capturing the output.
+    - Built in utility "contextlib" for redirecting the output.
+    - Built in utility "time" and it's methods "perf_counter"
+        and "sleep".
+    - "minesweeper" module from the game package, and it's class:
+        - Minesweeper.
+    - "board_pool" module from the game package, and it's class:
+        - BoardPool.
+
+Functions:
+    - wait_for_refill()
+    - bench_game()
+    - main()
+"""
+
+import io
+from contextlib import redirect_stdout
+from time import perf_counter, sleep
+from modules.minesweeper import Minesweeper
+from modules.board_pool import BoardPool
+
+
+# Benchmarked games (rows, cols, mines) and games played per game size.
+GAMES = [(10, 10, 10), (100, 100, 1500), (300, 300, 13500),
+         (1000, 1000, 150000)]
+ROUNDS = 5
+
+
+def wait_for_refill(board_pool):
+    """
+    Waits until every queue of the pool is full.
+
+    :param board_pool: Pool of pregenerated boards.
+    :type board_pool: BoardPool
+    """
+
+    while not all(queue.full() for queue in board_pool.queues.values()):
+        sleep(.01)
+
+
+def bench_game(rows, cols, mines, board_pool):
+    """
+    Starts the game and makes it's first move, drawing the frames
+    without the row by row animation.
+
+    :param board_pool: Pool of pregenerated boards, boards are
+        generated by the game if None.
+    :type board_pool: BoardPool/None
+    :return: Seconds to the first frame and to the frame
+        after the first move.
+    :rtype: tuple
+    """
+
+    with redirect_stdout(io.StringIO()):
+        start = perf_counter()
+        game = Minesweeper(rows, cols, mines, board_pool=board_pool)
+        game.engine.pl_board.initial_run = False
+        game.renderer.render(game.engine.pl_board, game._game_footer())
+        first_frame = perf_counter() - start
+
+        start = perf_counter()
+        game.action_type = "display"
+        game._player_move(rows // 2, cols // 2)
+        game.renderer.render(game.engine.pl_board, game._game_footer())
+        first_move = perf_counter() - start
+
+    return first_frame, first_move
+
+
+def main():
+    """
+    Prints mean time to the first frame and to the first move
+    for every game size.
+    """
+
+    print(f"{'game':>20}{'boards':>10}{'first frame':>14}"
+          f"{'first move':>14}")
+    for rows, cols, mines in GAMES:
+        board_pool = BoardPool([(rows, cols, mines)])
+        board_pool.start()
+
+        for pool in (None, board_pool):
+            times = []
+            for _ in range(ROUNDS):
+                if pool is not None:
+                    wait_for_refill(pool)
+                times.append(bench_game(rows, cols, mines, pool))
+
+            first_frame = sum(time[0] for time in times) / ROUNDS
+            first_move = sum(time[1] for time in times) / ROUNDS
+            print(f"{f'{rows}x{cols}/{mines}':>20}"
+                  f"{'deferred' if pool is None else 'pool':>10}"
+                  f"{first_frame * 1000:>12.2f}ms"
+                  f"{first_move * 1000:>12.2f}ms")
+
+        board_pool.close()
+        print(f"{'':>20}{'pool hits':>10}{board_pool.hits:>14}"
+              f"{'misses':>10}{board_pool.misses:>4}")
+
+
+if __name__ == "__main__":
+    main()
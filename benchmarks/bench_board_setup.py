@@ -0,0 +1,65 @@
+"""
+Board setup benchmark.
+
+Measures GameBoard setup time across board sizes for every
+available board engine.
+
+The script requires:
+    - Built in utility "timeit" for time measurement.
+    - "board" module from the game package, and it's:
+        - GameBoard class,
+        - ENGINES - available board engines,
+        - load_numpy - numpy module or None if it is not installed.
+
+Functions:
+    - bench_setup()
+    - main()
+"""
+
+from timeit import repeat
+from modules.board import GameBoard, ENGINES, load_numpy
+
+
+# Benchmarked board sizes (rows, cols), mine density is 15%.
+SIZES = [(10, 10), (30, 16), (100, 100), (300, 300), (1000, 1000)]
+DENSITY = .15
+
+
+def bench_setup(rows, cols, engine):
+    """
+    Measures the best GameBoard setup time.
+
+    :param rows: Number of board rows.
+    :type rows: int
+    :param cols: Number of board columns.
+    :type cols: int
+    :param engine: Board engine.
+    :type engine: str
+    :return: Best setup time in seconds.
+    :rtype: float
+    """
+
+    mines = int(rows * cols * DENSITY)
+    runs = 1 if rows * cols > 10000 else 20
+
+    return min(repeat(lambda: GameBoard(rows, cols, mines, engine),
+                      number=1, repeat=runs))
+
+
+def main():
+    """
+    Prints setup times for every board size and engine.
+    """
+
+    engines = [engine for engine in ENGINES
+               if engine != "numpy" or load_numpy() is not None]
+
+    print(f"{'size':>10}" + "".join(f"{engine:>12}" for engine in engines))
+    for rows, cols in SIZES:
+        times = [bench_setup(rows, cols, engine) for engine in engines]
+        print(f"{f'{rows}x{cols}':>10}" +
+              "".join(f"{t * 1000:>10.2f}ms" for t in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Engine benchmark.
+
+Measures how many moves per second the headless game engine plays.
+Every game is played by a bot that displays random hidden fields,
+flagging one in ten, until the game is over.
+
+The script requires:
+    - Built in utility "time" and it's method "perf_counter".
+    - Built in utility "random" and it's class "Random".
+    - "engine" module from the game package, and it's:
+        - GameEngine class,
+        - PLAYING - state of the game being played.
+
+Functions:
+    - play_games()
+    - main()
+"""
+
+from time import perf_counter
+from random import Random
+from modules.engine import GameEngine, PLAYING
+
+
+# Benchmarked games (rows, cols, mines) and number of games played.
+GAMES = [(9, 9, 10), (16, 16, 40), (16, 30, 99), (100, 100, 1500)]
+NUM_OF_GAMES = 200
+
+
+def play_games(rows, cols, mines, games, compact):
+    """
+    Plays the games with a random bot.
+
+    :param rows: Number of board rows.
+    :type rows: int
+    :param cols: Number of board columns.
+    :type cols: int
+    :param mines: Number of mines on the board.
+    :type mines: int
+    :param games: Number of games played.
+    :type games: int
+    :param compact: Use compact storage of the boards.
+    :type compact: bool
+    :return: Number of moves played and time taken in seconds.
+    :rtype: tuple
+    """
+
+    engine = GameEngine(compact=compact)
+    rng = Random(0)
+    moves = 0
+
+    start = perf_counter()
+    for seed in range(games):
+        engine.new_game(rows, cols, mines, seed)
+        while engine.state == PLAYING:
+            row, col = rng.randrange(rows), rng.randrange(cols)
+            if engine.pl_board.is_visible(row, col):
+                continue
+
+            action = "flag" if rng.random() < .1 else "display"
+            engine.step(action, row, col)
+            moves += 1
+
+    return moves, perf_counter() - start
+
+
+def main():
+    """
+    Prints moves and games per second for every game size.
+    """
+
+    print(f"{'game':>16}{'storage':>10}{'moves/s':>12}{'games/s':>12}")
+    for rows, cols, mines in GAMES:
+        games = max(1, NUM_OF_GAMES * 81 // (rows * cols))
+        for compact in (False, True):
+            moves, seconds = play_games(rows, cols, mines, games, compact)
+            print(f"{f'{rows}x{cols}/{mines}':>16}"
+                  f"{'compact' if compact else 'list':>10}"
+                  f"{moves / seconds:>12.0f}{games / seconds:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
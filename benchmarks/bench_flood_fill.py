@@ -0,0 +1,104 @@
+"""
+Flood fill benchmark.
+
+Compares the previous flood fill, which scanned it's stack for
+every EMPTY field, with PlayerBoard's flood fill and with copying
+the precomputed EMPTY region, on worst case boards without mines,
+where one display move opens the whole board.
+
+The script requires:
+    - Built in utility "time" and it's method "perf_counter".
+    - "board" module from the game package, and it's classes:
+        - GameBoard,
+        - PlayerBoard.
+    - "consts" module from the game package and it's consts:
+        - HIDDEN, MINE, EMPTY, OFFSETS.
+
+Functions:
+    - fill_stack_scan()
+    - bench_fill()
+    - main()
+"""
+
+from time import perf_counter
+from modules.board import GameBoard, PlayerBoard
+from modules.consts import HIDDEN, MINE, EMPTY, OFFSETS
+
+
+# Benchmarked board sizes (rows, cols).
+SIZES = [(30, 16), (100, 100), (200, 200), (500, 500)]
+# Largest board (fields) the previous flood fill is run on.
+STACK_SCAN_LIMIT = 100 * 100
+
+
+def fill_stack_scan(pl_board, row, col):
+    """
+    Previous flood fill; checks if the field is already stacked
+    with a linear scan of the stack.
+
+    :param pl_board: Player board to fill.
+    :type pl_board: PlayerBoard
+    """
+
+    board, gm_board = pl_board.board, pl_board.gm_board
+    board[row][col] = gm_board[row][col]
+    if board[row][col] != EMPTY:
+        return
+
+    fields = [(row, col)]
+
+    while len(fields) > 0:
+        field = fields.pop()
+
+        for offset in OFFSETS:
+            row = offset[0] + field[0]
+            col = offset[1] + field[1]
+
+            if (row in range(0, pl_board.rows)) and \
+                    (col in range(0, pl_board.cols)) and \
+                    (board[row][col] == HIDDEN) and \
+                    (gm_board[row][col] != MINE):
+                board[row][col] = gm_board[row][col]
+
+                if (board[row][col] == EMPTY) and \
+                        ((row, col) not in fields):
+                    fields.append((row, col))
+
+
+def bench_fill(rows, cols, fill, index_regions=False):
+    """
+    Measures one flood fill of an empty board from it's center.
+
+    :return: Fill time in seconds.
+    :rtype: float
+    """
+
+    gm_board = GameBoard(rows, cols, 0, index_regions=index_regions)
+    pl_board = PlayerBoard(rows, cols, gm_board.board,
+                           region_index=gm_board.region_index)
+
+    start = perf_counter()
+    fill(pl_board, rows // 2, cols // 2)
+
+    return perf_counter() - start
+
+
+def main():
+    """
+    Prints flood fill times for every board size.
+    """
+
+    print(f"{'size':>10}{'stack scan':>14}{'visited':>14}{'region':>14}")
+    for rows, cols in SIZES:
+        if rows * cols <= STACK_SCAN_LIMIT:
+            scan = f"{bench_fill(rows, cols, fill_stack_scan) * 1000:.2f}ms"
+        else:
+            scan = "skipped"
+        visited = bench_fill(rows, cols, PlayerBoard.set_field)
+        region = bench_fill(rows, cols, PlayerBoard.set_field, True)
+        print(f"{f'{rows}x{cols}':>10}{scan:>14}{visited * 1000:>12.2f}ms"
+              f"{region * 1000:>12.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
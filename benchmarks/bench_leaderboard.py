@@ -0,0 +1,163 @@
+"""
+Leaderboard benchmark.
+
+Measures the score submissions of many sessions finishing their games
+at once, stored in a SQLite leaderboard file:
+    - write-behind - scores are queued by ScoreSubmitter and written
+        in batches from it's background thread,
+    - synchronous - every session writes it's score in it's own
+        transaction, as a game without the submitter would.
+
+Sessions are threads submitting their share of the scores at once.
+Submit latency is the time a session waits for the submission, the
+rate is the scores per second until all of them are stored.
+
+The script requires:
+    - Built in utility "os" for the database file path.
+    - Built in utility "tempfile" for the directory of the database.
+    - Built in utility "threading" and it's classes "Thread"
+        and "Barrier" for the sessions.
+    - Built in utility "time" and it's methods "time"
+        and "perf_counter".
+    - Built in utility "statistics" and it's functions "median"
+        and "quantiles".
+    - "leaderboard" module from the game package, and it's classes:
+        - Score,
+        - ScoreSubmitter.
+    - "leaderboard_backends" module from the game package, and it's
+        class "SQLiteBackend".
+
+Functions:
+    - run_sessions()
+    - write_behind()
+    - synchronous()
+    - main()
+"""
+
+import os
+import tempfile
+from threading import Thread, Barrier
+from time import time, perf_counter
+from statistics import median, quantiles
+from modules.leaderboard import Score, ScoreSubmitter
+from modules.leaderboard_backends import SQLiteBackend
+
+
+# Sessions submitting at once and scores submitted by all of them.
+SESSIONS = (1, 8, 64)
+SCORES = 2000
+
+
+def run_sessions(sessions, submit):
+    """
+    Submits the scores from the sessions at once.
+
+    :param sessions: Number of sessions.
+    :type sessions: int
+    :param submit: Function submitting one score.
+    :type submit: function
+    :return: Submit latencies in seconds.
+    :rtype: list
+    """
+
+    barrier = Barrier(sessions)
+    latencies = [[] for _ in range(sessions)]
+
+    def session(num):
+        barrier.wait()
+        for game in range(SCORES // sessions):
+            score = Score(f"player-{num}", 10, 10, 10, game, True, time())
+            start = perf_counter()
+            submit(score)
+            latencies[num].append(perf_counter() - start)
+
+    threads = [Thread(target=session, args=(num,))
+               for num in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return [latency for times in latencies for latency in times]
+
+
+def write_behind(path, sessions):
+    """
+    Submits the scores to the background writes of ScoreSubmitter.
+
+    :param path: Database file.
+    :type path: str
+    :param sessions: Number of sessions.
+    :type sessions: int
+    :return: Submit latencies, seconds until the scores are stored
+        and scores per transaction.
+    :rtype: tuple
+    """
+
+    backend = SQLiteBackend(path)
+    # Database is created before the measurement.
+    backend.write([])
+    submitter = ScoreSubmitter(backend)
+    submitter.start()
+
+    start = perf_counter()
+    latencies = run_sessions(sessions, submitter.submit)
+    submitter.flush()
+    seconds = perf_counter() - start
+
+    submitter.close()
+
+    return latencies, seconds, submitter.written / submitter.batches
+
+
+def synchronous(path, sessions):
+    """
+    Writes every score in it's own transaction by the session.
+
+    :param path: Database file.
+    :type path: str
+    :param sessions: Number of sessions.
+    :type sessions: int
+    :return: Submit latencies, seconds until the scores are stored
+        and scores per transaction.
+    :rtype: tuple
+    """
+
+    backend = SQLiteBackend(path)
+    backend.write([])
+
+    start = perf_counter()
+    latencies = run_sessions(sessions,
+                             lambda score: backend.write([score]))
+    seconds = perf_counter() - start
+
+    backend.close()
+
+    return latencies, seconds, 1.
+
+
+def main():
+    """
+    Prints the submit latency and the submissions per second
+    of both ways.
+    """
+
+    print(f"{SCORES} scores, SQLite leaderboard")
+    print(f"{'submit':>13}{'sessions':>10}{'median us':>11}{'p99 us':>10}"
+          f"{'scores/s':>10}{'batch':>8}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, submit in (("write-behind", write_behind),
+                             ("synchronous", synchronous)):
+            for sessions in SESSIONS:
+                path = os.path.join(directory, f"{name}-{sessions}.db")
+                latencies, seconds, batch = submit(path, sessions)
+
+                print(f"{name:>13}{sessions:>10}"
+                      f"{median(latencies) * 1e6:>11.1f}"
+                      f"{quantiles(latencies, n=100)[98] * 1e6:>10.1f}"
+                      f"{len(latencies) / seconds:>10.0f}{batch:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
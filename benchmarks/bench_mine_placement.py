@@ -0,0 +1,91 @@
+"""
+Mine placement benchmark.
+
+Compares the previous rejection based mine placement with the
+sampling without replacement used by GameBoard, across mine densities.
+
+The script requires:
+    - Built in utility "random" and it's class "Random".
+    - Built in utility "timeit" for time measurement.
+    - "board" module from the game package, and it's class GameBoard.
+    - "consts" module from the game package, and it's const MINE.
+
+Functions:
+    - place_rejection()
+    - place_sampling()
+    - main()
+"""
+
+from random import Random
+from timeit import repeat
+from modules.board import GameBoard
+from modules.consts import MINE
+
+
+# Benchmarked board sizes (rows, cols) and mine densities.
+SIZES = [(30, 16), (100, 100), (300, 300)]
+DENSITIES = [.1, .5, .9, .99]
+
+
+def place_rejection(rows, cols, mines, seed=None):
+    """
+    Previous mine placement; draws random fields and retries
+    when the field already holds a mine.
+
+    :return: Board with placed mines.
+    :rtype: list
+    """
+
+    rand = Random(seed)
+    board = [[None] * cols for _ in range(rows)]
+
+    mine_count = 1
+    while mine_count <= mines:
+        field = rand.randint(0, (rows * cols)-1)
+        row = field // cols
+        col = field % cols
+
+        if board[row][col] == MINE:
+            continue
+
+        board[row][col] = MINE
+        mine_count += 1
+
+    return board
+
+
+def place_sampling(rows, cols, mines, seed=None):
+    """
+    Current mine placement; samples mine fields without replacement.
+
+    :return: Board with placed mines.
+    :rtype: list
+    """
+
+    board = GameBoard.__new__(GameBoard)
+    board.rows, board.cols, board.mines, board.seed = rows, cols, mines, seed
+    board.board = [[None] * cols for _ in range(rows)]
+    board._place_mines()
+
+    return board.board
+
+
+def main():
+    """
+    Prints placement times for every board size and density.
+    """
+
+    print(f"{'size':>10}{'density':>10}{'rejection':>14}{'sampling':>14}")
+    for rows, cols in SIZES:
+        for density in DENSITIES:
+            mines = int(rows * cols * density)
+            runs = 3 if rows * cols > 10000 else 10
+            times = [min(repeat(lambda f=place: f(rows, cols, mines),
+                                number=1, repeat=runs))
+                     for place in (place_rejection, place_sampling)]
+            print(f"{f'{rows}x{cols}':>10}{density:>10.0%}" +
+                  "".join(f"{t * 1000:>12.2f}ms" for t in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+No guess benchmark.
+
+Measures the time of the first move of a game, which generates it's
+board, on random boards and on boards searched for by the no guess
+generator in this process and on a worker per core. Reports the
+share of the candidates cleared without guessing for every size.
+
+The script requires:
+    - Built in utility "os" for the number of cores.
+    - Built in utility "time" and it's method "perf_counter".
+    - "engine" module from the game package, and it's class:
+        - GameEngine.
+    - "no_guess" module from the game package, and it's class:
+        - NoGuessGenerator.
+
+Functions:
+    - bench_first_move()
+    - main()
+"""
+
+import os
+from time import perf_counter
+from modules.engine import GameEngine
+from modules.no_guess import NoGuessGenerator
+
+
+# Benchmarked games (rows, cols, mines) and games played per game size.
+GAMES = [(9, 9, 10), (16, 16, 40), (16, 30, 99), (30, 30, 180)]
+ROUNDS = 10
+
+
+def bench_first_move(rows, cols, mines, no_guess):
+    """
+    Measures the first moves of the games.
+
+    :param no_guess: Generator of the boards, random boards if None.
+    :type no_guess: NoGuessGenerator/None
+    :return: First move times in seconds.
+    :rtype: list
+    """
+
+    times = []
+
+    for seed in range(ROUNDS):
+        engine = GameEngine(no_guess=no_guess)
+        engine.new_game(rows, cols, mines, seed)
+
+        start = perf_counter()
+        engine.step("display", rows // 2, cols // 2)
+        times.append(perf_counter() - start)
+
+    return times
+
+
+def main():
+    """
+    Prints mean and worst first move time, and the success rate
+    of the generators, for every game size.
+    """
+
+    cores = os.cpu_count()
+    generators = {"random": None,
+                  "no guess x1": NoGuessGenerator(workers=1)}
+    if cores > 1:
+        generators[f"no guess x{cores}"] = NoGuessGenerator(workers=cores)
+
+    print(f"{'game':>14}{'boards':>16}{'mean':>12}{'max':>12}"
+          f"{'success':>10}{'timeouts':>10}")
+    for rows, cols, mines in GAMES:
+        for name, no_guess in generators.items():
+            times = bench_first_move(rows, cols, mines, no_guess)
+
+            success = timeouts = ""
+            if no_guess is not None:
+                success = f"{no_guess.success_rate(rows, cols, mines):.1%}"
+                timeouts = no_guess.stats[rows, cols, mines].timeouts
+
+            print(f"{f'{rows}x{cols}/{mines}':>14}{name:>16}"
+                  f"{sum(times) / len(times) * 1000:>10.2f}ms"
+                  f"{max(times) * 1000:>10.2f}ms"
+                  f"{success:>10}{timeouts:>10}")
+
+    for no_guess in generators.values():
+        if no_guess is not None:
+            no_guess.close()
+
+
+if __name__ == "__main__":
+    main()
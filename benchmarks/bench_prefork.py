@@ -0,0 +1,177 @@
+"""
+Pre-fork supervisor benchmark.
+
+Measures the latency from a connection to the welcome screen, for
+a game process started per connection, as the web terminal spawns
+them, and for a warm worker of the pre-fork supervisor. Then a burst
+of connections larger than the pool, all connected at once, shows
+if the supervisor refills the pool fast enough, as the hits and
+misses of it's stats.
+
+The game process is started on a pseudo terminal, like node-pty
+does, so the benchmark runs on Unix.
+
+The script requires:
+    - Built in utility "os" for the pseudo terminal.
+    - Built in utility "sys" for the Python interpreter.
+    - Built in utility "pty" for starting the game process.
+    - Built in utility "subprocess" for the supervisor process.
+    - Built in utility "tempfile" for the socket path.
+    - Built in utility "time" and it's methods "perf_counter" and
+        "sleep".
+    - Built in utility "statistics" and it's method "median".
+    - "prefork" module, and it's function "connect".
+    - "banner" module from the game package, and it's function
+        "banner".
+
+Functions:
+    - cold_start()
+    - play()
+    - welcome()
+    - stats()
+    - main()
+"""
+
+import os
+import sys
+import pty
+import subprocess
+import tempfile
+from time import perf_counter, sleep
+from statistics import median
+from prefork import connect
+from modules.banner import banner
+
+
+# Connections timed, workers kept and connections of the burst.
+RUNS = 10
+WORKERS = 4
+BURST = 8
+# Seconds the supervisor has to refill the pool between the runs.
+REFILL_TIME = .5
+# First line of the banner, the welcome screen is printed after it's
+# cleared, the alert under the banner is delayed line by line.
+WELCOME = next(line for line in banner().splitlines()
+               if line.strip()).encode()
+
+
+def cold_start():
+    """
+    Starts the game process on a pseudo terminal and waits for
+    the welcome screen.
+
+    :return: Seconds to the welcome screen.
+    :rtype: float
+    """
+
+    start = perf_counter()
+    pid, master = pty.fork()
+
+    if pid == 0:
+        os.execv(sys.executable, [sys.executable, "run.py"])
+
+    output = b""
+    try:
+        while WELCOME not in output:
+            output += os.read(master, 65536)
+    except OSError:
+        pass
+
+    seconds = perf_counter() - start
+
+    os.kill(pid, 9)
+    os.waitpid(pid, 0)
+    os.close(master)
+
+    return seconds
+
+
+def play(path):
+    """
+    Connects to the supervisor for a game.
+
+    :param path: Path of the supervisor's socket.
+    :type path: str
+    :return: Connection to the game.
+    :rtype: socket.socket
+    """
+
+    return connect(path, {"cmd": "play", "args": [],
+                          "cols": 80, "lines": 24})
+
+
+def welcome(conn):
+    """
+    Waits for the welcome screen of the game.
+
+    :param conn: Connection to the game.
+    :type conn: socket.socket
+    """
+
+    output = b""
+    while WELCOME not in output:
+        data = conn.recv(65536)
+        if not data:
+            break
+        output += data
+
+
+def stats(path):
+    """
+    Gets the stats of the supervisor.
+
+    :param path: Path of the supervisor's socket.
+    :type path: str
+    :return: Stats line.
+    :rtype: str
+    """
+
+    with connect(path, {"cmd": "stats"}) as conn:
+        return conn.makefile().readline().strip()
+
+
+def main():
+    """
+    Prints the median latency to the welcome screen of a cold and
+    a warm start, and the pool stats after a burst of connections.
+    """
+
+    cold = median(cold_start() for _ in range(RUNS))
+
+    path = os.path.join(tempfile.mkdtemp(), "prefork.sock")
+    supervisor = subprocess.Popen(
+        [sys.executable, "prefork.py", "--socket", path,
+         "--workers", str(WORKERS)], stdout=subprocess.PIPE)
+    supervisor.stdout.readline()
+
+    try:
+        warm = []
+        for _ in range(RUNS):
+            start = perf_counter()
+            with play(path) as conn:
+                welcome(conn)
+                warm.append(perf_counter() - start)
+            sleep(REFILL_TIME)
+
+        start = perf_counter()
+        burst = [play(path) for _ in range(BURST)]
+        for conn in burst:
+            welcome(conn)
+        seconds = perf_counter() - start
+        burst_stats = stats(path)
+
+        for conn in burst:
+            conn.close()
+    finally:
+        supervisor.terminate()
+        supervisor.wait()
+
+    print(f"welcome screen: cold start {cold * 1000:.1f}ms,"
+          f" warm worker {median(warm) * 1000:.1f}ms,"
+          f" {cold / median(warm):.1f}x faster")
+    print(f"burst of {BURST} connections, {WORKERS} workers:"
+          f" {seconds * 1000:.1f}ms, {burst_stats}")
+
+
+if __name__ == "__main__":
+    main()
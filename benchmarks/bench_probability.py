@@ -0,0 +1,107 @@
+"""
+Probability benchmark.
+
+Measures mine chance latency on mid-game positions, recorded as in
+the solver benchmark. From every position the game is played on with
+the mine chances computed after each move, once with the memoized
+components and once enumerating every component again.
+
+The script requires:
+    - Built in utility "time" and it's method "perf_counter".
+    - Built in utility "random" and it's class "Random".
+    - "engine" module from the game package, and it's:
+        - GameEngine class,
+        - PLAYING - state of the game being played.
+    - "snapshot" module from the game package, and it's function:
+        - restore_snapshot.
+    - "solver" module from the game package, and it's class:
+        - Solver.
+    - "probability" module from the game package, and it's class:
+        - MineProbability.
+    - "bench_solver" module from the same directory, and it's functions:
+        - bot_move,
+        - record_positions.
+
+Functions:
+    - bench_position()
+    - main()
+"""
+
+from time import perf_counter
+from random import Random
+from modules.engine import GameEngine, PLAYING
+from modules.snapshot import restore_snapshot
+from modules.solver import Solver
+from modules.probability import MineProbability
+from benchmarks.bench_solver import bot_move, record_positions
+
+
+# Benchmarked games (rows, cols, mines).
+GAMES = [(16, 30, 99), (100, 100, 1500), (300, 300, 13500)]
+# Moves played from every position.
+MOVES = 30
+
+
+def bench_position(position, memoized):
+    """
+    Plays the moves from the position, computing the mine chances
+    after every move.
+
+    :param position: Snapshot of the position.
+    :type position: bytes
+    :param memoized: Keep the memoized components between moves.
+    :type memoized: bool
+    :return: Latencies in seconds, and number of inexact results.
+    :rtype: tuple
+    """
+
+    engine = GameEngine()
+    restore_snapshot(position, engine)
+    solver = Solver(engine.pl_board)
+    probability = MineProbability(solver, engine.mines)
+    rng = Random(0)
+    latencies = []
+    inexact = 0
+
+    for _ in range(MOVES):
+        result = engine.step(*bot_move(engine, solver, rng))
+        if result.state != PLAYING:
+            break
+        solver.update(result.revealed)
+
+        if not memoized:
+            probability.cache.clear()
+
+        start = perf_counter()
+        inexact += not probability.odds().exact
+        latencies.append(perf_counter() - start)
+
+    return latencies, inexact
+
+
+def main():
+    """
+    Prints mean and worst latency for every game size.
+    """
+
+    print(f"{'game':>18}{'components':>12}{'mean':>12}{'max':>12}"
+          f"{'inexact':>9}")
+    for rows, cols, mines in GAMES:
+        positions = record_positions(rows, cols, mines)
+
+        for memoized in (False, True):
+            latencies, inexact = [], 0
+            for position in positions:
+                position_latencies, position_inexact = \
+                    bench_position(position, memoized)
+                latencies += position_latencies
+                inexact += position_inexact
+
+            print(f"{f'{rows}x{cols}/{mines}':>18}"
+                  f"{'memoized' if memoized else 'recounted':>12}"
+                  f"{sum(latencies) / len(latencies) * 1000:>10.2f}ms"
+                  f"{max(latencies) * 1000:>10.2f}ms{inexact:>9}")
+
+
+if __name__ == "__main__":
+    main()
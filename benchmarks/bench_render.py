@@ -0,0 +1,107 @@
+"""
+Render benchmark.
+
+Compares the previous board display, which printed every field and
+rebuilt it's colour table for every field, with Board.display, which
+builds the frame from the glyph table and writes it at once.
+
+The script requires:
+    - Built in utility "io" for capturing the output.
+    - Built in utility "contextlib" for redirecting the output.
+    - Built in utility "timeit" for time measurement.
+    - "board" module from the game package, and it's class GameBoard.
+    - "consts" module from the game package and it's consts:
+        - HIDDEN, MINE, EMPTY, FLAG.
+
+Functions:
+    - display_per_field()
+    - bench_display()
+    - main()
+"""
+
+import io
+from contextlib import redirect_stdout
+from timeit import repeat
+from modules.board import GameBoard
+from modules.consts import HIDDEN, MINE, EMPTY, FLAG
+
+
+# Benchmarked board sizes (rows, cols, mines).
+SIZES = [(10, 10, 10), (16, 30, 99), (200, 200, 6000)]
+
+
+def display_per_field(board):
+    """
+    Previous board display; prints every field on it's own.
+
+    :param board: Board to display.
+    :type board: Board
+    """
+
+    print('   ', end='  ')
+    for i in range(1, board.cols+1):
+        print(i, end='  ')
+
+    print('\n  ', end='  ')
+    for i in range(board.cols):
+        print('_', end='__')
+
+    print()
+    for row in range(board.rows):
+        print(board.row_indicator(row+1), end='')
+        for col in range(board.cols):
+            field = board.board[row][col]
+            board_values = {
+                HIDDEN: f'\033[39;2m{field}\033[0m',
+                EMPTY: f'\033[39;2m{field}\033[0m',
+                FLAG: f'\033[33;1m{field}\033[0m',
+                MINE: f'\033[30;41;1m{field}\033[0m',
+                1: f'\033[34;1m{field}\033[0m',
+                2: f'\033[32;1m{field}\033[0m',
+                3: f'\033[31;1m{field}\033[0m',
+                4: f'\033[35;1m{field}\033[0m',
+                5: f'\033[33;1m{field}\033[0m',
+                6: f'\033[36;1m{field}\033[0m',
+                7: f'\033[37;1m{field}\033[0m',
+                8: f'\033[31;1m{field}\033[0m'
+            }
+            print(board_values[field], end='  ')
+
+        print()
+
+
+def bench_display(board, display):
+    """
+    Measures the best display time of the board.
+
+    :return: Display time in seconds.
+    :rtype: float
+    """
+
+    runs = 3 if board.rows * board.cols > 10000 else 50
+
+    def run():
+        with redirect_stdout(io.StringIO()):
+            display(board)
+
+    return min(repeat(run, number=1, repeat=runs))
+
+
+def main():
+    """
+    Prints display times for every board size.
+    """
+
+    print(f"{'size':>10}{'per field':>14}{'one write':>14}{'speedup':>10}")
+    for rows, cols, mines in SIZES:
+        board = GameBoard(rows, cols, mines, seed=0)
+        board.initial_run = False
+
+        per_field = bench_display(board, display_per_field)
+        one_write = bench_display(board, GameBoard.display)
+        print(f"{f'{rows}x{cols}':>10}{per_field * 1000:>12.2f}ms"
+              f"{one_write * 1000:>12.2f}ms{per_field / one_write:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Render bandwidth benchmark.
+
+Plays random display moves and compares bytes written per frame by
+clearing the screen and printing the whole board with bytes written
+by the DiffRenderer.
+
+The script requires:
+    - Built in utility "io" for capturing the output.
+    - Built in utility "os" for setting the terminal size.
+    - Built in utility "contextlib" for redirecting the output.
+    - Built in utility "random" and it's class "Random".
+    - "board" module from the game package, and it's classes:
+        - GameBoard,
+        - PlayerBoard.
+    - "renderer" module from the game package, and it's:
+        - DiffRenderer class,
+        - CLEAR_SCREEN - escape codes clearing the screen.
+    - "consts" module from the game package, and it's const MINE.
+
+Functions:
+    - full_frame_bytes()
+    - main()
+"""
+
+import io
+import os
+from contextlib import redirect_stdout
+from random import Random
+from modules.board import GameBoard, PlayerBoard
+from modules.renderer import DiffRenderer, CLEAR_SCREEN
+from modules.consts import MINE
+
+
+# Benchmarked board sizes (rows, cols, mines) and moves per game.
+SIZES = [(10, 10, 10), (16, 30, 99), (50, 50, 300)]
+MOVES = 30
+FOOTER = "\nMINES: 10\tFLAGS: 10\tTIMER: 0"
+
+
+def full_frame_bytes(board):
+    """
+    Measures bytes written by clearing the screen and
+    displaying the whole board with the footer.
+
+    :param board: Board to display.
+    :type board: Board
+    :return: Written bytes.
+    :rtype: int
+    """
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        board.display()
+        print(FOOTER)
+
+    return len((CLEAR_SCREEN + output.getvalue()).encode())
+
+
+def main():
+    """
+    Prints average bytes per frame for every board size.
+    """
+
+    # Every benchmarked board fits on the screen.
+    os.environ["LINES"] = "100"
+    os.environ["COLUMNS"] = "200"
+
+    print(f"{'size':>10}{'full':>12}{'diff':>12}{'saving':>10}")
+    for rows, cols, mines in SIZES:
+        rand = Random(0)
+        gm_board = GameBoard(rows, cols, mines, seed=0)
+        pl_board = PlayerBoard(rows, cols, gm_board.board)
+        pl_board.initial_run = False
+        renderer = DiffRenderer(io.StringIO())
+
+        full = diff = frames = 0
+        renderer.render(pl_board, FOOTER)
+
+        while frames < MOVES and pl_board.hidden_count > mines:
+            row, col = rand.randrange(rows), rand.randrange(cols)
+            if pl_board.is_visible(row, col) or \
+                    gm_board.is_field_type(row, col, MINE):
+                continue
+
+            pl_board.set_field(row, col)
+            renderer.render(pl_board, FOOTER)
+
+            full += full_frame_bytes(pl_board)
+            diff += renderer.frame_bytes
+            frames += 1
+
+        print(f"{f'{rows}x{cols}':>10}{full / frames:>10.0f}B"
+              f"{diff / frames:>10.0f}B{1 - diff / full:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
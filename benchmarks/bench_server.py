@@ -0,0 +1,194 @@
+"""
+Server benchmark.
+
+Measures the capacity of the game server: the memory of a session,
+and the moves the server plays per second of CPU time, given as
+sessions per GB and per core. The memory of a session is compared
+with a game process per session, as the web terminal spawns them.
+
+The server is run as it's own process, memory is read as the resident
+set size and CPU time from /proc, so the benchmark runs on Linux.
+Clients connect to the server on the loopback interface, go through
+the welcome screens and wait on the first move. Then every client
+plays random moves as fast as the server answers, playing again
+whenever a game is over.
+
+The script requires:
+    - Built in utility "os" for the clock ticks of the CPU time.
+    - Built in utility "sys" for the Python interpreter.
+    - Built in utility "asyncio" for the clients and the server process.
+    - Built in utility "random" and it's class "Random".
+    - Built in utility "time" and it's method "perf_counter".
+
+Functions:
+    - rss()
+    - cpu_time()
+    - game_process_rss()
+    - client()
+    - main()
+"""
+
+import os
+import sys
+import asyncio
+from random import Random
+from time import perf_counter
+
+
+# Sessions, moves made by every session, and size of the games.
+SESSIONS = 500
+MOVES = 20
+GAME = (10, 10, 10)
+# Seconds a player thinks before a move, for sessions per core.
+THINK_TIME = 2.
+
+
+def rss(pid):
+    """
+    Gets the resident set size of the process.
+
+    :param pid: Process id.
+    :type pid: int
+    :return: Resident set size in bytes.
+    :rtype: int
+    """
+
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+
+    return 0
+
+
+def cpu_time(pid):
+    """
+    Gets the CPU time used by the process.
+
+    :param pid: Process id.
+    :type pid: int
+    :return: User and system CPU time in seconds.
+    :rtype: float
+    """
+
+    with open(f"/proc/{pid}/stat") as stat:
+        # Fields after the process name, which can contain spaces.
+        fields = stat.read().rsplit(")", 1)[1].split()
+
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def game_process_rss():
+    """
+    Gets the resident set size of a game process waiting for input,
+    as the web terminal spawns one per session.
+
+    :return: Resident set size in bytes.
+    :rtype: int
+    """
+
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c",
+        "import sys, modules.minesweeper; print('ready', flush=True);"
+        " sys.stdin.read()",
+        stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE)
+
+    await process.stdout.readline()
+    size = rss(process.pid)
+
+    process.stdin.close()
+    await process.wait()
+
+    return size
+
+
+async def client(port, seed, go, moves):
+    """
+    Plays the session of one client, waiting on the first move until
+    the go event is set.
+
+    :param port: Port of the server.
+    :type port: int
+    :param seed: Seed of the client's moves.
+    :type seed: int
+    :param go: Event the moves start at.
+    :type go: asyncio.Event
+    :param moves: Moves made by the clients, the client's move
+        count is added.
+    :type moves: list
+    """
+
+    rows, cols, _ = GAME
+    rng = Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    made = 0
+
+    while made < MOVES:
+        # Every prompt ends the output of the server's turn.
+        output = await reader.readuntil(b"\r\n\t")
+
+        if b"(y/n)" in output[-40:]:
+            answer = "y"
+        elif b"press enter" in output[-40:]:
+            answer = ""
+        else:
+            await go.wait()
+            answer = f"{rng.randint(1, rows)} {rng.randint(1, cols)}"
+            made += 1
+
+        writer.write(f"{answer}\r\n".encode())
+
+    moves.append(made)
+    writer.close()
+
+
+async def main():
+    """
+    Prints the memory of a session and of a game process, and the moves
+    per CPU second, as sessions per GB and per core.
+    """
+
+    server = await asyncio.create_subprocess_exec(
+        sys.executable, "server.py", "--port", "0",
+        "--rows", str(GAME[0]), "--cols", str(GAME[1]),
+        "--mines", str(GAME[2]), stdout=asyncio.subprocess.PIPE)
+    port = int((await server.stdout.readline()).decode().rsplit(":", 1)[1])
+
+    idle = rss(server.pid)
+    go = asyncio.Event()
+    moves = []
+    clients = [asyncio.create_task(client(port, seed, go, moves))
+               for seed in range(SESSIONS)]
+
+    # Every session waits on the first move once the server is idle.
+    last = None
+    while last != cpu_time(server.pid):
+        last = cpu_time(server.pid)
+        await asyncio.sleep(.5)
+
+    session = (rss(server.pid) - idle) / SESSIONS
+    process = await game_process_rss()
+
+    start_cpu, start = cpu_time(server.pid), perf_counter()
+    go.set()
+    await asyncio.gather(*clients)
+    seconds = perf_counter() - start
+    cpu = cpu_time(server.pid) - start_cpu
+
+    server.terminate()
+    await server.wait()
+
+    played = sum(moves)
+    print(f"game {GAME[0]}x{GAME[1]}/{GAME[2]}, {SESSIONS} sessions")
+    print(f"memory: session {session / 1024:.1f}KB,"
+          f" {2 ** 30 / session:.0f} sessions/GB;"
+          f" game process {process / 2 ** 20:.1f}MB,"
+          f" {2 ** 30 / process:.0f} sessions/GB")
+    print(f"speed: {played} moves in {seconds:.2f}s,"
+          f" {played / cpu:.0f} moves per CPU second,"
+          f" {played / cpu * THINK_TIME:.0f} sessions/core"
+          f" at a move per {THINK_TIME:.0f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
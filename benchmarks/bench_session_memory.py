@@ -0,0 +1,167 @@
+"""
+Session memory benchmark.
+
+Measures the memory held by an idle session of the game server, as
+bytes per session and idle sessions per GB of the server process,
+with and without the compact boards of "--compact".
+
+Sessions are created in this process like the server creates them,
+without connections, and are idle at the first move of their game,
+and after a few certain moves. Memory is traced by "tracemalloc",
+so it's the Python objects of the sessions, without the memory the
+allocator keeps free.
+
+The script requires:
+    - Built in utility "gc" for collecting the garbage before
+        the snapshots.
+    - Built in utility "tracemalloc" for tracing the memory.
+    - "server" module, and it's class "GameSession".
+    - "minesweeper" module from the game package, and it's class
+        "Minesweeper".
+    - "solver" module from the game package, and it's class "Solver".
+    - "probability" module from the game package, and it's class
+        "MineProbability".
+    - "engine" module from the game package, and it's const "PLAYING".
+
+The file contains following classes:
+    - NullWriter
+
+Functions:
+    - idle_session()
+    - session_bytes()
+    - main()
+"""
+
+import gc
+import tracemalloc
+from server import GameSession
+from modules.minesweeper import Minesweeper
+from modules.solver import Solver
+from modules.probability import MineProbability
+from modules.engine import PLAYING
+
+
+# Sessions measured, size of the games and certain moves made.
+SESSIONS = 5000
+GAME = (10, 10, 10)
+MOVES = 5
+
+
+class NullWriter:
+    """
+    NullWriter class is the output of a session without connection.
+
+    Public methods:
+        write()
+        close()
+    """
+
+    __slots__ = ()
+
+    def write(self, data):
+        """
+        Drops the data.
+
+        :param data: Data the session sends.
+        :type data: bytes
+        """
+
+    def close(self):
+        """
+        Does nothing, there is no connection.
+        """
+
+
+def idle_session(compact, moves, seed):
+    """
+    Creates a session waiting for the player's move, as the server
+    leaves it between the player's inputs.
+
+    :param compact: Use compact storage of the boards.
+    :type compact: bool
+    :param moves: Certain moves made before the session is idle.
+    :type moves: int
+    :param seed: Seed of the session's board.
+    :type seed: int
+    :return: Idle session.
+    :rtype: GameSession
+    """
+
+    rows, cols, mines = GAME
+    session = GameSession(None, NullWriter(), rows, cols, mines, (80, 24),
+                          compact=compact)
+
+    game = session.game = Minesweeper(rows, cols, mines, compact,
+                                      out=session, size=session.term_size)
+
+    # Game of the seed, as the session's game would be created.
+    engine = game.engine
+    engine.new_game(rows, cols, mines, seed)
+    engine.pl_board.initial_run = False
+    game.solver = Solver(engine.pl_board)
+    game.probability = MineProbability(game.solver, mines)
+
+    # First move is in the middle, the next ones are solver hints.
+    move = ("display", rows // 2, cols // 2)
+    for _ in range(moves):
+        result = engine.step(*move)
+        if result.state != PLAYING:
+            break
+
+        game.solver.update(result.revealed)
+        move = game.solver.hint()
+        if move is None:
+            break
+
+    game._display_game()
+
+    return session
+
+
+def session_bytes(compact, moves):
+    """
+    Measures the memory of the idle sessions.
+
+    :param compact: Use compact storage of the boards.
+    :type compact: bool
+    :param moves: Certain moves made before the sessions are idle.
+    :type moves: int
+    :return: Bytes per session.
+    :rtype: float
+    """
+
+    # Shared objects, e.g. the board topology, are created first.
+    idle_session(compact, moves, 0)
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    sessions = [idle_session(compact, moves, seed)
+                for seed in range(SESSIONS)]
+    gc.collect()
+
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del sessions
+
+    return used / SESSIONS
+
+
+def main():
+    """
+    Prints the bytes per idle session and idle sessions per GB.
+    """
+
+    print(f"game {GAME[0]}x{GAME[1]}/{GAME[2]}, {SESSIONS} sessions")
+    print(f"{'boards':>10}{'moves':>8}{'bytes':>10}{'sessions/GB':>14}")
+
+    for compact in (False, True):
+        for moves in (0, MOVES):
+            size = session_bytes(compact, moves)
+            print(f"{'compact' if compact else 'lists':>10}{moves:>8}"
+                  f"{size:>10.0f}{2 ** 30 / size:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Snapshot benchmark.
+
+Measures snapshot size, dump time and restore time of games in
+progress, with about half of the safe fields displayed and a tenth
+of the mines flagged.
+
+The script requires:
+    - Built in utility "timeit" for time measurement.
+    - Built in utility "random" and it's class "Random".
+    - "engine" module from the game package, and it's class:
+        - GameEngine.
+    - "snapshot" module from the game package, and it's functions:
+        - dump_snapshot,
+        - restore_snapshot.
+    - "consts" module from the game package and it's const:
+        - MINE.
+
+Functions:
+    - game_in_progress()
+    - bench_snapshot()
+    - main()
+"""
+
+from timeit import repeat
+from random import Random
+from modules.engine import GameEngine
+from modules.snapshot import dump_snapshot, restore_snapshot
+from modules.consts import MINE
+
+
+# Benchmarked games (rows, cols, mines).
+GAMES = [(9, 9, 10), (16, 30, 99), (100, 100, 1500), (300, 300, 13500)]
+
+
+def game_in_progress(rows, cols, mines, compact):
+    """
+    Plays the game until about half of the safe fields are displayed.
+
+    :param rows: Number of board rows.
+    :type rows: int
+    :param cols: Number of board columns.
+    :type cols: int
+    :param mines: Number of mines on the board.
+    :type mines: int
+    :param compact: Use compact storage of the boards.
+    :type compact: bool
+    :return: Engine playing the game.
+    :rtype: GameEngine
+    """
+
+    engine = GameEngine(compact=compact)
+    engine.new_game(rows, cols, mines, seed=0)
+    engine.step("display", rows // 2, cols // 2)
+
+    rng = Random(0)
+    gm_board = engine.gm_board
+    while engine.pl_board.hidden_count > (rows * cols + mines) // 2:
+        row, col = rng.randrange(rows), rng.randrange(cols)
+        if engine.pl_board.is_visible(row, col):
+            continue
+
+        if gm_board.is_field_type(row, col, MINE):
+            if rng.random() < .1:
+                engine.step("flag", row, col)
+        else:
+            engine.step("display", row, col)
+
+    return engine
+
+
+def bench_snapshot(rows, cols, mines, compact):
+    """
+    Measures the snapshot size and best dump and restore times.
+
+    :return: Snapshot size in bytes, dump and restore time in seconds.
+    :rtype: tuple
+    """
+
+    engine = game_in_progress(rows, cols, mines, compact)
+    data = dump_snapshot(engine)
+    restored = GameEngine(compact=compact)
+    runs = 3 if rows * cols > 10000 else 20
+
+    dump = min(repeat(lambda: dump_snapshot(engine), number=1, repeat=runs))
+    restore = min(repeat(lambda: restore_snapshot(data, restored),
+                         number=1, repeat=runs))
+
+    return len(data), dump, restore
+
+
+def main():
+    """
+    Prints snapshot size, dump and restore times for every game size.
+    """
+
+    print(f"{'game':>18}{'storage':>10}{'bytes':>10}"
+          f"{'dump':>12}{'restore':>12}")
+    for rows, cols, mines in GAMES:
+        for compact in (False, True):
+            size, dump, restore = bench_snapshot(rows, cols, mines, compact)
+            print(f"{f'{rows}x{cols}/{mines}':>18}"
+                  f"{'compact' if compact else 'list':>10}{size:>10}"
+                  f"{dump * 1000:>10.2f}ms{restore * 1000:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
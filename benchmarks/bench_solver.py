@@ -0,0 +1,150 @@
+"""
+Solver benchmark.
+
+Measures hint latency on mid-game positions. Positions are recorded
+as snapshots of games played by a hint bot, half way through the
+game. From every position the game is played on, comparing solving
+the whole board before each hint with updating the solver
+incrementally after each move.
+
+The script requires:
+    - Built in utility "time" and it's method "perf_counter".
+    - Built in utility "random" and it's class "Random".
+    - "engine" module from the game package, and it's:
+        - GameEngine class,
+        - PLAYING - state of the game being played.
+    - "snapshot" module from the game package, and it's functions:
+        - dump_snapshot,
+        - restore_snapshot.
+    - "solver" module from the game package, and it's class:
+        - Solver.
+
+Functions:
+    - bot_move()
+    - record_positions()
+    - bench_position()
+    - main()
+"""
+
+from time import perf_counter
+from random import Random
+from modules.engine import GameEngine, PLAYING
+from modules.snapshot import dump_snapshot, restore_snapshot
+from modules.solver import Solver
+
+
+# Benchmarked games (rows, cols, mines) and recorded positions per game.
+GAMES = [(16, 30, 99), (100, 100, 1500), (300, 300, 13500)]
+POSITIONS = 5
+# Moves played from every position.
+MOVES = 50
+
+
+def bot_move(engine, solver, rng):
+    """
+    Gets the hint of the solver, or a random guess if no field
+    is certain.
+
+    :return: Action, row and column of the move.
+    :rtype: tuple
+    """
+
+    hint = solver.hint()
+    if hint is not None:
+        return hint
+
+    while True:
+        row, col = rng.randrange(engine.rows), rng.randrange(engine.cols)
+        if not engine.pl_board.is_visible(row, col) and \
+                row * engine.cols + col not in solver.mines:
+            return "display", row, col
+
+
+def record_positions(rows, cols, mines):
+    """
+    Records the positions half way through the games won or lost
+    by the hint bot.
+
+    :return: Snapshots of the positions.
+    :rtype: list
+    """
+
+    positions = []
+    seed = 0
+
+    while len(positions) < POSITIONS:
+        engine = GameEngine()
+        engine.new_game(rows, cols, mines, seed)
+        solver = Solver(engine.pl_board)
+        rng = Random(seed)
+        seed += 1
+        half_way = (rows * cols - mines) // 2
+
+        while engine.state == PLAYING:
+            if engine.pl_board.hidden_count <= half_way + mines:
+                positions.append(dump_snapshot(engine))
+                break
+
+            result = engine.step(*bot_move(engine, solver, rng))
+            if result.state == PLAYING:
+                solver.update(result.revealed)
+
+    return positions
+
+
+def bench_position(position, incremental):
+    """
+    Plays the moves from the position, solving for a hint
+    before every move.
+
+    :param position: Snapshot of the position.
+    :type position: bytes
+    :param incremental: Update the solver instead of solving
+        the whole board.
+    :type incremental: bool
+    :return: Hint latencies in seconds.
+    :rtype: list
+    """
+
+    engine = GameEngine()
+    restore_snapshot(position, engine)
+    solver = Solver(engine.pl_board)
+    rng = Random(0)
+    latencies = []
+
+    for _ in range(MOVES):
+        result = engine.step(*bot_move(engine, solver, rng))
+        if result.state != PLAYING:
+            break
+
+        start = perf_counter()
+        if incremental:
+            solver.update(result.revealed)
+        else:
+            solver.rebuild()
+        solver.hint()
+        latencies.append(perf_counter() - start)
+
+    return latencies
+
+
+def main():
+    """
+    Prints mean and worst hint latency for every game size.
+    """
+
+    print(f"{'game':>18}{'solve':>14}{'mean':>12}{'max':>12}")
+    for rows, cols, mines in GAMES:
+        positions = record_positions(rows, cols, mines)
+
+        for incremental in (False, True):
+            latencies = [latency for position in positions
+                         for latency in bench_position(position, incremental)]
+            print(f"{f'{rows}x{cols}/{mines}':>18}"
+                  f"{'incremental' if incremental else 'whole board':>14}"
+                  f"{sum(latencies) / len(latencies) * 1000:>10.3f}ms"
+                  f"{max(latencies) * 1000:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Startup benchmark.
+
+Measures the cold start of a game process, as the web terminal spawns
+one per session: the import time of the game, with the slowest imports
+as "python3 -X importtime" reports them, and the time from starting
+the interpreter to the printed banner, with and without the banner
+cached.
+
+Every measurement is a new interpreter, the median of the runs
+is printed.
+
+The script requires:
+    - Built in utility "os" for the environment of the processes.
+    - Built in utility "sys" for the Python interpreter.
+    - Built in utility "subprocess" for starting the processes.
+    - Built in utility "tempfile" for the banner cache directories.
+    - Built in utility "time" and it's method "perf_counter".
+    - Built in utility "statistics" and it's method "median".
+
+Functions:
+    - import_times()
+    - banner_time()
+    - main()
+"""
+
+import os
+import sys
+import subprocess
+import tempfile
+from time import perf_counter
+from statistics import median
+
+
+# Interpreter starts measured, and slowest imports printed.
+RUNS = 10
+SLOWEST = 10
+# Prints the banner as the welcome screen does.
+BANNER = "import run; run.print_banner()"
+
+
+def import_times():
+    """
+    Imports the game in a new interpreter with "-X importtime".
+
+    :return: Cumulative import time of every module in microseconds.
+    :rtype: dict
+    """
+
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import run"],
+        stderr=subprocess.PIPE, text=True, check=True).stderr
+
+    times = {}
+    # Lines are "import time: self [us] | cumulative | imported package".
+    for line in output.splitlines()[1:]:
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+
+    return times
+
+
+def banner_time(cache_dir):
+    """
+    Starts a new interpreter printing the banner.
+
+    :param cache_dir: Directory of the banner cache.
+    :type cache_dir: str
+    :return: Seconds from the start to the exit of the interpreter.
+    :rtype: float
+    """
+
+    env = dict(os.environ, MINESWEEPER_CACHE=cache_dir)
+
+    start = perf_counter()
+    subprocess.run([sys.executable, "-c", BANNER], env=env,
+                   stdout=subprocess.DEVNULL, check=True)
+
+    return perf_counter() - start
+
+
+def main():
+    """
+    Prints the median import time of the game and of it's slowest
+    imports, and the time to the banner with and without the cache.
+    """
+
+    # First run compiles the bytecode of changed modules.
+    import_times()
+    runs = [import_times() for _ in range(RUNS)]
+    times = {module: median(run.get(module, 0) for run in runs)
+             for module in runs[0]}
+
+    print(f"import run: {times['run'] / 1000:.1f}ms,"
+          f" median of {RUNS} interpreters")
+    for module, micros in sorted(times.items(), key=lambda item: item[1],
+                                 reverse=True)[1:SLOWEST + 1]:
+        print(f"{module:>40} {micros / 1000:8.1f}ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Empty cache directory for every run renders the banner.
+        cold = median(banner_time(os.path.join(directory, str(run)))
+                      for run in range(RUNS))
+        cached = median(banner_time(os.path.join(directory, "0"))
+                        for _ in range(RUNS))
+
+    print(f"start to banner: {cold * 1000:.1f}ms rendered,"
+          f" {cached * 1000:.1f}ms cached")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 const Pty = require('node-pty');
 const fs = require('fs');
+const net = require('net');
 
 exports.install = function () {
 
@@ -15,14 +16,27 @@ function socket() {
 
     this.on('open', function (client) {
 
-        // Spawn terminal
-        client.tty = Pty.spawn('python3', ['run.py'], {
-            name: 'xterm-color',
-            cols: 80,
-            rows: 24,
-            cwd: process.env.PWD,
-            env: process.env
-        });
+        // Games are saved under the session key of the browser tab,
+        // so a reconnect resumes the game.
+        var args = ['run.py'];
+        var session = client.query.session;
+        if (session && /^[A-Za-z0-9_-]{1,64}$/.test(session)) {
+            args.push('--session', session);
+        }
+
+        // Warm worker of the pre-fork supervisor if it's running,
+        // otherwise spawn terminal
+        if (process.env.PREFORK_SOCKET) {
+            client.tty = prefork(process.env.PREFORK_SOCKET, args.slice(1));
+        } else {
+            client.tty = Pty.spawn('python3', args, {
+                name: 'xterm-color',
+                cols: 80,
+                rows: 24,
+                cwd: process.env.PWD,
+                env: process.env
+            });
+        }
 
         client.tty.on('exit', function (code, signal) {
             client.tty = null;
@@ -49,6 +63,32 @@ function socket() {
     });
 }
 
+// Connects to the pre-fork supervisor (prefork.py) for a game,
+// the connection is the game's terminal.
+function prefork(path, args) {
+
+    var conn = net.createConnection(path);
+    conn.setEncoding('utf8');
+    conn.write(JSON.stringify({
+        cmd: 'play',
+        args: args,
+        cols: 80,
+        lines: 24
+    }) + '\n');
+
+    conn.on('error', function (err) {
+        console.log('Pre-fork supervisor error: ', err);
+    });
+    conn.on('close', function () {
+        conn.emit('exit');
+    });
+    conn.kill = function () {
+        conn.destroy();
+    };
+
+    return conn;
+}
+
 if (process.env.CREDS != null) {
     console.log("Creating creds.json file.");
     fs.writeFile('creds.json', process.env.CREDS, 'utf8', function (err) {
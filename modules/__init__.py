@@ -5,10 +5,25 @@ Game package represents the game Minesweeper.
 
 Game package includes following modules:
     - minesweeper - a game in question.
+    - engine - rules of the game, played without I/O.
+    - replay - recorded games and their replay.
+    - snapshot - saved games, suspended and resumed by session.
+    - solver - certain safe fields and mines for hints.
+    - probability - mine chance of every hidden field.
     - board - minesweeper's board.
+    - board_pool - boards pregenerated in the background.
+    - no_guess - boards cleared without guessing.
     - player_action - player input action.
     - consts - constants used in package.
     - user alert - handles user alerts.
+    - grid - compact storage of the boards.
+    - topology - adjacent fields of every board size.
+    - renderer - draws the game on the terminal.
+    - banner - ASCII art banner of the screens, rendered once.
+    - leaderboard - scores of the finished games, written in batches.
+    - leaderboard_backends - SQLite and Google Sheets storage of the
+        scores, imported only with a leaderboard.
+    - database - Google Sheets database, connected on the first use.
 
 Game modules use following built in utilities:
     - random
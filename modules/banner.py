@@ -0,0 +1,171 @@
+"""
+Banner.
+
+Banner module represents the ASCII art banner of the screens and is
+in charge of rendering it once.
+
+Banner functionalities include:
+    - rendering the banner with "art", imported only when a banner
+        isn't cached yet,
+    - caching the rendered banner in memory and in a file, so later
+        screens and processes print it without "art".
+
+Cache files are named after the text, font and the installed "art"
+version, found without importing it, so upgrading "art" renders
+the banner again. Files are replaced atomically, and a cache that
+can't be written only costs rendering the banner again.
+
+The script requires:
+    - Built in utility "os" for the cache files.
+    - Built in utility "zlib" and it's function "crc32" for the cache
+        file names.
+    - Built in utility "importlib.util" and it's function "find_spec"
+        for finding "art" without importing it.
+    - Third party library "art" and it's function "text2art" for
+        rendering the banner, unless it's cached.
+
+Functions:
+    - banner()
+    - print_banner()
+"""
+
+import os
+from zlib import crc32
+from importlib.util import find_spec
+
+
+# Banner of the screens.
+TEXT = " " * 3 + "MINESWEEPER"
+FONT = "avatar"
+# Directory of the cached banners.
+CACHE_DIR = os.environ.get("MINESWEEPER_CACHE", "cache")
+
+# Rendered banners of this process, keyed by the text and font.
+_banners = {}
+
+
+def banner(text=TEXT, font=FONT, cache_dir=CACHE_DIR):
+    """
+    Gets the rendered banner, from the memory, the cache file or
+    rendered by "art" and cached.
+
+    :param text: Text of the banner.
+    :type text: str
+    :param font: "art" font of the banner.
+    :type font: str
+    :param cache_dir: Directory of the cache files, no file cache
+        if None.
+    :type cache_dir: str/None
+    :raises ImportError: Banner isn't cached and "art" isn't installed.
+    :return: Rendered banner.
+    :rtype: str
+    """
+
+    if (text, font) in _banners:
+        return _banners[(text, font)]
+
+    path = _cache_path(text, font, cache_dir)
+    rendered = _read(path) if path else None
+
+    if rendered is None:
+        from art import text2art
+
+        rendered = text2art(text, font=font)
+        if path:
+            _write(path, rendered)
+
+    _banners[(text, font)] = rendered
+
+    return rendered
+
+
+def print_banner(text=TEXT, font=FONT, cache_dir=CACHE_DIR):
+    """
+    Prints the rendered banner, as "art" function "tprint" does.
+
+    :param text: Text of the banner.
+    :type text: str
+    :param font: "art" font of the banner.
+    :type font: str
+    :param cache_dir: Directory of the cache files, no file cache
+        if None.
+    :type cache_dir: str/None
+    """
+
+    print(banner(text, font, cache_dir))
+
+
+def _cache_path(text, font, cache_dir):
+    """
+    Gets the cache file of the banner for the installed "art".
+
+    :param text: Text of the banner.
+    :type text: str
+    :param font: "art" font of the banner.
+    :type font: str
+    :param cache_dir: Directory of the cache files.
+    :type cache_dir: str/None
+    :return: Path of the cache file, None if there is no file cache
+        or "art" isn't installed.
+    :rtype: str/None
+    """
+
+    if cache_dir is None:
+        return None
+
+    spec = find_spec("art")
+    if spec is None or spec.origin is None:
+        return None
+
+    try:
+        # Installed "art" is told apart by it's package file.
+        stat = os.stat(spec.origin)
+    except OSError:
+        return None
+
+    key = crc32(f"{text}\0{font}\0{spec.origin}\0{stat.st_mtime_ns}"
+                f"\0{stat.st_size}".encode())
+
+    return os.path.join(cache_dir, f"banner-{key:08x}.txt")
+
+
+def _read(path):
+    """
+    Reads the cached banner.
+
+    :param path: Path of the cache file.
+    :type path: str
+    :return: Rendered banner, None if it isn't cached.
+    :rtype: str/None
+    """
+
+    try:
+        with open(path, encoding="utf-8") as cache_file:
+            return cache_file.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _write(path, rendered):
+    """
+    Writes the rendered banner to the cache file.
+
+    :param path: Path of the cache file.
+    :type path: str
+    :param rendered: Rendered banner.
+    :type rendered: str
+    """
+
+    # Temporary file of this process, processes can cache at once.
+    temp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as cache_file:
+            cache_file.write(rendered)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
@@ -11,9 +11,12 @@ Board functionalities include:
     - displaying the board.
 
 The script requires:
-    - Built in utility "random" and it's method "randint"
-        for generation of random numbers,
+    - Built in utility "random" and it's class "Random"
+        for seedable sampling of the mine fields,
     - Built in utility "time" and it's method "sleep" for delay,
+    - Built in utility "sys" for writing the board in one write,
+    - Built in utility "array" and it's class "array" for compact
+        storage of the mine field indexes,
     - "consts" module from same directory and it's consts:
         - HIDDEN - represents hidden value of the field.
         - MINE - represents mine value of the field.
@@ -21,29 +24,111 @@ The script requires:
             Meaning there are no mines nearby to the field.
         - FLAG - represents flag value of the field.
         - OFFSETS - formula for getting adjacent fields.
+    - "topology" module from same directory and it's function:
+        - get_topology - adjacent fields shared by boards of one size.
+    - "grid" module from same directory and it's classes:
+        - FieldGrid - compact storage of the game board.
+        - PlayerGrid - compact storage of the player board.
+        - EMPTY_CODE - compact storage code of the empty value.
+        - MINE_CODE - compact storage code of the mine value.
+
+The script optionally uses:
+    - Third party library "numpy" for the vectorized "numpy" board
+        engine. Without it only the default "python" engine is available.
+        It's imported once the engine is selected, as it takes longer
+        to import than the rest of the game.
 
 The file contains following classes:
     - Board
+    - RegionIndex
     - GameBoard(Board)
     - PlayerBoard(Board)
+
+Functions:
+    - load_numpy()
 """
 
-from random import randint
+from random import Random
+from array import array
 from time import sleep
+import sys
 from modules.consts import HIDDEN, MINE, EMPTY, OFFSETS, FLAG
+from modules.grid import FieldGrid, PlayerGrid, EMPTY_CODE, MINE_CODE
+from modules.topology import get_topology
+
+# numpy module, set by load_numpy().
+np = None
+
+
+# Available GameBoard engines.
+ENGINES = ("python", "numpy")
+
+# Typecode of the flat field index arrays, 4 bytes per index.
+INDEX = 'i'
+
+
+def load_numpy():
+    """
+    Imports numpy on the first call.
+
+    :return: numpy module or None if it is not installed.
+    :rtype: module/None
+    """
+
+    global np
+
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+
+        np = numpy
+
+    return np
+
+
+# Printed value of every board field value.
+GLYPHS = {
+    HIDDEN: f'\033[39;2m{HIDDEN}\033[0m',
+    EMPTY: f'\033[39;2m{EMPTY}\033[0m',
+    FLAG: f'\033[33;1m{FLAG}\033[0m',
+    MINE: f'\033[30;41;1m{MINE}\033[0m',
+    1: '\033[34;1m1\033[0m',
+    2: '\033[32;1m2\033[0m',
+    3: '\033[31;1m3\033[0m',
+    4: '\033[35;1m4\033[0m',
+    5: '\033[33;1m5\033[0m',
+    6: '\033[36;1m6\033[0m',
+    7: '\033[37;1m7\033[0m',
+    8: '\033[31;1m8\033[0m'
+}
+
+# Printed value followed by the field separator.
+GLYPH_CELLS = {value: f'{glyph}  ' for value, glyph in GLYPHS.items()}
 
 
 class Board:
     """
     Board class with purpose of creating and structuring board objects.
 
+    The board is a list of lists of field values, or in compact mode
+    a grid storing the fields as small integer codes and bits.
+
     Public methods:
         display()
+        col_indicators()
+        row_indicator()
+        row_to_print()
+        fields_to_print()
         num_of_fields()
         is_field_type()
     """
 
-    def __init__(self, rows, cols):
+    __slots__ = ("rows", "cols", "compact", "topology", "board",
+                 "initial_run", "indicator_width", "cell_width", "glyph_cells")
+
+    def __init__(self, rows, cols, compact=False):
         """
         Constructor method.
 
@@ -51,33 +136,121 @@ class Board:
         :type rows: int
         :param cols: Number of Board grid columns.
         :type cols: int
+        :param compact: Use compact storage of the board.
+        :type compact: bool
         """
 
         self.rows = rows
         self.cols = cols
+        self.compact = compact
+        self.topology = get_topology(rows, cols)
         self.board = self._create()
 
         self.initial_run = True
 
+        # Layout, indicators grow with the number of digits.
+        self.indicator_width = max(2, len(str(rows))) + 3
+        self.cell_width = max(3, len(str(cols)) + 1)
+        self.glyph_cells = GLYPH_CELLS if self.cell_width == 3 else \
+            {value: glyph + ' ' * (self.cell_width - 1)
+             for value, glyph in GLYPHS.items()}
+
     def display(self):
         """
         Displays the board on the screen.
+        The whole board is written at once, apart from the initial
+        run, when rows appear one by one.
         """
 
-        self._display_col_indicators(self.cols)
-        for row in range(self.rows):
-            if self.initial_run:
+        lines = [self.col_indicators()]
+        lines += [self.row_to_print(row) for row in range(self.rows)]
+
+        if self.initial_run:
+            sys.stdout.write(lines[0])
+            for line in lines[1:]:
                 sleep(.05)
+                sys.stdout.write(line)
+                sys.stdout.flush()
+        else:
+            sys.stdout.write(''.join(lines))
+            sys.stdout.flush()
 
-            self._display_row_indicators(row+1)
-            for col in range(self.cols):
-                # Prints the value of the board field.
-                statement = self._value_to_print(self.board[row][col])
-                print(statement, end='  ')
+        self.initial_run = False
 
-            print()
+    def col_indicators(self, left=0, width=None):
+        """
+        Gets column indicators displayed on top of the board.
 
-        self.initial_run = False
+        :param left: First displayed column.
+        :type left: int
+        :param width: Number of displayed columns, all if None.
+        :type width: int/None
+        :return: Two lines of column indicators.
+        :rtype: str
+        """
+
+        if width is None:
+            width = self.cols - left
+
+        numbers = ''.join(f'{i:<{self.cell_width}}'
+                          for i in range(left+1, left+width+1))
+        underline = '_' * self.cell_width * width
+
+        return (f"{' ' * self.indicator_width}{numbers}\n"
+                f"{' ' * (self.indicator_width - 1)}{underline}\n")
+
+    def row_indicator(self, row):
+        """
+        Gets row indicator displayed to the left side of the board.
+
+        :param row: Current board row.
+        :type row: int
+        :return: Row indicator.
+        :rtype: str
+        """
+
+        return f'{row:<{self.indicator_width - 3}} | '
+
+    def row_to_print(self, row, left=0, width=None):
+        """
+        Gets the board row to print, with it's row indicator.
+
+        :param row: Current row of the grid.
+        :type row: int
+        :param left: First displayed column.
+        :type left: int
+        :param width: Number of displayed columns, all if None.
+        :type width: int/None
+        :return: Printed row ending with a new line.
+        :rtype: str
+        """
+
+        fields = self.board[row] if left == 0 and width is None else \
+            self.board[row][left:None if width is None else left+width]
+
+        return (self.row_indicator(row+1) +
+                ''.join(map(self.glyph_cells.__getitem__, fields)) +
+                '\n')
+
+    def fields_to_print(self, row, left=0, width=None):
+        """
+        Gets the printed values of the board row fields.
+
+        :param row: Current row of the grid.
+        :type row: int
+        :param left: First displayed column.
+        :type left: int
+        :param width: Number of displayed columns, all if None.
+        :type width: int/None
+        :return: Printed values.
+        :rtype: tuple
+        """
+
+        fields = self.board[row] if left == 0 and width is None else \
+            self.board[row][left:None if width is None else left+width]
+
+        # Renderers keep the last frame, tuples are smaller than lists.
+        return tuple(map(GLYPHS.__getitem__, fields))
 
     def num_of_fields(self, field_type):
         """
@@ -116,66 +289,169 @@ class Board:
         Constructs the board using const HIDDEN for every field.
         """
 
+        if self.compact:
+            return FieldGrid(self.rows, self.cols)
+
         return [[HIDDEN for _ in range(self.cols)]
                 for _ in range(self.rows)]
 
-    def _display_row_indicators(self, row):
+
+class RegionIndex:
+    """
+    RegionIndex class labels connected EMPTY fields of a game board.
+    Each region holds it's EMPTY fields and their numbered border
+    fields, which is exactly what displaying any of it's EMPTY fields
+    reveals.
+
+    Public methods:
+        build()
+        update()
+        region()
+    """
+
+    __slots__ = ("region_of", "regions")
+
+    def __init__(self):
+        """
+        Constructor method.
         """
-        Displays row indicator to the left side of the board.
 
-        :param row: Current board row.
-        :type row: int
+        # Region of every flat field index, -1 if the field is not EMPTY.
+        self.region_of = array(INDEX)
+        # Flat field indexes of every region.
+        self.regions = []
+
+    def build(self, board):
         """
+        Labels the regions of the board, replacing any previous labels.
 
-        if row > 9:
-            print(row, end=' | ')
-        else:
-            print(row, end='  | ')
+        :param board: Board with placed values.
+        :type board: Board
+        """
+
+        size = board.rows * board.cols
+        empty = self._empty_fields(board)
+
+        self.region_of = array(INDEX, [-1]) * size
+        self.regions = []
+        # Last region the border field was added to.
+        border_of = array(INDEX, [-1]) * size
+
+        for start in range(size):
+            if self.region_of[start] == -1 and empty[start]:
+                self._label(board, start, empty, border_of)
 
-    def _display_col_indicators(self, col):
+    def update(self, board, fields):
         """
-        Displays column indicators on top of the board.
+        Labels again only the regions around the fields whose values
+        changed. Labels of the other regions stay valid.
 
-        :param cols: Board column count.
-        :type cols: int
+        :param board: Board with placed values.
+        :type board: Board
+        :param fields: Flat indexes of the changed fields.
+        :type fields: set
         """
 
-        print('   ', end='  ')
-        for i in range(1, col+1):
-            print(i, end='  ')
+        empty = self._empty_fields(board)
+        border_of = array(INDEX, [-1]) * (board.rows * board.cols)
+
+        # Regions the changed fields were EMPTY fields or borders of.
+        region_ids = set()
+        for field in fields:
+            for neighbour in (field, *board.topology.adjacent_fields(field)):
+                if self.region_of[neighbour] != -1:
+                    region_ids.add(self.region_of[neighbour])
+
+        starts = list(fields)
+        for region_id in region_ids:
+            for field in self.regions[region_id]:
+                if self.region_of[field] == region_id:
+                    self.region_of[field] = -1
+                    starts.append(field)
 
-        print('\n  ', end='  ')
-        for i in range(col):
-            print('_', end='__')
+            # Left empty, so the ids of the other regions don't change.
+            self.regions[region_id] = array(INDEX)
 
-        print()
+        for start in starts:
+            if self.region_of[start] == -1 and empty[start]:
+                self._label(board, start, empty, border_of)
 
-    def _value_to_print(self, field):
+    def region(self, field):
         """
-        Gets the value to print.
+        Gets the region of the field.
 
-        :param field: Selected field.
-        :type field: list
-        :return: Value to print.
-        :rtype: str
+        :param field: Flat field index (row * cols + col).
+        :type field: int
+        :return: Flat field indexes of the region, None if the
+            field is not EMPTY.
+        :rtype: array/None
         """
 
-        board_values = {
-            HIDDEN: f'\033[39;2m{field}\033[0m',
-            EMPTY: f'\033[39;2m{field}\033[0m',
-            FLAG: f'\033[33;1m{field}\033[0m',
-            MINE: f'\033[30;41;1m{field}\033[0m',
-            1: f'\033[34;1m{field}\033[0m',
-            2: f'\033[32;1m{field}\033[0m',
-            3: f'\033[31;1m{field}\033[0m',
-            4: f'\033[35;1m{field}\033[0m',
-            5: f'\033[33;1m{field}\033[0m',
-            6: f'\033[36;1m{field}\033[0m',
-            7: f'\033[37;1m{field}\033[0m',
-            8: f'\033[31;1m{field}\033[0m'
-        }
+        region_id = self.region_of[field]
+        if region_id == -1:
+            return None
+
+        return self.regions[region_id]
+
+    def _empty_fields(self, board):
+        """
+        Gets flat EMPTY flags, read without indexing the board rows.
+
+        :param board: Board with placed values.
+        :type board: Board
+        :return: True for every EMPTY field.
+        :rtype: list
+        """
+
+        if board.compact:
+            return [code == EMPTY_CODE for code in board.board.cells]
+
+        return [value == EMPTY for row in board.board for value in row]
+
+    def _label(self, board, start, empty, border_of):
+        """
+        Labels the new region of the EMPTY field.
+
+        :param board: Board with placed values.
+        :type board: Board
+        :param start: Flat index of the EMPTY field.
+        :type start: int
+        :param empty: Flat EMPTY flags of the board.
+        :type empty: list
+        :param border_of: Last region every border field
+            was added to.
+        :type border_of: array
+        """
+
+        cols = board.cols
+        offsets = board.topology.offsets
+
+        region_id = len(self.regions)
+        self.region_of[start] = region_id
+        region = array(INDEX, [start])
+        stack = [divmod(start, cols)]
+
+        while stack:
+            field = stack.pop()
+
+            for offset in offsets(field[0], field[1]):
+                offset_row = offset[0] + field[0]
+                offset_col = offset[1] + field[1]
+
+                neighbour = offset_row * cols + offset_col
+                if self.region_of[neighbour] == region_id or \
+                        border_of[neighbour] == region_id:
+                    continue
+
+                if empty[neighbour]:
+                    self.region_of[neighbour] = region_id
+                    stack.append((offset_row, offset_col))
+                else:
+                    border_of[neighbour] = region_id
+
+                region.append(neighbour)
 
-        return board_values[field]
+        self.regions.append(region)
 
 
 class GameBoard(Board):
@@ -183,9 +459,33 @@ class GameBoard(Board):
     GameBoard class which inherits the Board class, it is a Board object
     of the GameBoard type.
     Adds additional functionality specific to GameBoard.
+
+    The board values can be computed by one of the ENGINES:
+        - "python" - checks the neighbours of every field in turn.
+        - "numpy" - keeps the mines in an uint8 grid and computes
+            every value in one vectorized pass. Requires numpy.
+
+    A deferred board stays HIDDEN until generate() is called with the
+    first selected field, which is kept free of mines together with
+    it's adjacent fields, or until load() is called with known
+    mine fields. A deferred board can be pregenerated ahead of the
+    first selected field, generate() then only moves the mines away
+    from it.
+
+    An indexed board labels it's EMPTY regions in region_index
+    once generated, so displaying them needs no search.
+
+    Public methods:
+        pregenerate()
+        generate()
+        load()
     """
 
-    def __init__(self, rows, cols, mines):
+    __slots__ = ("mines", "engine", "seed", "mine_fields", "mine_grid",
+                 "generated", "pregenerated", "region_index")
+
+    def __init__(self, rows, cols, mines, engine="python", seed=None,
+                 compact=False, deferred=False, index_regions=False):
         """
         Constructor method.
 
@@ -195,32 +495,198 @@ class GameBoard(Board):
         :type cols: int
         :param mines: Number of Minesweeper mines on the board.
         :type mines: int
+        :param engine: Engine used for computing the board values.
+        :type engine: str
+        :param seed: Seed for the mine placement, random if None.
+        :type seed: int/None
+        :param compact: Use compact storage of the board.
+        :type compact: bool
+        :param deferred: Postpone the generation until generate() call.
+        :type deferred: bool
+        :param index_regions: Label EMPTY regions once generated.
+        :type index_regions: bool
+        :raises ValueError: Unknown engine.
+        :raises ImportError: numpy engine selected without numpy.
         """
 
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown board engine: {engine}")
+        if engine == "numpy" and load_numpy() is None:
+            raise ImportError("The numpy board engine requires numpy.")
+
         self.mines = mines
-        super().__init__(rows, cols)
+        self.engine = engine
+        self.seed = seed
+        # Flat indexes (row * cols + col) of the mine fields.
+        self.mine_fields = array(INDEX)
+        # Mines as uint8 grid, set by the numpy engine.
+        self.mine_grid = None
+        self.generated = False
+        # Mines and values placed before the first selected field.
+        self.pregenerated = False
+        # EMPTY regions, filled in place once generated.
+        self.region_index = RegionIndex() if index_regions else None
+        super().__init__(rows, cols, compact)
 
         # Set up.
+        if not deferred:
+            self._place_mines()
+            self._place_values()
+            self._index_regions()
+            self.generated = True
+
+    def pregenerate(self):
+        """
+        Places the mines and values of the deferred board ahead of
+        the first selected field, e.g. in the background. The board
+        is generated once generate() is called with the field.
+        """
+
         self._place_mines()
-        self._place_values()
+        self._complete()
+        self.generated = False
+        self.pregenerated = True
+
+    def generate(self, row, col):
+        """
+        Generates the deferred board. Mines are placed away from
+        the selected field and it's adjacent fields, if there are
+        too many mines only the selected field is kept free.
+        Mines of a pregenerated board are moved away instead.
 
-    def _place_mines(self):
+        :param row: Selected field row of the grid.
+        :type row: int
+        :param col: Selected field column of the grid.
+        :type col: int
+        """
+
+        field = row * self.cols + col
+        safe_fields = [field, *self.topology.adjacent_fields(field)]
+
+        if self.rows * self.cols - len(safe_fields) < self.mines:
+            safe_fields = safe_fields[:1]
+
+        if self.pregenerated:
+            self._move_mines(safe_fields)
+            self.generated = True
+            return
+
+        self._place_mines(safe_fields)
+        self._complete()
+
+    def load(self, mine_fields):
+        """
+        Generates the deferred board with the given mine fields,
+        e.g. the mine fields of a recorded game.
+
+        :param mine_fields: Flat indexes (row * cols + col)
+            of the mine fields.
+        :type mine_fields: list
+        """
+
+        self.mine_fields = array(INDEX, mine_fields)
+        self.mines = len(self.mine_fields)
+        self._mark_mines()
+        self._complete()
+
+    def _complete(self):
+        """
+        Completes the generation once the mines are placed.
+        """
+
+        if self.engine == "numpy":
+            self._place_values_vectorized()
+        else:
+            self._place_values_around_mines()
+
+        self._index_regions()
+        self.generated = True
+
+    def _place_mines(self, safe_fields=()):
         """
         Places mines on the game board.
+
+        Mine fields are sampled without replacement, so the placement
+        takes the same time regardless of the mine density.
+
+        :param safe_fields: Flat indexes of the fields to keep free.
+        :type safe_fields: list
         """
 
-        mine_count = 1
-        while mine_count <= self.mines:
-            # 0 <= field <= (rows x cols)
-            field = randint(0, (self.rows * self.cols)-1)
-            row = field // self.cols
-            col = field % self.cols
+        safe_fields = sorted(safe_fields)
 
-            if self.is_field_type(row, col, MINE):
-                continue
+        # 0 <= field < (rows x cols - safe fields)
+        self.mine_fields = array(INDEX, Random(self.seed).sample(
+            range(self.rows * self.cols - len(safe_fields)), self.mines
+            ))
 
+        # Shift the sampled fields past the safe fields.
+        if safe_fields:
+            for i, field in enumerate(self.mine_fields):
+                for safe_field in safe_fields:
+                    if field < safe_field:
+                        break
+                    field += 1
+                self.mine_fields[i] = field
+
+        self._mark_mines()
+
+    def _move_mines(self, safe_fields):
+        """
+        Moves the mines of the pregenerated board from the safe
+        fields to random fields, and updates the values around them.
+
+        :param safe_fields: Flat indexes of the fields to keep free.
+        :type safe_fields: list
+        """
+
+        safe_fields = set(safe_fields)
+        moved = {field: i for i, field in enumerate(self.mine_fields)
+                 if field in safe_fields}
+        if not moved:
+            return
+
+        rng = Random(self.seed)
+        changed = set()
+
+        for field, i in moved.items():
+            # Free fields are at least as many as the moved mines.
+            while True:
+                target = rng.randrange(self.rows * self.cols)
+                target_row, target_col = divmod(target, self.cols)
+                if target not in safe_fields and \
+                        self.board[target_row][target_col] != MINE:
+                    break
+
+            row, col = divmod(field, self.cols)
+            self.board[row][col] = EMPTY
+            self.board[target_row][target_col] = MINE
+            self.mine_fields[i] = target
+
+            if self.mine_grid is not None:
+                self.mine_grid[row, col] = 0
+                self.mine_grid[target_row, target_col] = 1
+
+            for changed_field in (field, target):
+                changed.add(changed_field)
+                changed.update(self.topology.adjacent_fields(changed_field))
+
+        for field in changed:
+            row, col = divmod(field, self.cols)
+            if self.board[row][col] != MINE:
+                self.board[row][col] = self._get_value(row, col)
+
+        if self.region_index is not None:
+            self.region_index.update(self, changed)
+
+    def _mark_mines(self):
+        """
+        Sets the MINE value of the mine fields.
+        """
+
+        for field in self.mine_fields:
+            row, col = divmod(field, self.cols)
             self.board[row][col] = MINE
-            mine_count += 1
 
     def _place_values(self):
         """
@@ -228,6 +694,10 @@ class GameBoard(Board):
         The values indicate the number of nearby mines.
         """
 
+        if self.engine == "numpy":
+            self._place_values_vectorized()
+            return
+
         for row in range(self.rows):
             for col in range(self.cols):
                 # If field value is not MINE assign a value.
@@ -236,6 +706,85 @@ class GameBoard(Board):
 
                 self.board[row][col] = self._get_value(row, col)
 
+    def _index_regions(self):
+        """
+        Labels EMPTY regions of the board if it is indexed.
+        """
+
+        if self.region_index is not None:
+            self.region_index.build(self)
+
+    def _place_values_around_mines(self):
+        """
+        Places values on the game board by counting only
+        from the mines; every field starts EMPTY and the fields
+        adjacent to a mine get their count increased.
+        Compact board counts in it's cells, the codes of the values
+        are equal to the counts.
+        """
+
+        if self.compact:
+            cells = self.board.cells
+            cells[:] = bytes([EMPTY_CODE]) * len(cells)
+
+            for field in self.mine_fields:
+                cells[field] = MINE_CODE
+
+            for field in self.mine_fields:
+                for neighbour in self.topology.adjacent_fields(field):
+                    if cells[neighbour] != MINE_CODE:
+                        cells[neighbour] += 1
+
+            return
+
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if self.board[row][col] != MINE:
+                    self.board[row][col] = EMPTY
+
+        for field in self.mine_fields:
+            row, col = divmod(field, self.cols)
+
+            for offset_row, offset_col in self.topology.adjacent(row, col):
+                value = self.board[offset_row][offset_col]
+                if value == EMPTY:
+                    self.board[offset_row][offset_col] = 1
+                elif value != MINE:
+                    self.board[offset_row][offset_col] = value + 1
+
+    def _place_values_vectorized(self):
+        """
+        Places values on the game board in one vectorized pass.
+        Every value is the 3x3 sum of the zero padded mine grid
+        around the field.
+        """
+
+        mine_grid = np.zeros(self.rows * self.cols, dtype=np.uint8)
+        mine_grid[self.mine_fields] = 1
+        mine_grid = mine_grid.reshape(self.rows, self.cols)
+
+        padded = np.pad(mine_grid, 1)
+        counts = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        for offset_row, offset_col in OFFSETS:
+            counts += padded[1 + offset_row:1 + offset_row + self.rows,
+                             1 + offset_col:1 + offset_col + self.cols]
+
+        self.mine_grid = mine_grid
+
+        if self.compact:
+            # Grid codes of the values are equal to the counts.
+            counts[mine_grid == 1] = MINE_CODE
+            self.board.cells[:] = counts.tobytes()
+            return
+
+        # Translate counts to the board values.
+        values = np.array([EMPTY, 1, 2, 3, 4, 5, 6, 7, 8], dtype=object)
+        board = values[counts]
+        board[mine_grid == 1] = MINE
+
+        # Filled in place, PlayerBoard keeps a reference to the board.
+        self.board[:] = board.tolist()
+
     def _get_value(self, row, col):
         """
         Calculates the number of nearby mines to the current field.
@@ -252,14 +801,8 @@ class GameBoard(Board):
         count = 0
 
         # Check each field around current board field.
-        for offset in OFFSETS:
-            offset_row = offset[0] + row
-            offset_col = offset[1] + col
-
-            # Make sure the field is inside of the board and is a MINE.
-            if (offset_row in range(0, self.rows)) and \
-                    (offset_col in range(0, self.cols)) and \
-                    (self.board[offset_row][offset_col] == MINE):
+        for offset in self.topology.offsets(row, col):
+            if self.board[offset[0] + row][offset[1] + col] == MINE:
                 count += 1
 
         if count == 0:
@@ -274,13 +817,25 @@ class PlayerBoard(Board):
     of the PlayerBoard type.
     Adds additional functionality specific to PlayerBoard.
 
+    Keeps live counters of HIDDEN fields, FLAG fields and correctly
+    flagged mines, so they don't need to be counted on every move.
+    In debug mode counters are checked against the board after
+    every change.
+
     Public methods:
         set_field()
         flag_field()
         is_visible()
+        add_mines()
+        count_mines_flagged()
+        check_counters()
     """
 
-    def __init__(self, rows, cols, gm_board):
+    __slots__ = ("gm_board", "region_index", "debug", "hidden_count",
+                 "flag_count", "mines_flagged")
+
+    def __init__(self, rows, cols, gm_board, compact=False,
+                 region_index=None, debug=False):
         """
         Constructor method.
 
@@ -291,10 +846,24 @@ class PlayerBoard(Board):
         :param gm_board: GameBoard object's board.
             Allows PlayerBoard to look at GameBoard.
         :type gm_board: GameBoard object.
+        :param compact: Use compact storage of the board, requires
+            compact GameBoard object's board.
+        :type compact: bool
+        :param region_index: GameBoard object's region index.
+            Allows displaying EMPTY regions without searching.
+        :type region_index: RegionIndex/None
+        :param debug: Check the counters after every change.
+        :type debug: bool
         """
 
-        super().__init__(rows, cols)
         self.gm_board = gm_board  # GameBoard object.
+        self.region_index = region_index
+        self.debug = debug
+        super().__init__(rows, cols, compact)
+
+        # Counters.
+        self.hidden_count = rows * cols
+        self.flag_count = 0
         self.mines_flagged = 0
 
     def set_field(self, row, col):
@@ -306,13 +875,34 @@ class PlayerBoard(Board):
         :type row: int
         :param col: Current field column of the grid.
         :type col: int
+        :return: Newly revealed fields as (row, col) tuples.
+        :rtype: list
         """
 
+        previous = self.board[row][col]
         self.board[row][col] = self.gm_board[row][col]
+        revealed = [(row, col)]
+
+        if previous == HIDDEN:
+            self.hidden_count -= 1
+        elif previous == FLAG:
+            self.flag_count -= 1
+            self._mine_flagged(self.gm_board[row][col], False)
 
         # If the field is empty, check other fields.
         if self.board[row][col] == EMPTY:
-            self._set_connected_fields(row, col)
+            region_fields = self._set_region_fields(row, col)
+            if region_fields is None:
+                region_fields = self._set_connected_fields(row, col)
+
+            # Connected fields are always HIDDEN before being set.
+            self.hidden_count -= len(region_fields)
+            revealed += region_fields
+
+        if self.debug:
+            self.check_counters()
+
+        return revealed
 
     def flag_field(self, row, col):
         """_summary_
@@ -328,12 +918,19 @@ class PlayerBoard(Board):
         if self.board[row][col] == FLAG:
             self.board[row][col] = HIDDEN
             flag_action = False
+            self.flag_count -= 1
+            self.hidden_count += 1
         elif self.board[row][col] == HIDDEN:
             self.board[row][col] = FLAG
             flag_action = True
+            self.flag_count += 1
+            self.hidden_count -= 1
 
         self._mine_flagged(self.gm_board[row][col], flag_action)
 
+        if self.debug:
+            self.check_counters()
+
     def is_visible(self, row, col):
         """
         Checks if the field is already visible.
@@ -360,46 +957,150 @@ class PlayerBoard(Board):
         for row in range(0, self.rows):
             for col in range(0, self.cols):
                 if self.gm_board[row][col] == MINE:
+                    if self.board[row][col] == HIDDEN:
+                        self.hidden_count -= 1
+                    elif self.board[row][col] == FLAG:
+                        self.flag_count -= 1
+                        self.mines_flagged -= 1
+
                     self.board[row][col] = MINE
 
+        if self.debug:
+            self.check_counters()
+
+    def count_mines_flagged(self):
+        """
+        Counts correct fields being flagged from scratch.
+        Needed when flags were set before the game board was generated.
+        """
+
+        self.mines_flagged = 0
+        if not self.flag_count:
+            return
+
+        for row in range(0, self.rows):
+            for col in range(0, self.cols):
+                if self.board[row][col] == FLAG and \
+                        self.gm_board[row][col] == MINE:
+                    self.mines_flagged += 1
+
+    def check_counters(self):
+        """
+        Checks the counters against a full scan of the board.
+
+        :raises RuntimeError: Counter differs from the board.
+        """
+
+        mines_flagged = self.mines_flagged
+        self.count_mines_flagged()
+
+        counters = {
+            "hidden": (self.hidden_count, self.num_of_fields(HIDDEN)),
+            "flag": (self.flag_count, self.num_of_fields(FLAG)),
+            "mines flagged": (mines_flagged, self.mines_flagged)
+        }
+
+        for name, (counted, scanned) in counters.items():
+            if counted != scanned:
+                raise RuntimeError(f"PlayerBoard {name} counter is "
+                                   f"{counted}, board has {scanned}.")
+
+    def _create(self):
+        """
+        Constructs the board using const HIDDEN for every field.
+        Compact board stores only visibility and flag bits of
+        the game board fields.
+        """
+
+        if self.compact:
+            return PlayerGrid(self.rows, self.cols, self.gm_board)
+
+        return super()._create()
+
     def _set_connected_fields(self, row, col):
         """
         Set action on the connected fields value, until all
         connected EMPTY field values are set.
 
+        Every field is set before it is stacked, so the board itself
+        marks the visited fields and each field is visited once.
+
         :param row: Current field row of the grid.
         :type row: int
         :param col: Current field column of the grid.
         :type col: int
+        :return: Newly revealed fields as (row, col) tuples.
+        :rtype: list
         """
 
         fields = [(row, col)]
+        revealed = []
 
-        while len(fields) > 0:
+        while fields:
             # Field on which the operation takes place.
             field = fields.pop()
 
             # Check each field around current board field.
-            for offset in OFFSETS:
+            for offset in self.topology.offsets(field[0], field[1]):
                 row = offset[0] + field[0]
                 col = offset[1] + field[1]
 
-                # Field must be in range, HIDDEN and game field can't be mine.
-                if (row in range(0, self.rows)) and \
-                        (col in range(0, self.cols)) and \
-                        (self.board[row][col] == HIDDEN) and \
+                # Field must be HIDDEN and game field can't be mine.
+                if (self.board[row][col] == HIDDEN) and \
                         (self.gm_board[row][col] != MINE):
 
                     # Set the field value.
                     self.board[row][col] = \
                             self.gm_board[row][col]
+                    revealed.append((row, col))
 
                     # If the field is EMPTY we need to check
                     # it's adjacent fields too.
-                    if (self.board[row][col] == EMPTY) and \
-                            ((row, col) not in fields):
+                    if self.board[row][col] == EMPTY:
                         fields.append((row, col))
 
+        return revealed
+
+    def _set_region_fields(self, row, col):
+        """
+        Sets the fields of the precomputed EMPTY region of the field.
+
+        The region matches the connected fields only if none of it's
+        EMPTY fields is flagged or was displayed before, otherwise
+        nothing is set and the connected fields need to be searched.
+
+        :param row: Current field row of the grid.
+        :type row: int
+        :param col: Current field column of the grid.
+        :type col: int
+        :return: Newly revealed fields as (row, col) tuples,
+            None if the region can't be used.
+        :rtype: list/None
+        """
+
+        if self.region_index is None or not self.region_index.region_of:
+            return None
+
+        start = row * self.cols + col
+        hidden = []
+
+        for field in self.region_index.region(start):
+            field_row, field_col = divmod(field, self.cols)
+            value = self.board[field_row][field_col]
+
+            if value == HIDDEN:
+                hidden.append((field_row, field_col))
+            elif field != start and \
+                    self.gm_board[field_row][field_col] == EMPTY:
+                # Flagged or already displayed EMPTY field.
+                return None
+
+        for field_row, field_col in hidden:
+            self.board[field_row][field_col] = \
+                self.gm_board[field_row][field_col]
+
+        return hidden
+
     def _mine_flagged(self, gm_board, flag_action):
         """
         Keeps count of correct fields being flagged.
@@ -0,0 +1,178 @@
+"""
+Board pool.
+
+Board pool module represents a factory of game boards and is in charge
+of generating them ahead of the games, so a new game starts without
+waiting for it's board.
+
+Board pool functionalities include:
+    - pregenerating the boards of the presets in the background,
+    - handing out the pregenerated boards,
+    - falling back to a deferred board when none is ready.
+
+Every preset keeps up to "size" boards in a bounded queue. Once a queue
+is down to the watermark, the background thread refills it. The mines
+of a pregenerated board are moved away from the first selected field,
+so the first field is as safe as on a deferred board.
+
+Boards are generated in a thread rather than a process, as the boards
+are large to pass between processes, and the game waits for the
+player's input most of the time, leaving the thread free to generate.
+
+The script requires:
+    - Built in utility "threading" and it's classes "Thread" and "Event"
+        for the background generation.
+    - Built in utility "queue" and it's classes "Queue" and "Empty"
+        for the bounded queues of the boards.
+    - "board" module from the same directory, and it's class:
+        - GameBoard.
+
+The file contains following classes:
+    - BoardPool
+"""
+
+from threading import Thread, Event
+from queue import Queue, Empty
+from modules.board import GameBoard
+
+
+class BoardPool:
+    """
+    BoardPool class pregenerates game boards of the presets
+    in a background thread.
+
+    Public methods:
+        start()
+        get()
+        close()
+    """
+
+    def __init__(self, presets, size=2, watermark=1, compact=False,
+                 board_engine="python"):
+        """
+        Constructor method.
+
+        :param presets: Sizes of the pregenerated boards as
+            (rows, cols, mines) tuples.
+        :type presets: list
+        :param size: Number of boards kept per preset.
+        :type size: int
+        :param watermark: Number of boards of a preset left when
+            it's queue is refilled.
+        :type watermark: int
+        :param compact: Use compact storage of the boards,
+            as the engine using them.
+        :type compact: bool
+        :param board_engine: Engine used for computing the board
+            values, as the engine using them.
+        :type board_engine: str
+        :raises ValueError: Watermark is not below the size.
+        """
+
+        if not 0 <= watermark < size:
+            raise ValueError("Watermark must be at least 0 and below"
+                             f" the size {size}.")
+
+        self.watermark = watermark
+        self.compact = compact
+        self.board_engine = board_engine
+        self.queues = {tuple(preset): Queue(size) for preset in presets}
+
+        # Boards handed out from the queues and generated on request.
+        self.hits = 0
+        self.misses = 0
+
+        self._refill = Event()
+        self._closed = False
+        self._thread = None
+
+    def start(self):
+        """
+        Starts filling the queues in the background.
+        """
+
+        if self._thread is not None:
+            return
+
+        self._thread = Thread(target=self._fill, name="board-pool",
+                              daemon=True)
+        self._thread.start()
+        self._refill.set()
+
+    def get(self, rows, cols, mines):
+        """
+        Gets a pregenerated board of the preset, or a deferred board
+        generated on the first selected field if none is ready.
+
+        :param rows: Number of Minesweeper grid rows.
+        :type rows: int
+        :param cols: Number of Minesweeper grid columns.
+        :type cols: int
+        :param mines: Number of Minesweeper mines in the grid.
+        :type mines: int
+        :return: Board of the game.
+        :rtype: GameBoard
+        """
+
+        queue = self.queues.get((rows, cols, mines))
+
+        if queue is not None:
+            try:
+                board = queue.get_nowait()
+            except Empty:
+                self._refill.set()
+            else:
+                self.hits += 1
+                if queue.qsize() <= self.watermark:
+                    self._refill.set()
+                return board
+
+        self.misses += 1
+
+        return self._board(rows, cols, mines)
+
+    def close(self):
+        """
+        Stops the background thread, once the board being
+        generated is done.
+        """
+
+        self._closed = True
+        self._refill.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _fill(self):
+        """
+        Fills every queue up whenever a refill is requested,
+        until the pool is closed.
+        """
+
+        while True:
+            self._refill.wait()
+            self._refill.clear()
+
+            for preset, queue in self.queues.items():
+                # Only this thread puts boards, a queue that is not
+                # full takes the board without blocking.
+                while not self._closed and not queue.full():
+                    board = self._board(*preset)
+                    board.pregenerate()
+                    queue.put(board)
+
+            if self._closed:
+                return
+
+    def _board(self, rows, cols, mines):
+        """
+        Creates a deferred board.
+
+        :return: Deferred board with indexed regions.
+        :rtype: GameBoard
+        """
+
+        return GameBoard(rows, cols, mines, self.board_engine,
+                         compact=self.compact, deferred=True,
+                         index_regions=True)
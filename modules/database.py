@@ -3,13 +3,23 @@ Database
 
 Database set up.
 
-Connects to database.
-
-Important for version 2.
+Connects to the Google Sheets database on the first use, so importing
+the module needs neither the credentials nor the network, and the
+game doesn't wait for the connection to start.
+
+The script requires:
+    - Built in utility "threading" and it's class "Lock" for connecting
+        once from many threads.
+    - Third party library "gspread" for the Google Sheets API,
+        imported on the first use.
+    - Third party library "google-auth" and it's class "Credentials"
+        for the service account, imported on the first use.
+
+Functions:
+    - sheet()
 """
 
-import gspread
-from google.oauth2.service_account import Credentials
+from threading import Lock
 
 
 # Set up database
@@ -17,9 +27,32 @@ SCOPE = ["https://www.googleapis.com/auth/spreadsheets",
          "https://www.googleapis.com/auth/drive.file",
          "https://www.googleapis.com/auth/drive"]
 
-CREDS = Credentials.from_service_account_file("creds.json")
-SCOPED_CREDS = CREDS.with_scopes(SCOPE)
-GSPREAD_CLIENT = gspread.authorize(SCOPED_CREDS)
-SHEET = GSPREAD_CLIENT.open("minesweeper-db")
+CREDS_FILE = "creds.json"
+SHEET_NAME = "minesweeper-db"
+
+# Spreadsheet, opened by sheet().
+_sheet = None
+_lock = Lock()
+
+
+def sheet():
+    """
+    Gets the spreadsheet of the database, connecting on the first call.
+
+    :raises ImportError: "gspread" or "google-auth" isn't installed.
+    :return: Spreadsheet of the database.
+    :rtype: gspread.Spreadsheet
+    """
+
+    global _sheet
+
+    with _lock:
+        if _sheet is None:
+            import gspread
+            from google.oauth2.service_account import Credentials
+
+            creds = Credentials.from_service_account_file(CREDS_FILE)
+            client = gspread.authorize(creds.with_scopes(SCOPE))
+            _sheet = client.open(SHEET_NAME)
 
-# IMPORTANT FOR VERSION 2
+    return _sheet
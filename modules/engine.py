@@ -0,0 +1,299 @@
+"""
+Engine.
+
+Engine module represents the rules of the game Minesweeper and is in
+charge of playing the game without any input or output.
+
+Engine functionalities include:
+    - creating a new game,
+    - processing player moves,
+    - checking for game over and scoring the game.
+
+The engine never reads input, prints or sleeps, so it can be driven
+by the terminal game, bots, servers and benchmarks alike, as fast as
+the moves are made.
+
+The script requires:
+    - Built in utility "time" and it's method "time" for the timer.
+    - Built in utility "collections" and it's function "namedtuple"
+        for the step results.
+    - "board" module from the same directory, and it's classes:
+        - GameBoard,
+        - PlayerBoard.
+    - "const" module from the same directory and it's const:
+        - MINE - represents mine value of the field.
+
+The file contains following classes:
+    - StepResult
+    - GameEngine
+"""
+
+from time import time
+from collections import namedtuple
+from modules.board import GameBoard, PlayerBoard
+from modules.consts import MINE
+
+
+# Game states.
+PLAYING = "playing"
+WON = "won"
+LOST = "lost"
+
+# Moves the engine can make.
+ACTIONS = ("display", "flag")
+
+StepResult = namedtuple("StepResult", ["revealed", "state", "score", "flags"])
+StepResult.__doc__ = """
+    StepResult class is the result of one engine step.
+
+    revealed - newly revealed fields as (row, col) tuples,
+    state - game state: playing, won or lost,
+    score - game score once the game is over, None otherwise,
+    flags - number of remaining flags.
+    """
+
+
+class GameEngine:
+    """
+    GameEngine class plays the game Minesweeper without I/O.
+
+    Public methods:
+        new_game()
+        start_timer()
+        step()
+        elapsed()
+    """
+
+    __slots__ = ("compact", "board_engine", "debug", "clock", "board_pool",
+                 "no_guess", "rows", "cols", "mines", "flags", "gm_board",
+                 "pl_board", "state", "score", "timer_start")
+
+    def __init__(self, compact=False, board_engine="python", debug=False,
+                 clock=time, board_pool=None, no_guess=None):
+        """
+        Constructor method.
+
+        :param compact: Use compact storage of the boards.
+        :type compact: bool
+        :param board_engine: Engine used for computing the board values.
+        :type board_engine: str
+        :param debug: Check player board counters after every change.
+        :type debug: bool
+        :param clock: Function returning the current time in seconds.
+        :type clock: function
+        :param board_pool: Pool of pregenerated boards for the games
+            without a seed, using the same compact and board engine
+            settings.
+        :type board_pool: BoardPool/None
+        :param no_guess: Generator of boards cleared without guessing,
+            used instead of the board pool. Boards are random if None,
+            or if the generator runs out of time.
+        :type no_guess: NoGuessGenerator/None
+        """
+
+        self.compact = compact
+        self.board_engine = board_engine
+        self.debug = debug
+        self.clock = clock
+        self.board_pool = board_pool
+        self.no_guess = no_guess
+
+        self.rows = 0
+        self.cols = 0
+        self.mines = 0
+        self.flags = 0
+
+        self.gm_board = None
+        self.pl_board = None
+
+        self.state = None
+        self.score = None
+        self.timer_start = None
+
+    def new_game(self, rows, cols, mines, seed=None, mine_fields=None):
+        """
+        Creates a new game and starts it's timer, a game played
+        later is started again by start_timer().
+        Game board is generated on the first display move,
+        so the first displayed field is never a mine, unless
+        the mine fields are given.
+
+        :param rows: Number of Minesweeper grid rows.
+        :type rows: int
+        :param cols: Number of Minesweeper grid columns.
+        :type cols: int
+        :param mines: Number of Minesweeper mines in the grid.
+        :type mines: int
+        :param seed: Seed for the mine placement, random if None.
+        :type seed: int/None
+        :param mine_fields: Flat indexes (row * cols + col) of the
+            mine fields, e.g. of a recorded game.
+        :type mine_fields: list/None
+        :raises ValueError: Mines don't fit on the board.
+        :return: Result of the new game.
+        :rtype: StepResult
+        """
+
+        if not 0 <= mines < rows * cols:
+            raise ValueError(f"{mines} mines don't fit on a {rows}x{cols}"
+                             " board.")
+
+        self.rows = rows
+        self.cols = cols
+        self.mines = mines
+        self.flags = mines
+
+        if self.board_pool is not None and self.no_guess is None and \
+                seed is None and mine_fields is None:
+            self.gm_board = self.board_pool.get(rows, cols, mines)
+        else:
+            self.gm_board = GameBoard(rows, cols, mines, self.board_engine,
+                                      seed, self.compact, deferred=True,
+                                      index_regions=True)
+        self.pl_board = PlayerBoard(
+            rows, cols, self.gm_board.board, self.compact,
+            self.gm_board.region_index, self.debug
+            )
+
+        if mine_fields is not None:
+            self.gm_board.load(mine_fields)
+
+        self.state = PLAYING
+        self.score = None
+        self.start_timer()
+
+        return self._result([])
+
+    def start_timer(self):
+        """
+        Starts the timer of the game, when it's play begins.
+        """
+
+        self.timer_start = self.clock()
+
+    def step(self, action, row, col):
+        """
+        Makes the move on the field and checks for game over.
+        Displaying a flagged field removes the flag, moves on
+        visible fields change nothing.
+
+        :param action: Move to make: display/flag.
+        :type action: str
+        :param row: Selected field's row.
+        :type row: int
+        :param col: Selected field's column.
+        :type col: int
+        :raises RuntimeError: No game is being played.
+        :raises ValueError: Unknown action or field outside the board.
+        :return: Result of the move.
+        :rtype: StepResult
+        """
+
+        if self.state != PLAYING:
+            raise RuntimeError("No game is being played.")
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError(f"Field {row}, {col} is outside the board.")
+
+        if self.pl_board.is_visible(row, col):
+            return self._result([])
+
+        if action == "flag":
+            self.pl_board.flag_field(row, col)
+            revealed = []
+        else:
+            if not self.gm_board.generated:
+                self._generate(row, col)
+                self.pl_board.count_mines_flagged()
+
+            revealed = self.pl_board.set_field(row, col)
+
+        self.flags = self.mines - self.pl_board.flag_count
+
+        if action == "display" and \
+                self.gm_board.is_field_type(row, col, MINE):
+            self._defeat()
+        elif self._game_win():
+            self._victory()
+
+        return self._result(revealed)
+
+    def elapsed(self):
+        """
+        Calculates how much time has passed from starting the game.
+
+        :return: Whole seconds passed from starting the game, less
+            the second the timer has always held back, 0 for a game
+            played in under that second.
+        :rtype: int
+        """
+
+        return max(0, round(self.clock() - self.timer_start - 1))
+
+    def _generate(self, row, col):
+        """
+        Generates the game board on the first displayed field,
+        cleared without guessing if there is a no guess generator.
+
+        :param row: Selected field's row.
+        :type row: int
+        :param col: Selected field's column.
+        :type col: int
+        """
+
+        if self.no_guess is not None:
+            seed = self.no_guess.generate(self.rows, self.cols, self.mines,
+                                          row, col, self.gm_board.seed)
+            if seed is not None:
+                # Board of the seed is the one found by the generator.
+                self.gm_board.seed = seed
+
+        self.gm_board.generate(row, col)
+
+    def _game_win(self):
+        """
+        Checks if the game is won.
+        The game is won if only mines are left HIDDEN or flagged,
+        or if every mine and only the mines are flagged.
+
+        :return: True if the game is won, False otherwise.
+        :rtype: bool
+        """
+
+        pl_board = self.pl_board
+
+        return pl_board.hidden_count + pl_board.flag_count == self.mines or \
+            (pl_board.mines_flagged == self.mines and
+             pl_board.flag_count == self.mines)
+
+    def _defeat(self):
+        """
+        Uncovers all the mines and scores the lost game.
+        """
+
+        self.pl_board.add_mines()
+        self.score = 0 - self.elapsed()
+        self.state = LOST
+
+    def _victory(self):
+        """
+        Uncovers the whole board and scores the won game.
+        """
+
+        # The board is equal to the game board.
+        self.pl_board = self.gm_board
+        self.score = self.elapsed()
+        self.state = WON
+
+    def _result(self, revealed):
+        """
+        Gets the result of the current game state.
+
+        :param revealed: Newly revealed fields as (row, col) tuples.
+        :type revealed: list
+        :return: Result of the move.
+        :rtype: StepResult
+        """
+
+        return StepResult(revealed, self.state, self.score, self.flags)
@@ -0,0 +1,259 @@
+"""
+Grid.
+
+Grid module represents compact storage of the board fields and
+is in charge of translating between stored codes and field values.
+
+Compact storage keeps:
+    - game board values as one byte code per field in a bytearray,
+    - player board visibility and flag state as packed bits.
+
+Both grids are indexed the same way as a list of lists
+(grid[row][col]), so the Board classes work with them unchanged.
+
+The script requires:
+    - "consts" module from same directory and it's consts:
+        - HIDDEN - represents hidden value of the field.
+        - MINE - represents mine value of the field.
+        - EMPTY - represents empty value of the field.
+        - FLAG - represents flag value of the field.
+
+The file contains following classes:
+    - FieldGrid
+    - PlayerGrid
+    - GridRow
+"""
+
+from modules.consts import HIDDEN, MINE, EMPTY, FLAG
+
+
+# Field value of every code, the code of a nearby mine count
+# is the count itself.
+CODES = (EMPTY, 1, 2, 3, 4, 5, 6, 7, 8, MINE, HIDDEN, FLAG)
+VALUE_CODES = {value: code for code, value in enumerate(CODES)}
+
+EMPTY_CODE = VALUE_CODES[EMPTY]
+MINE_CODE = VALUE_CODES[MINE]
+HIDDEN_CODE = VALUE_CODES[HIDDEN]
+
+
+class FieldGrid:
+    """
+    FieldGrid class stores the field values as one byte codes.
+
+    Public methods:
+        get()
+        set()
+        count()
+    """
+
+    __slots__ = ("rows", "cols", "cells")
+
+    def __init__(self, rows, cols, value=HIDDEN):
+        """
+        Constructor method.
+
+        :param rows: Number of grid rows.
+        :type rows: int
+        :param cols: Number of grid columns.
+        :type cols: int
+        :param value: Initial value of every field.
+        :type value: str/int
+        """
+
+        self.rows = rows
+        self.cols = cols
+        self.cells = bytearray([VALUE_CODES[value]]) * (rows * cols)
+
+    def __getitem__(self, row):
+        return GridRow(self, row)
+
+    def __len__(self):
+        return self.rows
+
+    def __iter__(self):
+        for row in range(self.rows):
+            yield GridRow(self, row)
+
+    def get(self, field):
+        """
+        Gets the value of the field.
+
+        :param field: Flat field index (row * cols + col).
+        :type field: int
+        :return: Field value.
+        :rtype: str/int
+        """
+
+        return CODES[self.cells[field]]
+
+    def set(self, field, value):
+        """
+        Sets the value of the field.
+
+        :param field: Flat field index (row * cols + col).
+        :type field: int
+        :param value: Field value.
+        :type value: str/int
+        """
+
+        self.cells[field] = VALUE_CODES[value]
+
+    def count(self, start, stop, value):
+        """
+        Counts the fields of value between the flat indexes.
+
+        :return: Number of value fields.
+        :rtype: int
+        """
+
+        return self.cells.count(VALUE_CODES[value], start, stop)
+
+
+class PlayerGrid:
+    """
+    PlayerGrid class stores the player's view of a FieldGrid
+    as packed visibility and flag bits.
+    A visible field shows the value of the game grid field,
+    a flagged field shows FLAG and every other field shows HIDDEN.
+
+    Public methods:
+        get()
+        set()
+        count()
+    """
+
+    __slots__ = ("rows", "cols", "field_grid", "visible", "flagged")
+
+    def __init__(self, rows, cols, field_grid):
+        """
+        Constructor method.
+
+        :param rows: Number of grid rows.
+        :type rows: int
+        :param cols: Number of grid columns.
+        :type cols: int
+        :param field_grid: Game board grid the player is looking at.
+        :type field_grid: FieldGrid
+        """
+
+        self.rows = rows
+        self.cols = cols
+        self.field_grid = field_grid
+
+        size = (rows * cols + 7) // 8
+        self.visible = bytearray(size)
+        self.flagged = bytearray(size)
+
+    def __getitem__(self, row):
+        return GridRow(self, row)
+
+    def __len__(self):
+        return self.rows
+
+    def __iter__(self):
+        for row in range(self.rows):
+            yield GridRow(self, row)
+
+    def get(self, field):
+        """
+        Gets the value of the field as seen by the player.
+
+        :param field: Flat field index (row * cols + col).
+        :type field: int
+        :return: Field value.
+        :rtype: str/int
+        """
+
+        byte, bit = field >> 3, 1 << (field & 7)
+
+        if self.flagged[byte] & bit:
+            return FLAG
+        if self.visible[byte] & bit:
+            return self.field_grid.get(field)
+
+        return HIDDEN
+
+    def set(self, field, value):
+        """
+        Sets the field state from the value.
+        HIDDEN hides the field, FLAG flags it and any other value
+        makes the game grid value visible.
+
+        :param field: Flat field index (row * cols + col).
+        :type field: int
+        :param value: Field value.
+        :type value: str/int
+        """
+
+        byte, bit = field >> 3, 1 << (field & 7)
+
+        if value == FLAG:
+            self.flagged[byte] |= bit
+            self.visible[byte] &= ~bit
+        elif value == HIDDEN:
+            self.flagged[byte] &= ~bit
+            self.visible[byte] &= ~bit
+        else:
+            self.flagged[byte] &= ~bit
+            self.visible[byte] |= bit
+
+    def count(self, start, stop, value):
+        """
+        Counts the fields of value between the flat indexes.
+
+        :return: Number of value fields.
+        :rtype: int
+        """
+
+        return sum(1 for field in range(start, stop)
+                   if self.get(field) == value)
+
+
+class GridRow:
+    """
+    GridRow class is a view of one grid row, it supports indexing,
+    slicing, iteration and counting like a list row.
+    """
+
+    __slots__ = ("grid", "start")
+
+    def __init__(self, grid, row):
+        """
+        Constructor method.
+
+        :param grid: Grid the row belongs to.
+        :type grid: FieldGrid/PlayerGrid
+        :param row: Row of the grid.
+        :type row: int
+        """
+
+        self.grid = grid
+        self.start = row * grid.cols
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return [self.grid.get(self.start + i)
+                    for i in range(*col.indices(self.grid.cols))]
+
+        return self.grid.get(self.start + col)
+
+    def __setitem__(self, col, value):
+        self.grid.set(self.start + col, value)
+
+    def __len__(self):
+        return self.grid.cols
+
+    def __iter__(self):
+        for field in range(self.start, self.start + self.grid.cols):
+            yield self.grid.get(field)
+
+    def count(self, value):
+        """
+        Counts the fields of value in the row.
+
+        :return: Number of value fields.
+        :rtype: int
+        """
+
+        return self.grid.count(self.start, self.start + self.grid.cols, value)
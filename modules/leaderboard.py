@@ -0,0 +1,318 @@
+"""
+Leaderboard.
+
+Leaderboard module represents the scores of the finished games and is
+in charge of storing them without making the game wait.
+
+Leaderboard functionalities include:
+    - queueing the scores of the finished games,
+    - writing the queued scores in batches from a background thread,
+    - creating the backend storing the scores, SQLite or Google Sheets.
+
+A finished game puts it's score in an in-memory queue and continues.
+The background thread writes the queued scores, every score queued
+while a batch is written joins the next batch, up to "batch_size"
+scores in one transaction. So the more sessions finish their games
+at once, the more scores a transaction stores. A failed batch is
+written again after "retry_interval", scores submitted while
+"max_pending" scores wait are dropped, so a backend that is down
+doesn't hold the memory.
+
+Backends are kept in the "leaderboard_backends" module, imported
+only when a backend is created, so a game without a leaderboard
+doesn't load "sqlite3".
+
+The script requires:
+    - Built in utility "threading" and it's classes "Thread", "Lock"
+        and "Condition" for the background writes.
+    - Built in utility "queue" and it's classes "Queue", "Empty" and
+        "Full" for the queue of the scores.
+    - Built in utility "time" and it's methods "time", "monotonic"
+        and "sleep".
+    - Built in utility "collections" and it's function "namedtuple"
+        for the scores.
+    - "engine" module from the same directory, and it's const:
+        - WON - state of the won game.
+    - "leaderboard_backends" module from the same directory, and it's
+        classes "SQLiteBackend" and "SheetsBackend", imported when
+        the backend is created.
+
+The file contains following classes:
+    - Score
+    - ScoreSubmitter
+
+Functions:
+    - game_score()
+    - create_backend()
+"""
+
+from threading import Thread, Lock, Condition
+from queue import Queue, Empty, Full
+from time import time, monotonic, sleep
+from collections import namedtuple
+from modules.engine import WON
+
+
+# Available backends, "none" keeps no leaderboard.
+BACKENDS = ("sqlite", "sheets", "none")
+# Player of the games without a player name.
+DEFAULT_PLAYER = "anonymous"
+
+# Default scores per transaction, scores waiting before the new ones
+# are dropped, and seconds between the writes of a failed batch.
+BATCH_SIZE = 500
+MAX_PENDING = 100000
+RETRY_INTERVAL = 1.
+# Seconds close() waits for the queued scores to be written.
+CLOSE_TIMEOUT = 5.
+# Seconds SQLite waits for another process writing the file.
+SQLITE_TIMEOUT = 30.
+
+Score = namedtuple("Score", ["player", "rows", "cols", "mines", "score",
+                             "won", "played_at"])
+Score.__doc__ = """
+    Score class is the score of one finished game.
+
+    player - name of the player,
+    rows, cols, mines - size of the board,
+    score - seconds the game took, negative for a lost game,
+    won - whether the game is won,
+    played_at - time the game finished, as time() returns it.
+    """
+
+
+def game_score(engine, player=DEFAULT_PLAYER):
+    """
+    Gets the score of the engine's finished game.
+
+    :param engine: Engine that played the game.
+    :type engine: GameEngine
+    :param player: Name of the player.
+    :type player: str
+    :return: Score of the game.
+    :rtype: Score
+    """
+
+    return Score(player, engine.rows, engine.cols, engine.mines,
+                 engine.score, engine.state == WON, time())
+
+
+def create_backend(name, path="leaderboard.db"):
+    """
+    Creates the backend of the name.
+
+    :param name: One of BACKENDS.
+    :type name: str
+    :param path: Database file of the SQLite backend.
+    :type path: str
+    :raises ValueError: Unknown backend.
+    :return: Backend, None for "none".
+    :rtype: SQLiteBackend/SheetsBackend/None
+    """
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown leaderboard backend: {name}")
+
+    if name == "sqlite":
+        # Backends are imported only if a leaderboard is kept.
+        from modules.leaderboard_backends import SQLiteBackend
+
+        return SQLiteBackend(path)
+    if name == "sheets":
+        from modules.leaderboard_backends import SheetsBackend
+
+        return SheetsBackend()
+
+    return None
+
+
+class ScoreSubmitter:
+    """
+    ScoreSubmitter class queues the scores of the finished games and
+    writes them to the backend in batches from a background thread.
+
+    Public methods:
+        start()
+        submit()
+        flush()
+        close()
+    """
+
+    __slots__ = ("backend", "batch_size", "retry_interval", "queue",
+                 "submitted", "written", "lost", "dropped", "batches",
+                 "errors", "_lock", "_done", "_closed", "_thread")
+
+    def __init__(self, backend, batch_size=BATCH_SIZE,
+                 max_pending=MAX_PENDING, retry_interval=RETRY_INTERVAL):
+        """
+        Constructor method.
+
+        :param backend: Backend storing the scores.
+        :type backend: SQLiteBackend/SheetsBackend
+        :param batch_size: Most scores written in one transaction.
+        :type batch_size: int
+        :param max_pending: Most scores waiting to be written.
+        :type max_pending: int
+        :param retry_interval: Seconds between the writes of a failed
+            batch.
+        :type retry_interval: float
+        :raises ValueError: Batch size is below 1.
+        """
+
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1.")
+
+        self.backend = backend
+        self.batch_size = batch_size
+        self.retry_interval = retry_interval
+        self.queue = Queue(max_pending)
+
+        # Scores queued, written, lost to a failed batch on close and
+        # dropped with a full queue, batches written and failed writes.
+        self.submitted = 0
+        self.written = 0
+        self.lost = 0
+        self.dropped = 0
+        self.batches = 0
+        self.errors = 0
+
+        # Counters are updated by the sessions and the thread.
+        self._lock = Lock()
+        self._done = Condition(self._lock)
+        self._closed = False
+        self._thread = None
+
+    def start(self):
+        """
+        Starts writing the scores in the background.
+        """
+
+        if self._thread is not None:
+            return
+
+        self._thread = Thread(target=self._write_behind,
+                              name="score-submitter", daemon=True)
+        self._thread.start()
+
+    def submit(self, score):
+        """
+        Queues the score without waiting for the backend.
+
+        :param score: Score of the finished game.
+        :type score: Score
+        :return: True if the score is queued, False if it's dropped.
+        :rtype: bool
+        """
+
+        with self._lock:
+            try:
+                self.queue.put_nowait(score)
+            except Full:
+                self.dropped += 1
+                return False
+
+            self.submitted += 1
+
+        return True
+
+    def flush(self, timeout=None):
+        """
+        Waits until the scores submitted so far are written.
+
+        :param timeout: Seconds to wait, no limit if None.
+        :type timeout: float/None
+        :return: True if the scores are written, False on timeout.
+        :rtype: bool
+        """
+
+        with self._done:
+            target = self.submitted
+
+            return self._done.wait_for(
+                lambda: self.written + self.lost >= target, timeout)
+
+    def close(self, timeout=CLOSE_TIMEOUT):
+        """
+        Writes the queued scores and stops the background thread.
+
+        :param timeout: Seconds to wait for the scores and the thread.
+        :type timeout: float
+        """
+
+        if self._thread is None:
+            return
+
+        deadline = monotonic() + timeout
+        self.flush(timeout)
+        self._closed = True
+
+        try:
+            self.queue.put_nowait(None)
+        except Full:
+            pass
+
+        self._thread.join(max(0., deadline - monotonic()))
+        if not self._thread.is_alive():
+            self.backend.close()
+        self._thread = None
+
+    def _write_behind(self):
+        """
+        Writes the queued scores in batches until the submitter
+        is closed.
+        """
+
+        while True:
+            score = self.queue.get()
+            if score is None:
+                return
+
+            batch = [score]
+            closing = False
+
+            # Scores queued while the last batch was written.
+            while len(batch) < self.batch_size:
+                try:
+                    score = self.queue.get_nowait()
+                except Empty:
+                    break
+
+                if score is None:
+                    closing = True
+                    break
+                batch.append(score)
+
+            self._write(batch)
+            if closing:
+                return
+
+    def _write(self, batch):
+        """
+        Writes the batch, again after a failure, until it's written
+        or the submitter is closed.
+
+        :param batch: Scores to write.
+        :type batch: list
+        """
+
+        while True:
+            try:
+                self.backend.write(batch)
+            # Backends raise their own errors, e.g. sqlite3.Error
+            # or the API errors of gspread.
+            except Exception:
+                with self._done:
+                    self.errors += 1
+                    if self._closed:
+                        self.lost += len(batch)
+                        self._done.notify_all()
+                        return
+
+                sleep(self.retry_interval)
+                continue
+
+            with self._done:
+                self.written += len(batch)
+                self.batches += 1
+                self._done.notify_all()
+            return
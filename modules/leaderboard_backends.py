@@ -0,0 +1,227 @@
+"""
+Leaderboard backends.
+
+Leaderboard backends module represents the storages of the scores and
+is in charge of writing and reading them, it's imported by
+create_backend() of the leaderboard module only when a leaderboard
+is kept, so the games without one don't load "sqlite3".
+
+Backends have the same methods: write() stores a batch of scores in
+one transaction, top() gets the best scores and close() releases the
+backend. Both connect on the first use, not when created.
+
+The script requires:
+    - Built in utility "sqlite3" for the SQLite backend.
+    - Built in utility "threading" and it's class "Lock" for the
+        connection shared by the threads.
+    - "leaderboard" module from the same directory, and it's:
+        - Score class,
+        - SQLITE_TIMEOUT - seconds SQLite waits for another process.
+    - "database" module from the same directory, and it's function
+        "sheet" for the Sheets backend, imported on the first use.
+
+The file contains following classes:
+    - SQLiteBackend
+    - SheetsBackend
+"""
+
+import sqlite3
+from threading import Lock
+from modules.leaderboard import Score, SQLITE_TIMEOUT
+
+
+class SQLiteBackend:
+    """
+    SQLiteBackend class stores the scores in a SQLite database file.
+    Game processes of the web terminal share the file, it's written
+    in the write-ahead log mode so reading doesn't block writing.
+
+    Public methods:
+        write()
+        top()
+        close()
+    """
+
+    __slots__ = ("path", "_conn", "_lock")
+
+    def __init__(self, path="leaderboard.db"):
+        """
+        Constructor method.
+
+        :param path: Database file, ":memory:" for a database
+            in memory.
+        :type path: str
+        """
+
+        self.path = path
+
+        # Connection of the threads using the backend, one at a time.
+        self._conn = None
+        self._lock = Lock()
+
+    def write(self, scores):
+        """
+        Stores the scores in one transaction.
+
+        :param scores: Scores to store.
+        :type scores: list
+        :raises sqlite3.Error: Scores can't be stored.
+        """
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    scores)
+
+    def top(self, rows, cols, mines, limit=10):
+        """
+        Gets the fastest won games of the board size.
+
+        :param rows: Number of Minesweeper grid rows.
+        :type rows: int
+        :param cols: Number of Minesweeper grid columns.
+        :type cols: int
+        :param mines: Number of Minesweeper mines in the grid.
+        :type mines: int
+        :param limit: Number of scores.
+        :type limit: int
+        :return: Scores from the fastest.
+        :rtype: list
+        """
+
+        with self._lock:
+            cursor = self._connect().execute(
+                "SELECT * FROM scores WHERE rows = ? AND cols = ?"
+                " AND mines = ? AND won ORDER BY score LIMIT ?",
+                (rows, cols, mines, limit))
+
+            return [Score(*row[:5], bool(row[5]), row[6]) for row in cursor]
+
+    def close(self):
+        """
+        Closes the connection, the next use opens it again.
+        """
+
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self):
+        """
+        Opens the connection and creates the table on the first use.
+
+        :return: Connection to the database.
+        :rtype: sqlite3.Connection
+        """
+
+        if self._conn is None:
+            # Threads take turns with the lock.
+            conn = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS scores ("
+                             "player TEXT, rows INTEGER, cols INTEGER,"
+                             " mines INTEGER, score INTEGER,"
+                             " won INTEGER, played_at REAL)")
+                conn.execute("CREATE INDEX IF NOT EXISTS scores_board"
+                             " ON scores (rows, cols, mines, won, score)")
+
+            self._conn = conn
+
+        return self._conn
+
+
+class SheetsBackend:
+    """
+    SheetsBackend class stores the scores in a worksheet of the Google
+    Sheets database, one row per score. Requires "gspread" and the
+    credentials of the database module.
+
+    Public methods:
+        write()
+        top()
+        close()
+    """
+
+    __slots__ = ("name", "_worksheet")
+
+    def __init__(self, name="leaderboard"):
+        """
+        Constructor method.
+
+        :param name: Name of the worksheet.
+        :type name: str
+        """
+
+        self.name = name
+        self._worksheet = None
+
+    def write(self, scores):
+        """
+        Appends the scores to the worksheet in one request.
+
+        :param scores: Scores to store.
+        :type scores: list
+        :raises gspread.exceptions.APIError: Scores can't be stored.
+        """
+
+        self._open().append_rows(
+            [[*score[:5], int(score.won), score.played_at]
+             for score in scores], value_input_option="RAW")
+
+    def top(self, rows, cols, mines, limit=10):
+        """
+        Gets the fastest won games of the board size.
+
+        :param rows: Number of Minesweeper grid rows.
+        :type rows: int
+        :param cols: Number of Minesweeper grid columns.
+        :type cols: int
+        :param mines: Number of Minesweeper mines in the grid.
+        :type mines: int
+        :param limit: Number of scores.
+        :type limit: int
+        :return: Scores from the fastest.
+        :rtype: list
+        """
+
+        scores = []
+
+        for row in self._open().get_all_values():
+            try:
+                score = Score(row[0], *map(int, row[1:6]), float(row[6]))
+            except (ValueError, IndexError):
+                # Header and rows not written by the backend.
+                continue
+
+            if score.won and score[1:4] == (rows, cols, mines):
+                scores.append(score._replace(won=True))
+
+        return sorted(scores, key=lambda score: score.score)[:limit]
+
+    def close(self):
+        """
+        Forgets the worksheet, the connection is kept by the database
+        module.
+        """
+
+        self._worksheet = None
+
+    def _open(self):
+        """
+        Opens the worksheet on the first use.
+
+        :return: Worksheet of the scores.
+        :rtype: gspread.Worksheet
+        """
+
+        if self._worksheet is None:
+            from modules.database import sheet
+
+            self._worksheet = sheet().worksheet(self.name)
+
+        return self._worksheet
@@ -7,42 +7,98 @@ is in charge of Minesweeper functionalities.
 Minesweeper functionalities include:
     - running the game.
 
+Minesweeper is the client of the game engine, it takes the player
+input, draws the game and shows the alerts, while the engine plays
+the moves. The game is played by a generator yielding the requests of
+the player input and the alerts, so the terminal answers them with
+"input" and the game server answers them from it's connections,
+playing the same game. Requests are tuples starting with:
+    - ACTION_INPUT - the player's action line is sent back,
+    - ACTION_ALERT - alerts of the incorrect action line are shown,
+    - ALERT - the alert and the score are shown until the player
+        continues,
+    - CONFIRM - True or False of the yes or no alert is sent back.
+
 The script requires:
-    - Built in utility "time" for elapsed time measurement and delay.
-    - Built in utility "os" for clearing the terminal.
-    - "board" module from the same directory, and it's classes:
-        - GameBoard,
-        - PlayerBoard.
-    - "user_alert" module from the same directory, and it's classes:
-        - ContinueAlert
-        - YesOrNoAlert.
+    - Built in utility "time" and it's method "sleep" for delay.
+    - "engine" module from the same directory, and it's class:
+        - GameEngine,
+      and it's consts:
+        - PLAYING - state of the game being played,
+        - WON - state of the won game.
+    - "user_alert" module from the same directory, and it's:
+        - PlayerActionAlert class,
+        - CONTINUE_ALERT, YES_OR_NO_ALERT - shared alerts,
+        - ACTION_PROMPT - prompt of the player's action.
     - "player_action" module from the same directory, and it's class:
         - PlayerAction.
-    - "const" module from the same directory and it's consts:
-        - HIDDEN - represents hidden value of the field,
+    - "renderer" module from the same directory, and it's class:
+        - DiffRenderer.
+    - "replay" module from the same directory, and it's:
+        - ReplayRecorder class,
+        - write_replay - function writing the replay file.
+    - "snapshot" module from the same directory, and it's functions:
+        - dump_snapshot,
+        - restore_snapshot.
+    - "solver" module from the same directory, and it's class:
+        - Solver.
+    - "probability" module from the same directory, and it's class:
+        - MineProbability.
+    - "leaderboard" module from the same directory, and it's:
+        - game_score - function getting the score of the game,
+        - DEFAULT_PLAYER - player of the games without a name.
+    - "const" module from the same directory and it's const:
         - FLAG - represents flag value of the field.
 
 The file contains following classes:
     - Minesweeper.
 """
 
-import os
-from time import time, sleep
-from modules.board import GameBoard, PlayerBoard
+from time import sleep
+from modules.engine import GameEngine, PLAYING, WON
 from modules.player_action import PlayerAction
-from modules.user_alert import ContinueAlert, YesOrNoAlert
-from modules.consts import HIDDEN, FLAG, MINE
+from modules.renderer import DiffRenderer
+from modules.replay import ReplayRecorder, write_replay
+from modules.snapshot import dump_snapshot, restore_snapshot
+from modules.solver import Solver
+from modules.probability import MineProbability
+from modules.leaderboard import game_score, DEFAULT_PLAYER
+from modules.user_alert import PlayerActionAlert, CONTINUE_ALERT, \
+    YES_OR_NO_ALERT, ACTION_PROMPT
+from modules.consts import FLAG
+
+
+# Requests of the game to it's front end.
+ACTION_INPUT = "action input"
+ACTION_ALERT = "action alert"
+ALERT = "alert"
+CONFIRM = "confirm"
 
 
 class Minesweeper:
     """
     Minesweeper class creates and executes the game.
 
+    A game with a session is saved to the snapshot store on every
+    display and resumed from it when created again with the same
+    session, until the game is over.
+
+    The score of the finished game is submitted to the leaderboard,
+    the game doesn't wait for it to be stored.
+
     Public methods:
         run()
+        play()
     """
 
-    def __init__(self, rows, cols, mines):
+    __slots__ = ("rows", "cols", "mines", "engine", "renderer", "session",
+                 "store", "resumed", "replay_path", "recorder", "pl_action",
+                 "solver", "probability", "hint", "leaderboard", "player")
+
+    def __init__(self, rows, cols, mines, compact=False, debug=False,
+                 replay_path=None, session=None, store=None,
+                 board_pool=None, no_guess=None, leaderboard=None,
+                 player=DEFAULT_PLAYER, out=None, size=None):
         """
         Constructor method.
 
@@ -52,240 +108,319 @@ class Minesweeper:
         :type cols: int
         :param mines: Number of Minesweeper mines in the grid.
         :type mines: int
+        :param compact: Use compact storage of the boards.
+        :type compact: bool
+        :param debug: Check player board counters after every change.
+        :type debug: bool
+        :param replay_path: Path the replay of the game is written to
+            once the game is over, no replay is recorded if None.
+        :type replay_path: str/None
+        :param session: Session key of the game's snapshot.
+        :type session: str/None
+        :param store: Store of the snapshots, the game is not saved
+            if None.
+        :type store: SnapshotStore/None
+        :param board_pool: Pool of pregenerated boards, using the same
+            compact setting.
+        :type board_pool: BoardPool/None
+        :param no_guess: Generator of boards cleared without guessing.
+        :type no_guess: NoGuessGenerator/None
+        :param leaderboard: Submitter of the scores, the score is not
+            kept if None.
+        :type leaderboard: ScoreSubmitter/None
+        :param player: Name of the player on the leaderboard.
+        :type player: str
+        :param out: Stream the game is drawn to, standard output
+            if None.
+        :type out: file object
+        :param size: Columns and lines of the player's terminal,
+            the size of the process' terminal if None.
+        :type size: tuple/None
         """
 
         self.rows = rows
         self.cols = cols
-
         self.mines = mines
-        self.flags = mines
 
-        self.action_type = ""
-        self.timer_start = None
-        self.score = None
+        # Engine playing the game.
+        self.engine = GameEngine(compact=compact, debug=debug,
+                                 board_pool=board_pool, no_guess=no_guess)
+
+        # Renderer repainting only the changed fields.
+        self.renderer = DiffRenderer(out, size)
+
+        # Resume the saved game of the session.
+        self.session = session
+        self.store = store if session else None
+        self.resumed = self._resume()
+        if not self.resumed:
+            self.engine.new_game(self.rows, self.cols, self.mines)
 
-        # Create game and player board objects.
-        self.gm_board = GameBoard(self.rows, self.cols, self.mines)
-        self.pl_board = PlayerBoard(
-            self.rows, self.cols, self.gm_board.board
-            )
+        # Recorder of the game moves, created once the game starts.
+        self.replay_path = replay_path
+        self.recorder = None
 
         # Player action object.
         self.pl_action = PlayerAction(self.rows, self.cols)
 
+        # Hint solver, updated after every move, and mine chances
+        # for hints when no field is certain.
+        self.solver = Solver(self.engine.pl_board)
+        self.probability = MineProbability(self.solver, self.mines)
+        self.hint = ""
+
+        self.leaderboard = leaderboard
+        self.player = player
+
     def run(self):
         """
-        Runs the Minesweeper game.
-
-        Displays the content, gets the user action,
-        checks if the board is visible, processes player
-        move, checks for game over.
+        Runs the Minesweeper game on the terminal, answering the
+        requests of the game with the player's input and the alerts.
         """
 
-        # Time tracker.
-        self.timer_start = time()
+        game = self.play()
+        answer = None
 
         while True:
-            # Clear the screen.
-            os.system('clear')
+            try:
+                request = game.send(answer)
+            except StopIteration:
+                return
+
+            answer = self._answer(request)
+
+    def play(self):
+        """
+        Plays the game, asking the front end for the player's input.
+
+        Displays the content, gets the user actions, for every
+        action moves the view or checks if the board is visible,
+        processes player move, checks for game over. The input and
+        the alerts are the requests yielded to the front end, it
+        sends back the answers.
 
+        :return: Generator of the requests, until the game is over.
+        :rtype: generator
+        """
+
+        # Timer starts when the play begins, a resumed game keeps
+        # it's time. Moves made before a resumed game was saved are
+        # unknown, so it is not recorded.
+        if not self.resumed:
+            self.engine.start_timer()
+            if self.replay_path:
+                self.recorder = ReplayRecorder(self.engine)
+
+        while True:
             # Display game content.
             self._display_game()
 
             # Checks if the information is fetched correctly.
-            action_bundle = self.pl_action.new_action()
+            line = yield (ACTION_INPUT,)
             try:
-                self.action_type, action_row, action_col = action_bundle
+                actions = self.pl_action.parse_line(line)
             except ValueError:
+                yield (ACTION_ALERT,)
+                # Alert was displayed, the screen needs a repaint.
+                self.renderer.invalidate()
                 continue
 
-            # Check if the field is visible, if not proceed.
-            if self.pl_board.is_visible(action_row, action_col):
-                ContinueAlert().call_alert("field visible")
-                continue
-
-            self._player_move(action_row, action_col)
-
-            # Check if the game is over.
-            if self._game_over(action_row, action_col):
-                break
-
-    def _display_game(self):
+            # Board is displayed once all the actions are done.
+            for action_type, action_row, action_col in actions:
+                # Goto moves the view of the board, it is not a move.
+                if action_type == "goto":
+                    self.renderer.pan_to(action_row, action_col)
+                    continue
+
+                # Hint is shown in the footer, it is not a move.
+                if action_type == "hint":
+                    self._hint()
+                    continue
+
+                # Check if the field is visible, if not proceed.
+                # Fields opened by earlier actions of the line
+                # are skipped without an alert.
+                if self.engine.pl_board.is_visible(action_row, action_col):
+                    if len(actions) == 1:
+                        yield (ALERT, "field visible", 0)
+                        self.renderer.invalidate()
+                    continue
+
+                # Displaying a flagged field needs the player's
+                # confirmation.
+                if action_type == "display" and \
+                        self.engine.pl_board.is_field_type(
+                            action_row, action_col, FLAG):
+                    to_continue = yield (CONFIRM, action_type)
+                    self.renderer.invalidate()
+
+                    if not to_continue:
+                        continue
+
+                self._player_move(action_type, action_row, action_col)
+                self.renderer.follow(action_row, action_col)
+
+                # Check if the game is over.
+                if self.engine.state != PLAYING:
+                    yield (ALERT, self._game_over(), self.engine.score)
+                    return
+
+    def _answer(self, request):
         """
-        Displays all game contents; the board and footer.
+        Answers the request of the game on the terminal.
+
+        :param request: Request yielded by play().
+        :type request: tuple
+        :return: Answer sent back to the game.
+        :rtype: str/bool/None
         """
 
-        self.pl_board.display()
+        if request[0] == ACTION_INPUT:
+            return input(ACTION_PROMPT)
 
-        self._display_game_footer()
+        if request[0] == ACTION_ALERT:
+            PlayerActionAlert(self.rows, self.cols, self.pl_action.alerts,
+                              self.pl_action.arg_num).call_alert()
+        elif request[0] == CONFIRM:
+            to_continue = YES_OR_NO_ALERT.call_alert(request[1])
+            sleep(.15)
+            return to_continue
+        else:
+            CONTINUE_ALERT.call_alert(request[1], request[2])
+
+        return None
 
-    def _display_game_footer(self):
+    def _resume(self):
         """
-        Displays game footer.
-        Game footer contains information:
-            - Number of MINES on the board.
-            - Number of remaining FLAGS.
-            - Time elapsed from beginning of the game.
+        Restores the saved game of the session, if there is one
+        and it is not over. A snapshot that can't be restored
+        is deleted.
+
+        :return: True if the game was resumed, False otherwise.
+        :rtype: bool
         """
 
-        timer = self._get_time_passed()
+        if self.store is None:
+            return False
 
-        print(f"\n\033[37;2mMINES:\033[0m \033[31;1m{self.mines}\033[0m"
-              f"\t\033[37;2mFLAGS:\033[0m \033[32;1m{self.flags}\033[0m"
-              f"\t\033[37;2mTIMER:\033[0m \033[33;1m{timer}\033[0m")
+        data = self.store.load(self.session)
+        if data is None:
+            return False
 
-    def _player_move(self, row, col):
-        """
-        Runs the player selected move.
+        try:
+            top, left = restore_snapshot(data, self.engine)
+        except (ValueError, IndexError):
+            self.store.delete(self.session)
+            return False
 
-        :param row: Selected field's row.
-        :type row: int
-        :param col: Selected field's column.
-        :type col: int
-        """
+        if self.engine.state != PLAYING:
+            return False
 
-        if self.action_type == "flag":
-            self._flag_move(row, col)
-        else:
-            self._display_move(row, col)
+        self.rows = self.engine.rows
+        self.cols = self.engine.cols
+        self.mines = self.engine.mines
+        self.renderer.top, self.renderer.left = top, left
 
-    def _flag_move(self, row, col):
-        """
-        Calls the flagging of the field and updates flag count.
+        return True
 
-        :param row: Selected field's row.
-        :type row: int
-        :param col: Selected field's column.
-        :type col: int
+    def _display_game(self):
+        """
+        Displays all game contents; the board and footer.
         """
 
-        self.pl_board.flag_field(row, col)
-        self.flags = self.mines - self.pl_board.num_of_fields(FLAG)
+        self.renderer.render(self.engine.pl_board, self._game_footer())
 
-    def _display_move(self, row, col):
-        """
-        Calls the display action on the field if applicable.
+        if self.store is not None and self.engine.state == PLAYING:
+            self.store.save(self.session, dump_snapshot(
+                self.engine, (self.renderer.top, self.renderer.left)
+                ))
 
-        :param row: Selected field's row.
-        :type row: int
-        :param col: Selected field's column.
-        :type col: int
+    def _game_footer(self):
         """
+        Gets game footer.
+        Game footer contains information:
+            - Number of MINES on the board.
+            - Number of remaining FLAGS.
+            - Time elapsed from beginning of the game.
 
-        # Check if the field is flagged.
-        if self.pl_board.is_field_type(row, col, FLAG):
-            # Ask for confirmation to proceed.
-            to_continue = YesOrNoAlert().call_alert(self.action_type)
-            sleep(.15)
-
-            if not to_continue:
-                self.action_type = ""  # Reset.
-                return
+        :return: Game footer.
+        :rtype: str
+        """
 
-            self.flags += 1
+        timer = self.engine.elapsed()
 
-        # If the field is not flagged, set the field straight away.
-        self.pl_board.set_field(row, col)
+        return (f"\n\033[37;2mMINES:\033[0m \033[31;1m{self.mines}\033[0m"
+                f"\t\033[37;2mFLAGS:\033[0m"
+                f" \033[32;1m{self.engine.flags}\033[0m"
+                f"\t\033[37;2mTIMER:\033[0m \033[33;1m{timer}\033[0m"
+                f"{self.hint}")
 
-    def _game_over(self, row, col):
+    def _hint(self):
         """
-        Checks if the game is over, and if it's
-        victory or defeat. Displays the game over screen.
-
-        :param row: Current field row of the grid.
-        :type row: int
-        :param col: Current field column of the grid.
-        :type col: int
-        :return: True if the game is over, False otherwise.
-        :rtype: bool
+        Gets a certain move from the solver for the footer
+        and moves the view to it's field. If no field is certain
+        the field least likely to be a mine is shown. Before the first
+        move every field is safe, the mines are placed around it.
         """
 
-        result = None
+        if not self.engine.gm_board.generated:
+            self.hint = ("\n\033[37;2mHINT:\033[0m any field is safe on"
+                         " the first move")
+            return
 
-        if self._game_lose(row, col):
-            result = self._defeat()
-        elif self._game_win():
-            result = self._victory()
+        hint = self.solver.hint()
 
-        if result:
-            os.system('clear')
-            self._display_game()
-            ContinueAlert().call_alert(result, self.score)
-            return True
+        if hint is None:
+            row, col, chance = self.probability.safest()
+            self.hint = ("\n\033[37;2mHINT:\033[0m no field is certain,"
+                         f" \033[33;1m{row + 1} {col + 1}\033[0m has the"
+                         f" lowest mine chance: {chance:.0%}")
+            self.renderer.follow(row, col)
+            return
 
-        return False
+        action, row, col = hint
+        field = "safe" if action == "display" else "a mine"
+        self.hint = (f"\n\033[37;2mHINT:\033[0m \033[32;1m{row + 1}"
+                     f" {col + 1}\033[0m is {field}")
+        self.renderer.follow(row, col)
 
-    def _game_lose(self, row, col):
+    def _player_move(self, action_type, row, col):
         """
-        Checks if the game is indeed lost.
-        The game is lost if selected field is mine, and
-        player action is "display".
+        Runs the player selected move.
 
-        :param row: Current field row of the grid.
+        :param action_type: Move to make: display/flag.
+        :type action_type: str
+        :param row: Selected field's row.
         :type row: int
-        :param col: Current field column of the grid.
+        :param col: Selected field's column.
         :type col: int
-        :return: True if the game is lost, False otherwise.
-        :rtype: bool
-        """
-
-        if self.gm_board.is_field_type(row, col, MINE) and \
-                (self.action_type == "display"):
-            return True
-
-        return False
-
-    def _game_win(self):
         """
-        Checks if the game is indeed won.
-        The game is won if number of remaining fields is equal
-        to mine count, or if count of mines flagged is equal to mine
-        count and flag count is 0.
 
-        :return: True if the game is won, False otherwise.
-        :rtype: bool
-        """
-
-        hidden_count = self.pl_board.num_of_fields(HIDDEN)
-        remaining_fields = hidden_count + self.mines - self.flags
+        result = self.engine.step(action_type, row, col)
+        self.hint = ""
 
-        if (remaining_fields) == self.mines or \
-                (self.pl_board.mines_flagged == self.mines and
-                 self.flags == 0):
-            return True
+        if result.state == PLAYING:
+            self.solver.update(result.revealed)
 
-        return False
+        if self.recorder is not None:
+            self.recorder.record(action_type, row, col)
 
-    def _defeat(self):
+    def _game_over(self):
         """
-        Prepares the board for it's defeat mode,
-        gets the score and returns that the game is indeed lost.
-        """
-
-        # The board uncovers where all the mines are.
-        self.pl_board.add_mines()
-        self.score = 0 - self._get_time_passed()
-
-        return 'defeat'
+        Finishes the game that is over; writes it's replay, deletes
+        it's snapshot, submits it's score and displays it.
 
-    def _victory(self):
+        :return: Alert of the result, victory or defeat.
+        :rtype: str
         """
-        Prepares the board for it's victory mode,
-        gets the score and returns that the game is indeed won.
-        """
-
-        # The board is equal to the game board.
-        self.pl_board = self.gm_board
-        self.score = self._get_time_passed()
 
-        return 'victory'
+        if self.recorder is not None:
+            write_replay(self.replay_path, self.recorder.replay())
+        if self.store is not None:
+            self.store.delete(self.session)
+        if self.leaderboard is not None:
+            self.leaderboard.submit(game_score(self.engine, self.player))
 
-    def _get_time_passed(self):
-        """
-        Calculates how much time has passed from starting the game.
-
-        :return: Calculation how much time passed from starting the game.
-        :rtype: Time obj
-        """
+        self._display_game()
 
-        return round(time() - self.timer_start - 1)
+        return 'victory' if self.engine.state == WON else 'defeat'
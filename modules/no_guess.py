@@ -0,0 +1,351 @@
+"""
+No guess.
+
+No guess module represents the generation of boards that can be
+cleared without guessing, and is in charge of finding them.
+
+No guess functionalities include:
+    - checking if the hint solver clears a board from it's first field,
+    - trying candidate boards in parallel until one is cleared,
+    - keeping success rate stats of every board size.
+
+A candidate is the board GameBoard generates from it's seed for the
+first selected field, so a found board is passed around as it's seed.
+Candidates are tried in batches on worker processes, and the search
+stops as soon as a batch finds one, or the time budget runs out.
+Batches already running when the search stops are left to finish,
+their results are counted in the stats of the next search.
+
+The script requires:
+    - Built in utility "os" for the number of cores.
+    - Built in utility "random" and it's class "Random" for the seeds
+        of the candidates.
+    - Built in utility "time" and it's methods "time" and
+        "perf_counter" for the time budget.
+    - Built in utility "collections" and it's function "namedtuple"
+        for the stats.
+    - Built in utility "concurrent.futures" and it's class
+        "ProcessPoolExecutor" and function "wait" for the workers.
+    - "engine" module from the same directory, and it's:
+        - GameEngine class,
+        - PLAYING, WON - game states.
+    - "solver" module from the same directory, and it's class:
+        - Solver.
+
+The file contains following classes:
+    - NoGuessStats
+    - NoGuessGenerator
+
+Functions:
+    - solvable()
+"""
+
+import os
+from random import Random
+from time import time, perf_counter
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from modules.engine import GameEngine, PLAYING, WON
+from modules.solver import Solver
+
+
+# Default search budget in seconds, and candidates tried per batch.
+TIMEOUT = 2.
+BATCH_SIZE = 16
+
+NoGuessStats = namedtuple("NoGuessStats", ["candidates", "solvable",
+                                           "boards", "timeouts", "seconds"])
+NoGuessStats.__doc__ = """
+    NoGuessStats class is the search stats of one board size.
+
+    candidates - number of candidate boards tried,
+    solvable - number of candidates cleared without guessing,
+    boards - number of searches that found a board,
+    timeouts - number of searches out of time,
+    seconds - time spent searching.
+    """
+
+
+def solvable(rows, cols, mines, seed, row, col):
+    """
+    Checks if the hint solver clears the board of the seed from
+    the selected field, without guessing.
+
+    :param rows: Number of Minesweeper grid rows.
+    :type rows: int
+    :param cols: Number of Minesweeper grid columns.
+    :type cols: int
+    :param mines: Number of Minesweeper mines in the grid.
+    :type mines: int
+    :param seed: Seed for the mine placement.
+    :type seed: int
+    :param row: First selected field's row.
+    :type row: int
+    :param col: First selected field's column.
+    :type col: int
+    :return: True if the board is cleared, False otherwise.
+    :rtype: bool
+    """
+
+    engine = GameEngine()
+    engine.new_game(rows, cols, mines, seed)
+    solver = Solver(engine.pl_board)
+    result = engine.step("display", row, col)
+
+    while result.state == PLAYING:
+        solver.update(result.revealed)
+
+        hint = solver.hint()
+        if hint is None:
+            return False
+
+        result = engine.step(*hint)
+
+    return result.state == WON
+
+
+def _search(rows, cols, mines, row, col, seeds, deadline):
+    """
+    Tries the candidates of the seeds in order until one is solvable
+    or the deadline passes.
+
+    :param seeds: Seeds of the candidates.
+    :type seeds: range
+    :param deadline: Time the search stops at, as time() returns it.
+    :type deadline: float
+    :return: Seed of the solvable candidate, None if there is none,
+        and the number of candidates tried.
+    :rtype: tuple
+    """
+
+    tried = 0
+
+    for seed in seeds:
+        if time() > deadline:
+            break
+
+        tried += 1
+        if solvable(rows, cols, mines, seed, row, col):
+            return seed, tried
+
+    return None, tried
+
+
+class NoGuessGenerator:
+    """
+    NoGuessGenerator class searches for boards cleared without
+    guessing on a pool of worker processes.
+
+    Public methods:
+        generate()
+        success_rate()
+        close()
+    """
+
+    def __init__(self, workers=None, timeout=TIMEOUT,
+                 batch_size=BATCH_SIZE):
+        """
+        Constructor method.
+
+        :param workers: Number of worker processes, all cores if None,
+            1 searches in this process.
+        :type workers: int/None
+        :param timeout: Search budget in seconds.
+        :type timeout: float
+        :param batch_size: Candidates tried by a worker at once.
+        :type batch_size: int
+        """
+
+        self.workers = workers or os.cpu_count()
+        self.timeout = timeout
+        self.batch_size = batch_size
+
+        # Search stats keyed by (rows, cols, mines).
+        self.stats = {}
+
+        # Started on the first search.
+        self._executor = None
+        # Batches still running from the previous searches.
+        self._running = {}
+
+    def generate(self, rows, cols, mines, row, col, seed=None):
+        """
+        Searches for a board cleared without guessing from
+        the selected field.
+
+        :param rows: Number of Minesweeper grid rows.
+        :type rows: int
+        :param cols: Number of Minesweeper grid columns.
+        :type cols: int
+        :param mines: Number of Minesweeper mines in the grid.
+        :type mines: int
+        :param row: First selected field's row.
+        :type row: int
+        :param col: First selected field's column.
+        :type col: int
+        :param seed: Seed for the seeds of the candidates, random
+            if None. With more than one worker the candidate found
+            first may differ between the runs.
+        :type seed: int/None
+        :return: Seed of the found board for GameBoard, None if the
+            time ran out.
+        :rtype: int/None
+        """
+
+        start = perf_counter()
+        deadline = time() + self.timeout
+        size = rows, cols, mines
+        first_seed = Random(seed).getrandbits(48)
+        found = None
+
+        if self.workers == 1:
+            found, tried = _search(rows, cols, mines, row, col,
+                                   range(first_seed, first_seed + 2 ** 48),
+                                   deadline)
+            self._count(size, tried, found is not None)
+        else:
+            found = self._search_parallel(size, row, col, first_seed,
+                                          deadline)
+
+        stats = self.stats.get(size) or NoGuessStats(0, 0, 0, 0, 0.)
+        self.stats[size] = stats._replace(
+            boards=stats.boards + (found is not None),
+            timeouts=stats.timeouts + (found is None),
+            seconds=stats.seconds + perf_counter() - start
+            )
+
+        return found
+
+    def success_rate(self, rows, cols, mines):
+        """
+        Gets the share of the candidates of the size cleared
+        without guessing.
+
+        :param rows: Number of Minesweeper grid rows.
+        :type rows: int
+        :param cols: Number of Minesweeper grid columns.
+        :type cols: int
+        :param mines: Number of Minesweeper mines in the grid.
+        :type mines: int
+        :return: Success rate, None if no candidate was tried.
+        :rtype: float/None
+        """
+
+        stats = self.stats.get((rows, cols, mines))
+        if stats is None or not stats.candidates:
+            return None
+
+        return stats.solvable / stats.candidates
+
+    def close(self):
+        """
+        Stops the worker processes, once their batches are done.
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._collect(list(self._running))
+            self._executor = None
+
+    def _search_parallel(self, size, row, col, first_seed, deadline):
+        """
+        Tries batches of candidates on every worker until one
+        batch finds a board or the deadline passes.
+
+        :param size: Rows, columns and mines of the board.
+        :type size: tuple
+        :param row: First selected field's row.
+        :type row: int
+        :param col: First selected field's column.
+        :type col: int
+        :param first_seed: Seed of the first candidate.
+        :type first_seed: int
+        :param deadline: Time the search stops at, as time() returns it.
+        :type deadline: float
+        :return: Seed of the found board, None if the time ran out.
+        :rtype: int/None
+        """
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers)
+
+        pending = set()
+        next_seed = first_seed
+
+        while True:
+            # Two batches per worker keep the workers busy while
+            # the results are collected.
+            while len(pending) < 2 * self.workers and time() < deadline:
+                seeds = range(next_seed, next_seed + self.batch_size)
+                next_seed += self.batch_size
+
+                future = self._executor.submit(_search, *size, row, col,
+                                               seeds, deadline)
+                self._running[future] = size
+                pending.add(future)
+
+            if not pending:
+                return None
+
+            done, pending = wait(pending, max(0., deadline - time()),
+                                 FIRST_COMPLETED)
+            found = self._collect(done)
+
+            if found is not None or time() >= deadline:
+                for future in pending:
+                    future.cancel()
+                return found
+
+    def _collect(self, futures):
+        """
+        Counts the results of the finished batches in the stats.
+
+        :param futures: Batches to collect, the ones not done yet
+            are left running.
+        :type futures: list
+        :return: Seed of a found board, None if there is none.
+        :rtype: int/None
+        """
+
+        found = None
+
+        for future in futures:
+            if not future.done():
+                continue
+
+            size = self._running.pop(future)
+            if future.cancelled():
+                continue
+
+            seed, tried = future.result()
+            self._count(size, tried, seed is not None)
+            if found is None:
+                found = seed
+
+        # Batches of the previous searches finished meanwhile.
+        for future in [future for future in self._running
+                       if future.done()]:
+            size = self._running.pop(future)
+            if not future.cancelled():
+                seed, tried = future.result()
+                self._count(size, tried, seed is not None)
+
+        return found
+
+    def _count(self, size, tried, found):
+        """
+        Adds the tried candidates to the stats of the size.
+
+        :param size: Rows, columns and mines of the board.
+        :type size: tuple
+        :param tried: Number of candidates tried.
+        :type tried: int
+        :param found: True if a solvable candidate was found.
+        :type found: bool
+        """
+
+        stats = self.stats.get(size) or NoGuessStats(0, 0, 0, 0, 0.)
+        self.stats[size] = stats._replace(
+            candidates=stats.candidates + tried,
+            solvable=stats.solvable + found
+            )
@@ -10,27 +10,29 @@ Player action functionalities include:
     - validating,
     - handling the errors.
 
-The script requires:
-    - "user alert" module from the same directory, and it's class:
-        - PlayerActionAlert.
-
 The file contains following classes:
     - PlayerAction
 """
 
-from modules.user_alert import PlayerActionAlert
-
 
 class PlayerAction():
     """
     PlayerAction class with purpose of taking player input(action).
-    An action represents field selection and action taken on that field.
+    An action represents field selection and action taken on that field,
+    or with the "goto" action, the field the board view moves to.
+    The "hint" action takes no field, the returned row and column
+    are None.
     The class formats, validates and returns an action.
 
+    Actions can be given one per line or many per line separated
+    by ";".
+
     Public methods:
-        new_action()
+        parse_line()
     """
 
+    __slots__ = ("rows", "cols", "alerts", "arg_num")
+
     def __init__(self, rows, cols):
         """
         Constructor method.
@@ -47,39 +49,43 @@ class PlayerAction():
 
         # List of alerts.
         self.alerts = []
+        # Number of values of the last action.
+        self.arg_num = 0
 
-    def new_action(self):
+    def parse_line(self, line):
         """
-        Takes player input, and preforms formatting
-        and validation on the input.
-
-        :raises ValueError: ValueError for incorrect input.
-        :return: Formatted tuple of input values.
-        :rtype: tuple
+        Formats and validates the actions of the line.
+        Actions are separated by ";", e.g. "3 4; flag 5 6; 7 8".
+
+        :param line: Line of player actions.
+        :type line: str
+        :raises ValueError: ValueError for incorrect action, alerts
+            of the action are kept in alerts.
+        :return: Formatted tuples of action values.
+        :rtype: list
         """
 
-        while True:
-            try:
-                pl_action = input("\nDisplay or flag the field: \n\t")
-                pl_action = pl_action.replace(',', ' ').split()
+        commands = [command.replace(',', ' ').split()
+                    for command in line.split(';')]
+        # Empty commands between separators are skipped,
+        # an empty line is a single incorrect action.
+        commands = [command for command in commands if command] or [[]]
 
-                self.alerts = []
-                formatted_action = self._format(pl_action)
+        actions = []
 
-                # If it's validated break the loop.
-                if self._validation(formatted_action):
-                    return (formatted_action.get("action"),
-                            formatted_action.get("row"),
-                            formatted_action.get("col"))
+        for pl_action in commands:
+            self.alerts = []
+            self.arg_num = len(pl_action)
+            formatted_action = self._format(pl_action)
 
-                raise ValueError
+            if not self._validation(formatted_action):
+                raise ValueError(f"Incorrect action: {' '.join(pl_action)}")
+
+            actions.append((formatted_action.get("action"),
+                            formatted_action.get("row"),
+                            formatted_action.get("col")))
 
-            except ValueError:
-                PlayerActionAlert(self.rows,
-                                  self.cols,
-                                  self.alerts,
-                                  len(pl_action)).call_alert()
-                return ()
+        return actions
 
     def _format(self, pl_action):
         """
@@ -92,6 +98,8 @@ class PlayerAction():
         """
 
         match len(pl_action):
+            case 1 if pl_action[0] == "hint":
+                return {"action": "hint", "row": None, "col": None}
             case 2:
                 # Return formatted values.
                 return self._formatted("display", pl_action[0], pl_action[1])
@@ -109,7 +117,7 @@ class PlayerAction():
         """
         Checks action and field values.
 
-        :param action: Represents user action: display/flag.
+        :param action: Represents user action: display/flag/goto/hint.
         :type action: string
         :param row: Represents user selected board row.
         :type row: string
@@ -153,7 +161,9 @@ class PlayerAction():
         if pl_action:
             # Check if values are correct.
             self._check_action_val(pl_action.get("action"))
-            self._check_field_vals(pl_action.get("row"), pl_action.get("col"))
+            if pl_action.get("action") != "hint":
+                self._check_field_vals(pl_action.get("row"),
+                                       pl_action.get("col"))
 
             # No errors = validation passed!
             if not self.alerts:
@@ -163,13 +173,13 @@ class PlayerAction():
 
     def _check_action_val(self, action):
         """
-        Checks if action value is "display" or "flag".
+        Checks if action value is "display", "flag", "goto" or "hint".
 
-        :param action: Player selected action: display/flag.
+        :param action: Player selected action: display/flag/goto/hint.
         :type action: str
         """
 
-        if action not in ("display", "flag"):
+        if action not in ("display", "flag", "goto", "hint"):
             self.alerts.append("action val")
 
     def _check_field_vals(self, row, col):
@@ -0,0 +1,489 @@
+"""
+Probability.
+
+Probability module represents the mine probability engine of the game
+and is in charge of computing every hidden field's chance of being
+a mine.
+
+The engine builds on the hint solver's constraints:
+    - fields decided by the solver are mines or safe for certain,
+    - undecided fields of the constraints form the frontier, split into
+        components that share no constraints, so each is enumerated
+        on it's own,
+    - every other hidden field is unconstrained, it's chance is the
+        same for all of them.
+Each component's solutions are counted by the number of mines they
+use, and weighted by the ways the remaining mines fit among the
+unconstrained fields.
+
+Component counts are memoized by their constraints, so after a move
+only the components next to it are enumerated again. Enumeration has
+a node budget and a timeout, a component over budget is treated as
+unconstrained and the result is marked inexact.
+
+The script requires:
+    - Built in utility "math" and it's functions "lgamma" and "exp"
+        for counting the mine placements.
+    - Built in utility "time" and it's method "perf_counter"
+        for the timeout.
+    - Built in utility "collections" and it's function "namedtuple"
+        for the results.
+    - "consts" module from same directory and it's consts:
+        - HIDDEN - represents hidden value of the field.
+        - FLAG - represents flag value of the field.
+
+The file contains following classes:
+    - MineOdds
+    - MineProbability
+"""
+
+from math import lgamma, exp
+from time import perf_counter
+from collections import namedtuple
+from modules.consts import HIDDEN, FLAG
+
+
+# Default enumeration budget, in visited nodes per component and
+# seconds per call.
+MAX_NODES = 200000
+TIMEOUT = .25
+# Memoized components.
+CACHE_SIZE = 1024
+
+MineOdds = namedtuple("MineOdds", ["fields", "other", "exact"])
+MineOdds.__doc__ = """
+    MineOdds class is the mine chance of every hidden field.
+
+    fields - chance of the decided and frontier fields, keyed by their
+        flat index (row * cols + col),
+    other - chance of every other hidden field,
+    exact - False if a component was over the enumeration budget.
+    """
+
+
+class _BudgetExceeded(Exception):
+    """
+    Raised when the enumeration of a component is over budget.
+    """
+
+
+class MineProbability:
+    """
+    MineProbability class computes mine chances of a player board
+    from it's hint solver.
+
+    Public methods:
+        odds()
+        safest()
+    """
+
+    __slots__ = ("solver", "mines", "max_nodes", "timeout", "cache",
+                 "cache_hits", "cache_misses", "_deadline", "_nodes")
+
+    def __init__(self, solver, mines, max_nodes=MAX_NODES, timeout=TIMEOUT):
+        """
+        Constructor method.
+
+        :param solver: Hint solver of the player board, kept up to date
+            by the caller.
+        :type solver: Solver
+        :param mines: Number of mines on the board.
+        :type mines: int
+        :param max_nodes: Enumeration budget in visited nodes
+            per component.
+        :type max_nodes: int
+        :param timeout: Enumeration budget in seconds per call.
+        :type timeout: float
+        """
+
+        self.solver = solver
+        self.mines = mines
+        self.max_nodes = max_nodes
+        self.timeout = timeout
+
+        # Solution counts of the components, keyed by their constraints.
+        self.cache = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Enumeration budget of the current call and component.
+        self._deadline = 0.
+        self._nodes = 0
+
+    def odds(self):
+        """
+        Computes the mine chance of every hidden field.
+
+        :return: Mine chances.
+        :rtype: MineOdds
+        """
+
+        solver = self.solver
+        board, cols = solver.pl_board.board, solver.cols
+
+        def hidden(field):
+            return board[field // cols][field % cols] in (HIDDEN, FLAG)
+
+        mine_fields = solver.mines
+        safe_fields = [field for field in solver.safe if hidden(field)]
+        # Flags are hidden fields to the solver.
+        num_of_hidden = solver.pl_board.hidden_count + \
+            solver.pl_board.flag_count
+
+        fields = dict.fromkeys(mine_fields, 1.)
+        fields.update(dict.fromkeys(safe_fields, 0.))
+
+        self._deadline = perf_counter() + self.timeout
+        exact = True
+        components = []
+        frontier = 0
+
+        for constraints in self._components():
+            try:
+                components.append(self._count(constraints))
+                frontier += len(components[-1][0])
+            except _BudgetExceeded:
+                exact = False
+
+        remaining = self.mines - len(mine_fields)
+        others = num_of_hidden - len(mine_fields) - len(safe_fields) - \
+            frontier
+
+        # Solution counts by mines used, scaled to at most 1,
+        # the chances depend only on the ratios.
+        dists = [self._scaled(self._listed(solutions))
+                 for _, solutions, _ in components]
+
+        # Mines used by the components before every component.
+        prefixes = [[1.]]
+        for dist in dists:
+            prefixes.append(self._scaled(self._convolve(prefixes[-1], dist)))
+
+        # Ways the other fields take the rest of the mines.
+        weights = self._weights(others, remaining, len(prefixes[-1]))
+        total = sum(ways * weight
+                    for ways, weight in zip(prefixes[-1], weights))
+
+        if total == 0:
+            # Only possible for inexact results, every undecided field
+            # gets the same chance.
+            undecided = num_of_hidden - len(mine_fields) - len(safe_fields)
+            chance = remaining / undecided if undecided else 0.
+            for variables, _, _ in components:
+                fields.update(dict.fromkeys(variables, chance))
+            return MineOdds(fields, chance, False)
+
+        # Ways the components from the current one on and the other
+        # fields take the mines, by mines used before the current one.
+        suffix = weights
+        for i in reversed(range(len(components))):
+            variables, solutions, counts = components[i]
+            dist, prefix = dists[i], prefixes[i]
+
+            # Ways of everything else, by mines used by the component.
+            rest = [sum(prefix[m] * suffix[m + k] for m in range(len(prefix)))
+                    for k in range(len(dist))]
+            component_total = sum(ways * rest_ways
+                                  for ways, rest_ways in zip(dist, rest))
+
+            scale = max(solutions.values())
+            mine_counts = [0.] * len(variables)
+            for mines, field_counts in counts.items():
+                weight = rest[mines] / scale
+                if weight:
+                    for var, count in enumerate(field_counts):
+                        mine_counts[var] += count * weight
+
+            # Chances are clamped against rounding errors.
+            for var, field in enumerate(variables):
+                fields[field] = min(1., mine_counts[var] / component_total) \
+                    if component_total else 0.
+
+            suffix = self._scaled(
+                [sum(dist[k] * suffix[m + k] for k in range(len(dist)))
+                 for m in range(len(prefix))])
+
+        # Expected mines among the other fields.
+        other_mines = sum(ways * weight * (remaining - mines)
+                          for mines, (ways, weight)
+                          in enumerate(zip(prefixes[-1], weights)))
+        other = other_mines / total / others if others else 0.
+
+        return MineOdds(fields, other, exact)
+
+    def safest(self):
+        """
+        Gets the hidden field least likely to be a mine.
+
+        :return: Row, column and mine chance of the field, None if
+            there are no hidden fields.
+        :rtype: tuple/None
+        """
+
+        odds = self.odds()
+        solver = self.solver
+        board, cols = solver.pl_board.board, solver.cols
+        best = None
+
+        for field, chance in odds.fields.items():
+            if best is None or chance < best[1]:
+                best = field, chance
+
+        if best is None or odds.other < best[1]:
+            # First hidden field outside of the frontier.
+            for row in range(solver.rows):
+                for col, value in enumerate(board[row]):
+                    field = row * cols + col
+                    if value in (HIDDEN, FLAG) and field not in odds.fields:
+                        return row, col, odds.other
+
+        if best is None:
+            return None
+
+        return (*divmod(best[0], cols), best[1])
+
+    def _components(self):
+        """
+        Splits the solver's constraints into components that share
+        no undecided fields.
+
+        :return: Constraints of every component.
+        :rtype: list
+        """
+
+        parent = {}
+
+        def find(field):
+            while parent[field] != field:
+                parent[field] = parent[parent[field]]
+                field = parent[field]
+            return field
+
+        constraints = list(self.solver.constraints.values())
+
+        for undecided, _ in constraints:
+            first = None
+            for field in undecided:
+                parent.setdefault(field, field)
+                if first is None:
+                    first = find(field)
+                else:
+                    parent[find(field)] = first
+
+        components = {}
+        for constraint in constraints:
+            root = find(next(iter(constraint[0])))
+            components.setdefault(root, set()).add(constraint)
+
+        return list(components.values())
+
+    def _count(self, constraints):
+        """
+        Gets the memoized solution counts of the component,
+        enumerating it if it's not memoized.
+
+        :param constraints: Undecided fields and mines of every
+            constraint of the component.
+        :type constraints: set
+        :raises _BudgetExceeded: Enumeration is over budget.
+        :return: Fields of the component, number of solutions by
+            mines used, and mine count of every field by mines used.
+        :rtype: tuple
+        """
+
+        key = frozenset(constraints)
+
+        if key in self.cache:
+            self.cache_hits += 1
+            if self.cache[key] is None:
+                raise _BudgetExceeded
+            return self.cache[key]
+
+        if perf_counter() > self._deadline:
+            raise _BudgetExceeded
+
+        self.cache_misses += 1
+        self._nodes = 0
+        try:
+            result = self._enumerate(constraints)
+        except _BudgetExceeded:
+            # Over the node budget it will always be, over the time
+            # budget it may fit the next time.
+            if self._nodes > self.max_nodes:
+                self._memoize(key, None)
+            raise
+
+        self._memoize(key, result)
+
+        return result
+
+    def _memoize(self, key, result):
+        """
+        Memoizes the solution counts of the component, None if the
+        component is over the node budget.
+
+        :param key: Constraints of the component.
+        :type key: frozenset
+        :param result: Solution counts of the component.
+        :type result: tuple/None
+        """
+
+        if len(self.cache) >= CACHE_SIZE:
+            # Forget the oldest component.
+            del self.cache[next(iter(self.cache))]
+        self.cache[key] = result
+
+    def _enumerate(self, constraints):
+        """
+        Enumerates every mine placement of the component that
+        satisfies it's constraints.
+
+        :param constraints: Undecided fields and mines of every
+            constraint of the component.
+        :type constraints: set
+        :raises _BudgetExceeded: Enumeration is over budget.
+        :return: Fields of the component, number of solutions by
+            mines used, and mine count of every field by mines used.
+        :rtype: tuple
+        """
+
+        # Fields in the order of the constraints, so constraints
+        # are completed early and failures are found early.
+        constraints = sorted(constraints, key=lambda c: min(c[0]))
+        variables = list(dict.fromkeys(
+            field for undecided, _ in constraints
+            for field in sorted(undecided)))
+
+        if len(variables) > 900:
+            # Recursion would run too deep.
+            raise _BudgetExceeded
+
+        index = {field: var for var, field in enumerate(variables)}
+        var_constraints = [[] for _ in variables]
+        need = []
+        left = []
+        for i, (undecided, mines) in enumerate(constraints):
+            for field in undecided:
+                var_constraints[index[field]].append(i)
+            need.append(mines)
+            left.append(len(undecided))
+
+        assignment = [0] * len(variables)
+        solutions = {}
+        counts = {}
+
+        def visit(var, mines):
+            self._nodes += 1
+            if self._nodes > self.max_nodes or \
+                    (not self._nodes & 1023 and
+                     perf_counter() > self._deadline):
+                raise _BudgetExceeded
+
+            if var == len(variables):
+                solutions[mines] = solutions.get(mines, 0) + 1
+                mine_counts = counts.setdefault(mines, [0] * len(variables))
+                for i, value in enumerate(assignment):
+                    mine_counts[i] += value
+                return
+
+            for value in (0, 1):
+                for i in var_constraints[var]:
+                    left[i] -= 1
+                    need[i] -= value
+
+                if all(0 <= need[i] <= left[i] for i in var_constraints[var]):
+                    assignment[var] = value
+                    visit(var + 1, mines + value)
+
+                for i in var_constraints[var]:
+                    left[i] += 1
+                    need[i] += value
+
+            assignment[var] = 0
+
+        visit(0, 0)
+
+        return variables, solutions, counts
+
+    def _listed(self, solutions):
+        """
+        Gets the solution counts as a list indexed by mines used.
+
+        :param solutions: Number of solutions by mines used.
+        :type solutions: dict
+        :return: Number of solutions by mines used.
+        :rtype: list
+        """
+
+        listed = [0] * (max(solutions) + 1)
+        for mines, ways in solutions.items():
+            listed[mines] = ways
+
+        return listed
+
+    def _scaled(self, values):
+        """
+        Scales the values so the largest one is 1.
+
+        :param values: Non negative values.
+        :type values: list
+        :return: Scaled values.
+        :rtype: list
+        """
+
+        top = max(values)
+        if not top:
+            return [0.] * len(values)
+
+        return [value / top for value in values]
+
+    def _convolve(self, first, second):
+        """
+        Combines the solution counts of independent components.
+
+        :param first: Number of solutions by mines used.
+        :type first: list
+        :param second: Number of solutions by mines used.
+        :type second: list
+        :return: Number of combined solutions by mines used.
+        :rtype: list
+        """
+
+        combined = [0.] * (len(first) + len(second) - 1)
+
+        for mines, ways in enumerate(first):
+            if ways:
+                for more_mines, more_ways in enumerate(second):
+                    combined[mines + more_mines] += ways * more_ways
+
+        return combined
+
+    def _weights(self, fields, mines, size):
+        """
+        Gets the relative number of ways the rest of the mines fit
+        among the fields, for every number of mines used elsewhere.
+        Computed in log space, the numbers of ways don't fit
+        in a float on large boards.
+
+        :param fields: Number of fields.
+        :type fields: int
+        :param mines: Number of mines.
+        :type mines: int
+        :param size: Number of the mines used elsewhere counts.
+        :type size: int
+        :return: Relative ways, scaled so the largest one is 1.
+        :rtype: list
+        """
+
+        logs = [lgamma(fields + 1) - lgamma(mines - used + 1) -
+                lgamma(fields - mines + used + 1)
+                if 0 <= mines - used <= fields else None
+                for used in range(size)]
+
+        valid = [log for log in logs if log is not None]
+        if not valid:
+            return [0.] * size
+
+        top = max(valid)
+
+        return [exp(log - top) if log is not None else 0. for log in logs]
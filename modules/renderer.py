@@ -0,0 +1,299 @@
+"""
+Renderer.
+
+Renderer module represents the terminal renderer of the game and is
+in charge of drawing the board and the footer.
+
+The renderer keeps the last drawn frame. The first frame, or a frame
+after invalidation, clears the screen and draws everything.
+Every later frame moves the cursor with ANSI escape codes and rewrites
+only the fields that changed since the last frame, followed by
+the footer.
+
+The script requires:
+    - Built in utility "sys" for writing to the standard output.
+    - Built in utility "shutil" for getting the terminal size, unless
+        the size is given.
+    - Built in utility "time" and it's method "sleep" for delay.
+
+The file contains following classes:
+    - DiffRenderer
+"""
+
+import sys
+import shutil
+from time import sleep
+
+
+# ANSI escape codes.
+CLEAR_SCREEN = '\033[H\033[2J'
+CLEAR_BELOW = '\033[J'
+
+# Terminal lines above the board rows, for the column indicators.
+HEADER_LINES = 2
+# Terminal lines under the board rows, for the footer, viewport
+# and hint.
+FOOTER_LINES = 4
+# Terminal lines kept free under the footer for the player input.
+INPUT_LINES = 4
+
+
+class DiffRenderer:
+    """
+    DiffRenderer class draws the board, repainting only changed fields.
+
+    Boards larger than the terminal are drawn through a viewport,
+    a window of the board that fits the screen. Only the fields in
+    the viewport are read and drawn, so drawing cost depends on the
+    screen size, not on the board size.
+
+    Public methods:
+        render()
+        invalidate()
+        pan_to()
+        follow()
+    """
+
+    __slots__ = ("out", "size", "frame", "window", "top", "left", "center",
+                 "focus", "frame_bytes", "total_bytes", "frames")
+
+    def __init__(self, out=None, size=None):
+        """
+        Constructor method.
+
+        :param out: Stream the frames are written to, standard
+            output if None.
+        :type out: file object
+        :param size: Columns and lines of the terminal the frames are
+            drawn on, the size of the process' terminal if None.
+        :type size: tuple/None
+        """
+
+        self.out = out
+        self.size = size
+
+        # Printed fields and viewport (top, left, height, width)
+        # of the last frame.
+        self.frame = None
+        self.window = None
+
+        # First row and column of the viewport.
+        self.top = 0
+        self.left = 0
+        # Field to center the viewport on, field to keep in viewport.
+        self.center = None
+        self.focus = None
+
+        # Bytes written by the last frame and in total.
+        self.frame_bytes = 0
+        self.total_bytes = 0
+        self.frames = 0
+
+    def render(self, board, footer):
+        """
+        Draws the board and the footer.
+
+        :param board: Board to draw.
+        :type board: Board
+        :param footer: Footer displayed under the board.
+        :type footer: str
+        """
+
+        window = self._window(board)
+        top, left, height, width = window
+
+        fields = [board.fields_to_print(row, left, width)
+                  for row in range(top, top + height)]
+
+        if height < board.rows or width < board.cols:
+            footer += (f"\n\033[37;2mVIEW: rows {top + 1}-{top + height}"
+                       f" of {board.rows}, cols {left + 1}-{left + width}"
+                       f" of {board.cols}\033[0m")
+
+        if self._fits(height) and self.frame is not None and \
+                window == self.window:
+            self._write([self._diff(board, fields),
+                         self._footer(height, footer)])
+        else:
+            # Rows appear one by one on the first frame.
+            self._write(self._repaint(board, window) + [f'{footer}\n'],
+                        delay=board.initial_run)
+            board.initial_run = False
+
+        self.frame = fields
+        self.window = window
+
+    def invalidate(self):
+        """
+        Forgets the last frame, the next frame is drawn from scratch.
+        Needed whenever something else was written to the screen.
+        """
+
+        self.frame = None
+
+    def pan_to(self, row, col):
+        """
+        Centers the viewport on the field from the next frame.
+
+        :param row: Field row of the grid.
+        :type row: int
+        :param col: Field column of the grid.
+        :type col: int
+        """
+
+        self.center = (row, col)
+
+    def follow(self, row, col):
+        """
+        Moves the viewport as little as needed for the field
+        to be visible from the next frame.
+
+        :param row: Field row of the grid.
+        :type row: int
+        :param col: Field column of the grid.
+        :type col: int
+        """
+
+        self.focus = (row, col)
+
+    def _window(self, board):
+        """
+        Gets the viewport fitting the terminal, moved to the centered
+        or followed field.
+
+        :param board: Board to draw.
+        :type board: Board
+        :return: First row, first column, height and width.
+        :rtype: tuple
+        """
+
+        columns, lines = self.size or shutil.get_terminal_size()
+
+        height = max(1, min(board.rows, lines - HEADER_LINES -
+                            FOOTER_LINES - INPUT_LINES))
+        width = max(1, min(board.cols, (columns - board.indicator_width) //
+                           board.cell_width))
+
+        if self.center is not None:
+            self.top = self.center[0] - height // 2
+            self.left = self.center[1] - width // 2
+            self.center = None
+
+        if self.focus is not None:
+            row, col = self.focus
+            self.top = min(max(self.top, row - height + 1), row)
+            self.left = min(max(self.left, col - width + 1), col)
+            self.focus = None
+
+        self.top = min(max(self.top, 0), board.rows - height)
+        self.left = min(max(self.left, 0), board.cols - width)
+
+        return self.top, self.left, height, width
+
+    def _repaint(self, board, window):
+        """
+        Gets the whole frame, starting with clearing the screen.
+
+        :param board: Board to draw.
+        :type board: Board
+        :param window: Viewport of the frame.
+        :type window: tuple
+        :return: Lines of the frame.
+        :rtype: list
+        """
+
+        top, left, height, width = window
+
+        return [CLEAR_SCREEN + board.col_indicators(left, width)] + \
+            [board.row_to_print(row, left, width)
+             for row in range(top, top + height)]
+
+    def _diff(self, board, fields):
+        """
+        Gets the cursor moves and fields that changed since
+        the last frame.
+
+        :param board: Board to draw.
+        :type board: Board
+        :param fields: Printed fields of the frame.
+        :type fields: list
+        :return: Escape codes and fields to write.
+        :rtype: str
+        """
+
+        changes = []
+
+        for row, (row_fields, last_fields) in \
+                enumerate(zip(fields, self.frame)):
+            if row_fields == last_fields:
+                continue
+
+            for col, field in enumerate(row_fields):
+                if field != last_fields[col]:
+                    # Rows start under the column indicators,
+                    # fields after the row indicators.
+                    line = HEADER_LINES + 1 + row
+                    column = board.indicator_width + 1 + \
+                        col * board.cell_width
+                    changes.append(f'\033[{line};{column}H{field}')
+
+        return ''.join(changes)
+
+    def _footer(self, height, footer):
+        """
+        Gets the footer moved under the board, clearing everything
+        written after the last frame.
+
+        :param height: Number of drawn rows.
+        :type height: int
+        :param footer: Footer displayed under the board.
+        :type footer: str
+        :return: Escape codes and the footer to write.
+        :rtype: str
+        """
+
+        line = HEADER_LINES + 1 + height
+
+        return f'\033[{line};1H{CLEAR_BELOW}{footer}\n'
+
+    def _fits(self, height):
+        """
+        Checks if the frame and player input fit on the screen,
+        otherwise the screen scrolls and cursor positions are lost.
+
+        :param height: Number of drawn rows.
+        :type height: int
+        :return: True if the frame fits, False otherwise.
+        :rtype: bool
+        """
+
+        lines = self.size[1] if self.size else \
+            shutil.get_terminal_size().lines
+
+        return HEADER_LINES + height + FOOTER_LINES + INPUT_LINES <= lines
+
+    def _write(self, parts, delay=False):
+        """
+        Writes the frame parts to the stream and flushes it,
+        in one write unless the parts are delayed.
+
+        :param parts: Parts of the frame.
+        :type parts: list
+        :param delay: Delay between writing the parts.
+        :type delay: bool
+        """
+
+        out = self.out or sys.stdout
+
+        if delay:
+            for part in parts:
+                out.write(part)
+                out.flush()
+                sleep(.05)
+        else:
+            out.write(''.join(parts))
+            out.flush()
+
+        self.frame_bytes = sum(len(part.encode()) for part in parts)
+        self.total_bytes += self.frame_bytes
+        self.frames += 1
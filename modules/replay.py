@@ -0,0 +1,280 @@
+"""
+Replay.
+
+Replay module represents recorded games and is in charge of
+recording, storing and replaying them.
+
+Replay functionalities include:
+    - recording the moves of a game,
+    - writing and reading replay files,
+    - replaying a game through the engine at full speed.
+
+A replay file holds:
+    - MAGIC and VERSION,
+    - rows, cols, mines and the seed of the game,
+    - the mine fields of the board, sorted and delta encoded,
+    - the moves, each as action and field, followed by the time
+        passed since the previous move in milliseconds.
+Every number is an unsigned varint, 7 bits per byte with the high
+bit set on every byte but the last, so most moves take 2 to 4 bytes.
+
+The script requires:
+    - Built in utility "collections" and it's function "namedtuple"
+        for the replays.
+    - "engine" module from the same directory, and it's class:
+        - GameEngine,
+      and it's consts:
+        - ACTIONS - moves the engine can make,
+        - PLAYING - state of the game being played.
+
+The file contains following classes:
+    - Replay
+    - ReplayRecorder
+
+Functions:
+    - encode_varint()
+    - decode_varint()
+    - write_replay()
+    - read_replay()
+    - play_replay()
+"""
+
+from collections import namedtuple
+from modules.engine import GameEngine, ACTIONS, PLAYING
+
+
+# Replay file signature and format version.
+MAGIC = b"MSRP"
+VERSION = 1
+
+Replay = namedtuple("Replay",
+                    ["rows", "cols", "mines", "seed", "mine_fields", "moves"])
+Replay.__doc__ = """
+    Replay class is a recorded game.
+
+    rows, cols, mines - size of the game,
+    seed - seed of the mine placement, None if it was random,
+    mine_fields - flat indexes (row * cols + col) of the mine fields,
+        empty if the board was never generated,
+    moves - (action, row, col, milliseconds since the previous move)
+        tuples.
+    """
+
+
+class ReplayRecorder:
+    """
+    ReplayRecorder class records the moves of the engine's game.
+
+    Public methods:
+        record()
+        replay()
+    """
+
+    def __init__(self, engine):
+        """
+        Constructor method.
+
+        :param engine: Engine playing the recorded game, the game
+            must be created already.
+        :type engine: GameEngine
+        """
+
+        self.engine = engine
+        self.moves = []
+        # Time of the previous move, or of the game start.
+        self.last_time = engine.timer_start
+
+    def record(self, action, row, col):
+        """
+        Records the move made by the engine.
+
+        :param action: Move made: display/flag.
+        :type action: str
+        :param row: Selected field's row.
+        :type row: int
+        :param col: Selected field's column.
+        :type col: int
+        """
+
+        now = self.engine.clock()
+        delay = max(0, round((now - self.last_time) * 1000))
+        self.last_time = now
+
+        self.moves.append((action, row, col, delay))
+
+    def replay(self):
+        """
+        Gets the recorded game.
+
+        :return: Recorded game.
+        :rtype: Replay
+        """
+
+        engine = self.engine
+        mine_fields = engine.gm_board.mine_fields \
+            if engine.gm_board.generated else []
+
+        return Replay(engine.rows, engine.cols, engine.mines,
+                      engine.gm_board.seed, sorted(mine_fields),
+                      list(self.moves))
+
+
+def encode_varint(value, out):
+    """
+    Appends the unsigned varint of the value.
+
+    :param value: Non negative value.
+    :type value: int
+    :param out: Encoded bytes.
+    :type out: bytearray
+    """
+
+    while value > 0x7f:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+
+    out.append(value)
+
+
+def decode_varint(data, pos):
+    """
+    Reads the unsigned varint at the position.
+
+    :param data: Encoded bytes.
+    :type data: bytes
+    :param pos: Position of the varint.
+    :type pos: int
+    :raises ValueError: Data ends inside of the varint.
+    :return: Value and position after the varint.
+    :rtype: tuple
+    """
+
+    value = shift = 0
+
+    while True:
+        if pos >= len(data):
+            raise ValueError("Replay data is truncated.")
+
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        shift += 7
+
+        if not byte & 0x80:
+            return value, pos
+
+
+def write_replay(path, replay):
+    """
+    Writes the replay file.
+
+    :param path: Path of the replay file.
+    :type path: str
+    :param replay: Recorded game.
+    :type replay: Replay
+    """
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+
+    # Seed is stored shifted by one, 0 stands for a random seed.
+    seed = 0 if replay.seed is None or replay.seed < 0 else replay.seed + 1
+    for value in (replay.rows, replay.cols, replay.mines, seed,
+                  len(replay.mine_fields), len(replay.moves)):
+        encode_varint(value, out)
+
+    previous = 0
+    for field in sorted(replay.mine_fields):
+        encode_varint(field - previous, out)
+        previous = field
+
+    for action, row, col, delay in replay.moves:
+        field = row * replay.cols + col
+        encode_varint(field * len(ACTIONS) + ACTIONS.index(action), out)
+        encode_varint(delay, out)
+
+    with open(path, "wb") as replay_file:
+        replay_file.write(out)
+
+
+def read_replay(path):
+    """
+    Reads the replay file.
+
+    :param path: Path of the replay file.
+    :type path: str
+    :raises ValueError: File is not a replay of a known version.
+    :return: Recorded game.
+    :rtype: Replay
+    """
+
+    with open(path, "rb") as replay_file:
+        data = replay_file.read()
+
+    if data[:len(MAGIC)] != MAGIC or data[len(MAGIC):len(MAGIC) + 1] != \
+            bytes([VERSION]):
+        raise ValueError(f"{path} is not a version {VERSION} replay.")
+
+    pos = len(MAGIC) + 1
+    header = []
+    for _ in range(6):
+        value, pos = decode_varint(data, pos)
+        header.append(value)
+
+    rows, cols, mines, seed, num_of_mine_fields, num_of_moves = header
+
+    mine_fields = []
+    field = 0
+    for _ in range(num_of_mine_fields):
+        delta, pos = decode_varint(data, pos)
+        field += delta
+        mine_fields.append(field)
+
+    moves = []
+    for _ in range(num_of_moves):
+        code, pos = decode_varint(data, pos)
+        delay, pos = decode_varint(data, pos)
+        field, action = divmod(code, len(ACTIONS))
+        moves.append((ACTIONS[action], *divmod(field, cols), delay))
+
+    return Replay(rows, cols, mines, seed - 1 if seed else None,
+                  mine_fields, moves)
+
+
+def play_replay(replay, engine=None, on_step=None):
+    """
+    Plays the recorded game through the engine at full speed.
+    The engine's clock follows the recorded time, so the replayed
+    game gets the recorded score.
+
+    :param replay: Recorded game.
+    :type replay: Replay
+    :param engine: Engine to play the game with, a new
+        GameEngine if None.
+    :type engine: GameEngine/None
+    :param on_step: Called with the move number and result
+        after every move.
+    :type on_step: function/None
+    :return: Result of the last move.
+    :rtype: StepResult
+    """
+
+    engine = engine or GameEngine()
+    # Recorded time in seconds.
+    clock = [0.]
+    engine.clock = lambda: clock[0]
+
+    result = engine.new_game(replay.rows, replay.cols, replay.mines,
+                             replay.seed, replay.mine_fields or None)
+
+    for move, (action, row, col, delay) in enumerate(replay.moves, 1):
+        if engine.state != PLAYING:
+            break
+
+        clock[0] += delay / 1000
+        result = engine.step(action, row, col)
+
+        if on_step is not None:
+            on_step(move, result)
+
+    return result
@@ -0,0 +1,321 @@
+"""
+Snapshot.
+
+Snapshot module represents saved games and is in charge of
+suspending and resuming them.
+
+Snapshot functionalities include:
+    - dumping the full state of the engine's game to bytes,
+    - restoring the game from the bytes,
+    - storing the snapshots by session.
+
+A snapshot holds:
+    - MAGIC and VERSION,
+    - rows, cols, mines and the seed of the game,
+    - state, score and remaining flags of the game, elapsed time
+        in milliseconds and the viewport of the game,
+    - whether the board is generated,
+    - the mine fields of the board, sorted and delta encoded,
+    - player board counters and visibility and flag bits of every
+        field of the player board, unless the game is won.
+Numbers are varints as in replays, score and flags, which can be
+negative, are zigzag encoded first. The game board values are computed
+from the mine fields on restore, so a snapshot takes about a quarter
+of a byte per field.
+
+The script requires:
+    - Built in utility "os" for the snapshot files.
+    - Built in utility "re" for checking the session keys.
+    - "engine" module from the same directory, and it's consts:
+        - PLAYING, WON, LOST - game states.
+    - "replay" module from the same directory, and it's functions:
+        - encode_varint,
+        - decode_varint.
+    - "const" module from the same directory and it's consts:
+        - HIDDEN - represents hidden value of the field,
+        - FLAG - represents flag value of the field.
+
+The file contains following classes:
+    - SnapshotStore
+
+Functions:
+    - zigzag()
+    - unzigzag()
+    - dump_snapshot()
+    - restore_snapshot()
+"""
+
+import os
+import re
+from modules.engine import PLAYING, WON, LOST
+from modules.replay import encode_varint, decode_varint
+from modules.consts import HIDDEN, FLAG
+
+
+# Snapshot signature and format version.
+MAGIC = b"MSSN"
+VERSION = 1
+
+# Game states in the order of their codes.
+STATES = (PLAYING, WON, LOST)
+
+# Session keys are used as file names.
+SESSION_KEY = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def zigzag(value):
+    """
+    Maps the signed value to an unsigned one, 0, -1, 1, -2, ...
+    to 0, 1, 2, 3, ...
+
+    :param value: Signed value.
+    :type value: int
+    :return: Unsigned value.
+    :rtype: int
+    """
+
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value):
+    """
+    Maps the unsigned value back to the signed one.
+
+    :param value: Unsigned value.
+    :type value: int
+    :return: Signed value.
+    :rtype: int
+    """
+
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def dump_snapshot(engine, view=(0, 0)):
+    """
+    Dumps the full state of the engine's game.
+
+    :param engine: Engine playing the game.
+    :type engine: GameEngine
+    :param view: First row and column of the game's viewport.
+    :type view: tuple
+    :return: Snapshot of the game.
+    :rtype: bytes
+    """
+
+    gm_board = engine.gm_board
+    # Won game shows the game board, player board is kept by the engine.
+    pl_board = engine.pl_board if engine.state != WON else None
+    size = engine.rows * engine.cols
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+
+    seed = 0 if gm_board.seed is None or gm_board.seed < 0 \
+        else gm_board.seed + 1
+    elapsed = max(0, round((engine.clock() - engine.timer_start) * 1000))
+    mine_fields = sorted(gm_board.mine_fields) if gm_board.generated else []
+
+    for value in (engine.rows, engine.cols, engine.mines, seed,
+                  STATES.index(engine.state), zigzag(engine.score or 0),
+                  zigzag(engine.flags), elapsed,
+                  view[0], view[1], int(gm_board.generated),
+                  len(mine_fields)):
+        encode_varint(value, out)
+
+    previous = 0
+    for field in mine_fields:
+        encode_varint(field - previous, out)
+        previous = field
+
+    if pl_board is None:
+        return bytes(out)
+
+    for value in (pl_board.hidden_count, pl_board.flag_count,
+                  pl_board.mines_flagged):
+        encode_varint(value, out)
+
+    if pl_board.compact:
+        visible = pl_board.board.visible
+        flagged = pl_board.board.flagged
+    else:
+        visible = bytearray((size + 7) // 8)
+        flagged = bytearray((size + 7) // 8)
+        field = 0
+        for row in pl_board.board:
+            for value in row:
+                if value == FLAG:
+                    flagged[field >> 3] |= 1 << (field & 7)
+                elif value != HIDDEN:
+                    visible[field >> 3] |= 1 << (field & 7)
+                field += 1
+
+    return bytes(out + visible + flagged)
+
+
+def restore_snapshot(data, engine):
+    """
+    Restores the game of the snapshot to the engine.
+
+    :param data: Snapshot of the game.
+    :type data: bytes
+    :param engine: Engine to play the restored game.
+    :type engine: GameEngine
+    :raises ValueError: Data is not a snapshot of a known version.
+    :return: First row and column of the game's viewport.
+    :rtype: tuple
+    """
+
+    if data[:len(MAGIC)] != MAGIC or data[len(MAGIC):len(MAGIC) + 1] != \
+            bytes([VERSION]):
+        raise ValueError(f"Data is not a version {VERSION} snapshot.")
+
+    pos = len(MAGIC) + 1
+    header = []
+    for _ in range(12):
+        value, pos = decode_varint(data, pos)
+        header.append(value)
+
+    rows, cols, mines, seed, state, score, flags, elapsed, top, left, \
+        generated, num_of_mine_fields = header
+
+    mine_fields = []
+    field = 0
+    for _ in range(num_of_mine_fields):
+        delta, pos = decode_varint(data, pos)
+        field += delta
+        mine_fields.append(field)
+
+    engine.new_game(rows, cols, mines, seed - 1 if seed else None,
+                    mine_fields if generated else None)
+
+    engine.state = STATES[state]
+    engine.score = unzigzag(score) if engine.state != PLAYING else None
+    engine.timer_start = engine.clock() - elapsed / 1000
+    engine.flags = unzigzag(flags)
+
+    if engine.state == WON:
+        engine.pl_board = engine.gm_board
+        return top, left
+
+    pl_board = engine.pl_board
+    counters = []
+    for _ in range(3):
+        value, pos = decode_varint(data, pos)
+        counters.append(value)
+
+    pl_board.hidden_count, pl_board.flag_count, pl_board.mines_flagged = \
+        counters
+
+    size = rows * cols
+    num_of_bytes = (size + 7) // 8
+    visible = data[pos:pos + num_of_bytes]
+    flagged = data[pos + num_of_bytes:pos + 2 * num_of_bytes]
+
+    if len(flagged) != num_of_bytes:
+        raise ValueError("Snapshot data is truncated.")
+
+    if pl_board.compact:
+        pl_board.board.visible[:] = visible
+        pl_board.board.flagged[:] = flagged
+    else:
+        board, gm_board = pl_board.board, engine.gm_board.board
+        for byte in range(num_of_bytes):
+            # Most bytes of a game in progress are hidden fields.
+            if not visible[byte] | flagged[byte]:
+                continue
+
+            for field in range(byte << 3, min(size, (byte + 1) << 3)):
+                bit = 1 << (field & 7)
+                row, col = divmod(field, cols)
+                if flagged[byte] & bit:
+                    board[row][col] = FLAG
+                elif visible[byte] & bit:
+                    board[row][col] = gm_board[row][col]
+
+    return top, left
+
+
+class SnapshotStore:
+    """
+    SnapshotStore class keeps one snapshot per session in a directory.
+    Snapshots are replaced atomically, a killed process leaves either
+    the previous or the new snapshot.
+
+    Public methods:
+        save()
+        load()
+        delete()
+    """
+
+    def __init__(self, directory):
+        """
+        Constructor method.
+
+        :param directory: Directory of the snapshot files.
+        :type directory: str
+        """
+
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, session, data):
+        """
+        Saves the snapshot of the session.
+
+        :param session: Session key.
+        :type session: str
+        :param data: Snapshot of the game.
+        :type data: bytes
+        """
+
+        path = self._path(session)
+
+        with open(f"{path}.tmp", "wb") as snapshot_file:
+            snapshot_file.write(data)
+
+        os.replace(f"{path}.tmp", path)
+
+    def load(self, session):
+        """
+        Loads the snapshot of the session.
+
+        :param session: Session key.
+        :type session: str
+        :return: Snapshot of the game, None if there is none.
+        :rtype: bytes/None
+        """
+
+        try:
+            with open(self._path(session), "rb") as snapshot_file:
+                return snapshot_file.read()
+        except FileNotFoundError:
+            return None
+
+    def delete(self, session):
+        """
+        Deletes the snapshot of the session, if there is one.
+
+        :param session: Session key.
+        :type session: str
+        """
+
+        try:
+            os.remove(self._path(session))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, session):
+        """
+        Gets the path of the session's snapshot.
+
+        :param session: Session key.
+        :type session: str
+        :raises ValueError: Session key can't be used as a file name.
+        :return: Path of the snapshot file.
+        :rtype: str
+        """
+
+        if not SESSION_KEY.fullmatch(session):
+            raise ValueError(f"Invalid session key: {session!r}")
+
+        return os.path.join(self.directory, f"{session}.snap")
@@ -0,0 +1,266 @@
+"""
+Solver.
+
+Solver module represents the hint solver of the game and is in charge
+of finding the fields that are certainly safe or certainly mines.
+
+The solver reads only what the player sees. Every displayed number
+next to undecided HIDDEN fields is a constraint; the number of mines
+among those fields. An EMPTY field is a number 0, the flood fill
+stops at flags, so a flagged field next to it is certainly safe.
+Constraints are solved by:
+    - single field propagation - if a constraint has no mines left all
+        it's fields are safe, if it has as many mines as fields all
+        of them are mines,
+    - subset propagation - if the fields of one constraint are a subset
+        of another's, the remaining fields of the other hold the
+        difference of their mines.
+Player flags are not trusted, flagged fields are undecided until
+the solver decides them.
+
+The solver is incremental, after a move only the constraints next to
+the revealed fields are checked again, and the propagation continues
+only through the constraints next to newly decided fields.
+
+The script requires:
+    - "consts" module from same directory and it's consts:
+        - HIDDEN - represents hidden value of the field.
+        - EMPTY - represents empty value of the field.
+        - FLAG - represents flag value of the field.
+
+The file contains following classes:
+    - Solver
+"""
+
+from modules.consts import HIDDEN, EMPTY, FLAG
+
+
+class Solver:
+    """
+    Solver class finds certain safe fields and mines of a player board.
+
+    Public methods:
+        rebuild()
+        update()
+        hint()
+    """
+
+    __slots__ = ("pl_board", "rows", "cols", "topology", "safe", "mines",
+                 "constraints")
+
+    def __init__(self, pl_board):
+        """
+        Constructor method.
+
+        :param pl_board: Player board to solve.
+        :type pl_board: PlayerBoard
+        """
+
+        self.pl_board = pl_board
+        self.rows = pl_board.rows
+        self.cols = pl_board.cols
+        self.topology = pl_board.topology
+
+        # Flat indexes (row * cols + col) of decided fields.
+        self.safe = set()
+        self.mines = set()
+        # Undecided fields and remaining mines of every constraint,
+        # keyed by the flat index of it's number field.
+        self.constraints = {}
+
+        self.rebuild()
+
+    def rebuild(self):
+        """
+        Solves the whole board from scratch, e.g. after the board
+        was restored or changed outside of update().
+        """
+
+        self.safe = set()
+        self.mines = set()
+        self.constraints = {}
+
+        # New game has no displayed numbers.
+        if self.pl_board.hidden_count == self.rows * self.cols:
+            return
+
+        self._propagate(set(range(self.rows * self.cols)))
+
+    def update(self, revealed):
+        """
+        Updates the solution after the move revealed the fields.
+
+        :param revealed: Newly revealed fields as (row, col) tuples.
+        :type revealed: list
+        """
+
+        dirty = set()
+
+        for row, col in revealed:
+            field = row * self.cols + col
+            self.safe.discard(field)
+            dirty.add(field)
+            dirty.update(self.topology.adjacent_fields(field))
+
+        self._propagate(dirty)
+
+    def hint(self):
+        """
+        Gets a move that is certainly right; displaying a safe field,
+        or flagging a mine that is not flagged yet.
+
+        :return: Action, row and column of the move, None if no field
+            is certain.
+        :rtype: tuple/None
+        """
+
+        for field in list(self.safe):
+            row, col = divmod(field, self.cols)
+            if self._value(field) in (HIDDEN, FLAG):
+                return "display", row, col
+
+            # Revealed without an update.
+            self.safe.discard(field)
+
+        for field in self.mines:
+            if self._value(field) == HIDDEN:
+                return ("flag", *divmod(field, self.cols))
+
+        return None
+
+    def _value(self, field):
+        """
+        Gets the field value the player sees.
+
+        :param field: Flat field index (row * cols + col).
+        :type field: int
+        :return: Field value.
+        :rtype: str/int
+        """
+
+        row, col = divmod(field, self.cols)
+
+        return self.pl_board.board[row][col]
+
+    def _constraint(self, field):
+        """
+        Gets the constraint of the field.
+
+        :param field: Flat field index (row * cols + col).
+        :type field: int
+        :return: Undecided fields and remaining mines, None if the
+            field is not a displayed number or EMPTY.
+        :rtype: tuple/None
+        """
+
+        value = self._value(field)
+        if value == EMPTY:
+            # Flood fill reveals every other neighbour, only the flags
+            # can be undecided, and they are safe.
+            if not self.pl_board.flag_count:
+                return None
+
+            board, cols = self.pl_board.board, self.cols
+            flags = [neighbour for neighbour in
+                     self.topology.adjacent_fields(field)
+                     if board[neighbour // cols][neighbour % cols] == FLAG]
+
+            return frozenset(flags).difference(self.safe), 0
+        if not isinstance(value, int):
+            return None
+
+        undecided = []
+        for neighbour in self.topology.adjacent_fields(field):
+            if neighbour in self.mines:
+                value -= 1
+            elif neighbour not in self.safe and \
+                    self._value(neighbour) in (HIDDEN, FLAG):
+                undecided.append(neighbour)
+
+        return frozenset(undecided), value
+
+    def _propagate(self, dirty):
+        """
+        Checks the constraints of the dirty fields until no
+        more fields can be decided.
+
+        :param dirty: Flat indexes of the fields to check.
+        :type dirty: set
+        """
+
+        while dirty:
+            field = dirty.pop()
+            constraint = self._constraint(field)
+
+            if constraint is None or not constraint[0]:
+                self.constraints.pop(field, None)
+                continue
+            if self.constraints.get(field) == constraint:
+                continue
+
+            self.constraints[field] = constraint
+            undecided, mines = constraint
+
+            if mines == 0:
+                self._decide(undecided, self.safe, dirty)
+            elif mines == len(undecided):
+                self._decide(undecided, self.mines, dirty)
+            else:
+                self._check_subsets(field, constraint, dirty)
+
+    def _check_subsets(self, field, constraint, dirty):
+        """
+        Compares the constraint with the constraints that can share
+        it's fields, the number fields at most 2 rows and columns away.
+
+        :param field: Flat index of the constraint's number field.
+        :type field: int
+        :param constraint: Undecided fields and remaining mines.
+        :type constraint: tuple
+        :param dirty: Flat indexes of the fields to check.
+        :type dirty: set
+        """
+
+        row, col = divmod(field, self.cols)
+        undecided, mines = constraint
+
+        for other_row in range(max(0, row - 2), min(self.rows, row + 3)):
+            for other_col in range(max(0, col - 2), min(self.cols, col + 3)):
+                other = self.constraints.get(other_row * self.cols +
+                                             other_col)
+                if other is None or other is constraint:
+                    continue
+
+                if undecided < other[0]:
+                    rest, rest_mines = other[0] - undecided, other[1] - mines
+                elif other[0] < undecided:
+                    rest, rest_mines = undecided - other[0], mines - other[1]
+                else:
+                    continue
+
+                if rest_mines == 0:
+                    self._decide(rest, self.safe, dirty)
+                elif rest_mines == len(rest):
+                    self._decide(rest, self.mines, dirty)
+
+    def _decide(self, fields, decided, dirty):
+        """
+        Adds the fields to the decided fields and marks the constraints
+        next to them dirty.
+
+        :param fields: Flat indexes of the decided fields.
+        :type fields: frozenset
+        :param decided: Safe or mine fields.
+        :type decided: set
+        :param dirty: Flat indexes of the fields to check.
+        :type dirty: set
+        """
+
+        for field in fields:
+            if field in decided:
+                continue
+
+            decided.add(field)
+            dirty.update(neighbour for neighbour in
+                         self.topology.adjacent_fields(field)
+                         if neighbour in self.constraints)
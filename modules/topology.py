@@ -0,0 +1,171 @@
+"""
+Topology.
+
+Topology module represents adjacency of the board fields and is in
+charge of building it once per board size.
+
+Adjacent fields of a field depend only on whether the field lies in
+the first, a middle or the last row and column of the board. Topology
+keeps one table of adjacent offsets for each of those positions, so:
+    - the tables take memory proportional to rows, not to fields,
+    - offsets leading outside of the board are never listed, so no
+        bounds checks are needed when the adjacent fields are visited.
+
+The script requires:
+    - Built in utility "functools" and it's decorator "lru_cache"
+        for sharing the topology between boards of the same size.
+    - "consts" module from same directory and it's const:
+        - OFFSETS - formula for getting adjacent fields.
+
+The file contains following classes:
+    - Topology
+
+Functions:
+    - get_topology()
+"""
+
+from functools import lru_cache
+from modules.consts import OFFSETS
+
+
+class Topology:
+    """
+    Topology class holds adjacent offsets of every board field.
+
+    For the field at row, col:
+        - row_offsets[row][col_position[col]] are (row, col) offsets
+            of it's adjacent fields,
+        - row_deltas[row][col_position[col]] are flat index
+            (row * cols + col) offsets of it's adjacent fields.
+
+    Public methods:
+        offsets()
+        adjacent()
+        adjacent_fields()
+    """
+
+    __slots__ = ("rows", "cols", "col_position", "row_offsets",
+                 "row_deltas")
+
+    def __init__(self, rows, cols):
+        """
+        Constructor method.
+
+        :param rows: Number of board rows.
+        :type rows: int
+        :param cols: Number of board columns.
+        :type cols: int
+        """
+
+        self.rows = rows
+        self.cols = cols
+
+        # Position of every column: 0 first, 1 middle, 2 last.
+        self.col_position = [self._position(col, cols)
+                             for col in range(cols)]
+
+        # Offsets of every row and column position pair.
+        tables = [[self._offsets(row_position, col_position)
+                   for col_position in range(3)]
+                  for row_position in range(3)]
+
+        self.row_offsets = [tables[self._position(row, rows)]
+                            for row in range(rows)]
+        self.row_deltas = [
+            [tuple(offset[0] * cols + offset[1] for offset in offsets)
+             for offsets in row_offsets]
+            for row_offsets in self.row_offsets
+            ]
+
+    def offsets(self, row, col):
+        """
+        Gets the offsets of fields adjacent to the field.
+
+        :param row: Field row of the grid.
+        :type row: int
+        :param col: Field column of the grid.
+        :type col: int
+        :return: (row, col) offsets of the adjacent fields.
+        :rtype: tuple
+        """
+
+        return self.row_offsets[row][self.col_position[col]]
+
+    def adjacent(self, row, col):
+        """
+        Gets the fields adjacent to the field.
+
+        :param row: Field row of the grid.
+        :type row: int
+        :param col: Field column of the grid.
+        :type col: int
+        :return: Adjacent fields as (row, col) tuples.
+        :rtype: list
+        """
+
+        return [(row + offset[0], col + offset[1])
+                for offset in self.row_offsets[row][self.col_position[col]]]
+
+    def adjacent_fields(self, field):
+        """
+        Gets the fields adjacent to the field.
+
+        :param field: Flat field index (row * cols + col).
+        :type field: int
+        :return: Flat indexes of the adjacent fields.
+        :rtype: list
+        """
+
+        row, col = divmod(field, self.cols)
+
+        return [field + delta
+                for delta in self.row_deltas[row][self.col_position[col]]]
+
+    def _position(self, index, size):
+        """
+        Gets the position of the row or column index.
+
+        :return: 0 for the first, 2 for the last, 1 otherwise.
+        :rtype: int
+        """
+
+        if index == 0:
+            return 0
+        if index == size - 1:
+            return 2
+
+        return 1
+
+    def _offsets(self, row_position, col_position):
+        """
+        Gets the offsets that stay inside of the board from a field
+        at the row and column position.
+
+        :return: (row, col) offsets.
+        :rtype: tuple
+        """
+
+        # Representative field for the positions.
+        row = (0, 1, self.rows - 1)[row_position]
+        col = (0, 1, self.cols - 1)[col_position]
+
+        return tuple(offset for offset in OFFSETS
+                     if 0 <= offset[0] + row < self.rows and
+                     0 <= offset[1] + col < self.cols)
+
+
+@lru_cache(maxsize=16)
+def get_topology(rows, cols):
+    """
+    Gets the topology of the board size, built once and shared
+    between all boards of the same size.
+
+    :param rows: Number of board rows.
+    :type rows: int
+    :param cols: Number of board columns.
+    :type cols: int
+    :return: Topology of the board size.
+    :rtype: Topology
+    """
+
+    return Topology(rows, cols)
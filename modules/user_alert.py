@@ -8,6 +8,11 @@ UserAlert functionalities include:
     - displaying the alerts
     - taking and validating user input.
 
+Messages of the alerts and the prompts are one catalog shared by
+every alert. YesOrNoAlert and ContinueAlert keep no state, the game
+and every server session share their YES_OR_NO_ALERT and
+CONTINUE_ALERT instances.
+
 The script requires:
     - Built in utility "os" for getting the terminal width.
     - Built in utility "time" and it's method "sleep" for delay,
@@ -23,17 +28,110 @@ import os
 from time import sleep
 
 
+# Prompts of the player input.
+ACTION_PROMPT = "\nDisplay or flag the field: \n\t"
+YES_OR_NO_PROMPT = "\033[33;1m(y/n)\033[0m: \n\t"
+CONTINUE_PROMPT = "\nTo continue \033[33;1mpress enter...\033[0m \n\t"
+
+YES_OR_NO_ALERTS = {
+    "display": ["\033[31;1mYou suspected there is a MINE" +
+                " on this field!\033[0m\n",
+                "Continue?"],
+    "play again": ["\033[32;1mThe more you play the better" +
+                   " you're going to be!\033[0m\n",
+                   "Play again?"]
+    }
+
+# Lines with "{score}" are formatted with the achieved score.
+CONTINUE_ALERTS = {
+    "field visible": ["\033[31;1mSelected field is not" +
+                      " hidden!\033[0m",
+                      "\033[37;2mThis field cannot take" +
+                      " further actions.",
+                      "Pick another!\033[0m"],
+    "defeat": ["\033[31;1mDEFEAT!!!\033[0m",
+               "BOOM! The mine exploded!",
+               "SCORE: \033[31;1m{score}",
+               "\033[37;2mPractice equals mastery!\033[0m"],
+    "victory": ["\033[32;1mVICTORY!!!\033[0m",
+                "CHEERS! All mines are located!",
+                "SCORE: \033[32;1m{score}",
+                "\033[37;2mCan you win in less time?\033[0m"],
+    "welcome screen": ["\033[36;1mWelcome!\033[0m",
+                       "\n\033[37;2mLooking for a bit of fun time?",
+                       "Tired of advanced graphics in gaming?",
+                       "Feeling nostalgic?\033[0m",
+                       "\n\033[36;1mWell..",
+                       "..this is a place to be!\033[0m",
+                       "\n\033[37;2mDive in textual gaming" +
+                       " with \033[0m\033[36;1mMINESWEEPER!\033[0m"],
+    "info screen": ["\033[36;1mMS objective is to flag all mines" +
+                    " in the shortest amount of time.\033[0m",
+                    "\033[37;2mGame fields have three different" +
+                    " states: hidden, displayed and flagged.\033[0m",
+                    "\n\033[36;1mHIDDEN\033[0m \033[37;2m= initial" +
+                    " state of the field.\033[0m",
+                    "\033[36;1mDISPLAYED\033[0m \033[37;2m=" +
+                    " indicator of nearby mines",
+                    "\tCommand:\033[0m \033[32;1mrow col | 2 3\033[0m",
+                    "\033[36;1mFLAGGED\033[0m \033[37;2m= " +
+                    "indicator of potentional mine!\033[0m" +
+                    " \033[33;1m*To UNFLAG: repeat the" +
+                    " flag command.\033[0m",
+                    "\t\033[37;2mCommand:\033[0m \033[32;1mflag" +
+                    " row col | flag 2 3\033[0m",
+                    "\n\033[36;1mHappy hunting!\033[0m"]
+    }
+
+PLAYER_ACTION_ALERTS = {
+    "action val": "\033[31;1mIncorrect action choosen!\033[0m",
+    "field val": "\033[31;1mIncorrect values entered for" +
+    " field selection!\033[0m",
+    "range": "\033[31;1mThe values are out of range!\033[0m"
+    }
+
+# Alerts of no, one and too many values provided.
+ARG_NUM_ALERTS = ("\033[31;1mNo value provided!\033[0m",
+                  "\033[31;1mOnly one value provided!\033[0m",
+                  "\033[31;1mToo many values provided!\033[0m")
+
+# Lines with "{rows}" and "{cols}" are formatted with the board size.
+ACTION_INFO = ["\033[33;1mExpected: \033[0m\n",
+               "\033[37;2mFor \033[0m\033[33;1mDISPLAYING\033[37;2m" +
+               " the field enter 2 digital values!\033[0m",
+               "\033[32;1mrow, col | 2, 3 | 2 3\033[0m",
+               "\033[37;2mFor \033[0m\033[33;1mFLAGGING\033[37;2m the field" +
+               " enter \"flag\" followed by 2 digital values!\033[0m",
+               "\033[32;1mflag, row, col | flag, 2, 3 | FlAg 2 3\033[0m",
+               "\033[37;2mFor \033[0m\033[33;1mREMOVING a FLAG\033[37;2m " +
+               "simply repeat \033[0m\033[33;1mFLAGGING" +
+               "\033[37;2m command!\033[0m",
+               "\033[32;1mflag, row, col | flag, 2, 3 | FlAg 2 3\n\033[0m",
+               "\033[37;2mFor \033[0m\033[33;1mMOVING the VIEW\033[37;2m" +
+               " of a large board enter \"goto\" followed by" +
+               " 2 digital values!\033[0m",
+               "\033[32;1mgoto, row, col | goto 40 120\n\033[0m",
+               "\033[37;2mFor \033[0m\033[33;1mMANY ACTIONS\033[37;2m" +
+               " at once separate them with \";\"!\033[0m",
+               "\033[32;1m3 4; flag 5 6; 7 8\n\033[0m",
+               "\033[37;2mFor a \033[0m\033[33;1mHINT\033[37;2m" +
+               " enter \"hint\"!\033[0m",
+               "\033[32;1mhint\n\033[0m",
+               "\033[33;1mROW\033[0m should be between:" +
+               " \033[32;1m0 - {rows}\033[0m",
+               "\033[33;1mCOLUMN\033[0m should be between:" +
+               " \033[32;1m0 - {cols}\033[0m\n"]
+
+
 class Alert():
     """
     Alert class with purpose of handling alerts.
     """
 
-    def __init__(self):
-        """
-        Constructor method.
-        """
+    __slots__ = ()
 
-        self.alerts = {}
+    # Messages of the alert, from the catalog.
+    alerts = {}
 
     def _display_alert(self, alert):
         """
@@ -72,17 +170,9 @@ class YesOrNoAlert(Alert):
         call_alert()
     """
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
-        self.alerts = {
-            "display": ["\033[31;1mYou suspected there is a MINE" +
-                        " on this field!\033[0m\n",
-                        "Continue?"],
-            "play again": ["\033[32;1mThe more you play the better" +
-                           " you're going to be!\033[0m\n",
-                           "Play again?"]
-            }
+    alerts = YES_OR_NO_ALERTS
 
     def call_alert(self, alert):
         """
@@ -111,7 +201,7 @@ class YesOrNoAlert(Alert):
             try:
                 sleep(.15)
 
-                user_input = input("\033[33;1m(y/n)\033[0m: \n\t")
+                user_input = input(YES_OR_NO_PROMPT)
                 user_input = user_input.strip().lower()
 
                 match user_input:
@@ -134,8 +224,13 @@ class ContinueAlert(Alert):
     Public methods:
         call_alert()
         take_input()
+        get_alert()
     """
 
+    __slots__ = ()
+
+    alerts = CONTINUE_ALERTS
+
     def call_alert(self, alert, score=0):
         """
         Calls and runs the alert script for
@@ -147,7 +242,7 @@ class ContinueAlert(Alert):
         :type score: int
         """
 
-        alert_text = self._get_alert(alert, score)
+        alert_text = self.get_alert(alert, score)
         self._display_alert(alert_text)
         self.take_input()
 
@@ -158,10 +253,11 @@ class ContinueAlert(Alert):
 
         sleep(.15)
 
-        input("\nTo continue \033[33;1mpress enter...\033[0m \n\t")
+        input(CONTINUE_PROMPT)
 
-    def _get_alert(self, alert, score):
-        """_summary_
+    def get_alert(self, alert, score=0):
+        """
+        Gets the lines of the alert.
 
         :param alert: Represents the alert in question
         :type alert: str
@@ -170,47 +266,8 @@ class ContinueAlert(Alert):
         :return: Specified alert list from possible alerts.
         :rtype: list
         """
-        self.alerts = {
-            "field visible": ["\033[31;1mSelected field is not" +
-                              " hidden!\033[0m",
-                              "\033[37;2mThis field cannot take" +
-                              " further actions.",
-                              "Pick another!\033[0m"],
-            "defeat": ["\033[31;1mDEFEAT!!!\033[0m",
-                       "BOOM! The mine exploded!",
-                       f"SCORE: \033[31;1m{score}",
-                       "\033[37;2mPractice equals mastery!\033[0m"],
-            "victory": ["\033[32;1mVICTORY!!!\033[0m",
-                        "CHEERS! All mines are located!",
-                        f"SCORE: \033[32;1m{score}",
-                        "\033[37;2mCan you win in less time?\033[0m"],
-            "welcome screen": ["\033[36;1mWelcome!\033[0m",
-                               "\n\033[37;2mLooking for a bit of fun time?",
-                               "Tired of advanced graphics in gaming?",
-                               "Feeling nostalgic?\033[0m",
-                               "\n\033[36;1mWell..",
-                               "..this is a place to be!\033[0m",
-                               "\n\033[37;2mDive in textual gaming" +
-                               " with \033[0m\033[36;1mMINESWEEPER!\033[0m"],
-            "info screen": ["\033[36;1mMS objective is to flag all mines" +
-                            " in the shortest amount of time.\033[0m",
-                            "\033[37;2mGame fields have three different" +
-                            " states: hidden, displayed and flagged.\033[0m",
-                            "\n\033[36;1mHIDDEN\033[0m \033[37;2m= initial" +
-                            " state of the field.\033[0m",
-                            "\033[36;1mDISPLAYED\033[0m \033[37;2m=" +
-                            " indicator of nearby mines",
-                            "\tCommand:\033[0m \033[32;1mrow col | 2 3\033[0m",
-                            "\033[36;1mFLAGGED\033[0m \033[37;2m= " +
-                            "indicator of potentional mine!\033[0m" +
-                            " \033[33;1m*To UNFLAG: repeat the" +
-                            " flag command.\033[0m",
-                            "\t\033[37;2mCommand:\033[0m \033[32;1mflag" +
-                            " row col | flag 2 3\033[0m",
-                            "\n\033[36;1mHappy hunting!\033[0m"]
-            }
-
-        return self.alerts[alert]
+
+        return [line.format(score=score) for line in self.alerts[alert]]
 
 
 class PlayerActionAlert(Alert):
@@ -224,6 +281,8 @@ class PlayerActionAlert(Alert):
         call_alert()
     """
 
+    __slots__ = ("rows", "cols", "received_alerts", "alerts", "action_info")
+
     def __init__(self, rows, cols, received_alerts, vals=0):
         """
         Constructor method.
@@ -236,19 +295,12 @@ class PlayerActionAlert(Alert):
         :type vals: int
         """
 
-        super().__init__()
-
         self.rows = rows
         self.cols = cols
         self.received_alerts = received_alerts
 
-        self.alerts = {
-            "arg num": self._arg_num(vals),
-            "action val": "\033[31;1mIncorrect action choosen!\033[0m",
-            "field val": "\033[31;1mIncorrect values entered for" +
-            " field selection!\033[0m",
-            "range": "\033[31;1mThe values are out of range!\033[0m"
-        }
+        self.alerts = {"arg num": self._arg_num(vals),
+                       **PLAYER_ACTION_ALERTS}
 
         self.action_info = self._action_info()
 
@@ -265,7 +317,7 @@ class PlayerActionAlert(Alert):
         self._display_alert(self.action_info)
 
         # Display alert for continuation.
-        ContinueAlert().take_input()
+        CONTINUE_ALERT.take_input()
 
     def _display_pl_alerts(self):
         """
@@ -284,23 +336,8 @@ class PlayerActionAlert(Alert):
         Contains information about player actions.
         """
 
-        info = ["\033[33;1mExpected: \033[0m\n",
-                "\033[37;2mFor \033[0m\033[33;1mDISPLAYING\033[37;2m" +
-                " the field enter 2 digital values!\033[0m",
-                "\033[32;1mrow, col | 2, 3 | 2 3\033[0m",
-                "\033[37;2mFor \033[0m\033[33;1mFLAGGING\033[37;2m the field" +
-                " enter \"flag\" followed by 2 digital values!\033[0m",
-                "\033[32;1mflag, row, col | flag, 2, 3 | FlAg 2 3\033[0m",
-                "\033[37;2mFor \033[0m\033[33;1mREMOVING a FLAG\033[37;2m " +
-                "simply repeat \033[0m\033[33;1mFLAGGING" +
-                "\033[37;2m command!\033[0m",
-                "\033[32;1mflag, row, col | flag, 2, 3 | FlAg 2 3\n\033[0m",
-                "\033[33;1mROW\033[0m should be between:" +
-                f" \033[32;1m0 - {self.rows}\033[0m",
-                "\033[33;1mCOLUMN\033[0m should be between:" +
-                f" \033[32;1m0 - {self.cols}\033[0m\n"]
-
-        return info
+        return [line.format(rows=self.rows, cols=self.cols)
+                for line in ACTION_INFO]
 
     def _arg_num(self, vals):
         """
@@ -313,10 +350,9 @@ class PlayerActionAlert(Alert):
         :rtype: str
         """
 
-        match vals:
-            case 0:
-                return "\033[31;1mNo value provided!\033[0m"
-            case 1:
-                return "\033[31;1mOnly one value provided!\033[0m"
-            case _:
-                return "\033[31;1mToo many values provided!\033[0m"
+        return ARG_NUM_ALERTS[min(vals, 2)]
+
+
+# Stateless alerts shared by the game and the server sessions.
+YES_OR_NO_ALERT = YesOrNoAlert()
+CONTINUE_ALERT = ContinueAlert()
@@ -0,0 +1,554 @@
+"""
+Minesweeper pre-fork supervisor.
+
+Keeps a pool of warm worker processes for the deployments that run
+a game process per player. The supervisor imports the game and
+renders the banner once, then forks the workers, so a worker starts
+a game without the interpreter startup and the imports.
+
+Front ends, e.g. node-pty's replacement in the web terminal or
+a Python client, connect to the supervisor's unix socket and send
+one JSON request line:
+    - {"cmd": "play", "args": [...], "cols": 80, "lines": 24} - the
+        connection is handed to an idle worker and becomes the
+        terminal of a game run with the run.py arguments,
+    - {"cmd": "stats"} - the supervisor answers with one JSON line of
+        the pool stats and closes the connection.
+The worker runs the game on a pseudo terminal of the given size and
+relays it's bytes to the connection until either side ends.
+
+A worker serves one connection and exits, the supervisor forks
+a replacement whenever a worker is taken, keeping "--workers" idle.
+A connection finding no idle worker is a miss, it gets a worker
+forked on demand.
+
+Request lines are read by the supervisor's loop as their bytes
+arrive, never past the line, so a slow front end doesn't hold up
+the others and the bytes after the line are left to the game.
+
+The script requires:
+    - Built in utilities "os", "sys", "pty", "fcntl", "termios",
+        "struct" and "signal" for the worker processes and their
+        terminals.
+    - Built in utilities "socket", "selectors" and "json" for the
+        protocol.
+    - Built in utility "argparse" for the command line arguments.
+    - Built in utility "random" for seeding the workers.
+    - Built in utility "time" and it's method "monotonic" for
+        the request timeout.
+    - "banner" module from the game package, and it's function
+        "banner" for rendering the banner.
+    - "run" module, the terminal game.
+
+The file contains following classes:
+    - PreforkSupervisor
+
+Functions:
+    - connect()
+    - parse_args()
+    - main()
+"""
+
+import os
+import sys
+import pty
+import fcntl
+import termios
+import struct
+import signal
+import socket
+import selectors
+import json
+import argparse
+import random
+from time import monotonic
+from modules.banner import banner
+import run
+
+
+# Longest request line.
+MAX_REQUEST = 4096
+# Seconds a front end has to send the request line.
+REQUEST_TIMEOUT = 1.
+
+
+def connect(path, request):
+    """
+    Connects to the supervisor and sends the request.
+
+    :param path: Path of the supervisor's unix socket.
+    :type path: str
+    :param request: Request of the front end.
+    :type request: dict
+    :return: Connection to the supervisor.
+    :rtype: socket.socket
+    """
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(path)
+    conn.sendall(json.dumps(request).encode() + b"\n")
+
+    return conn
+
+
+class PreforkSupervisor:
+    """
+    PreforkSupervisor class keeps the pool of warm workers and hands
+    them the connections of the front ends.
+
+    Public methods:
+        serve()
+        stats()
+    """
+
+    def __init__(self, path, workers=4, max_sessions=1000):
+        """
+        Constructor method.
+
+        :param path: Path of the unix socket.
+        :type path: str
+        :param workers: Number of idle workers kept.
+        :type workers: int
+        :param max_sessions: Games played at once, connections over
+            it are refused.
+        :type max_sessions: int
+        """
+
+        self.path = path
+        self.workers = workers
+        self.max_sessions = max_sessions
+
+        # Control sockets of the idle workers, keyed by their pid.
+        self.idle = {}
+        # Pids of the workers playing a game.
+        self.busy = set()
+
+        # Connections sending their request line, with the bytes read
+        # so far and the time they have to finish it.
+        self.requests = {}
+
+        # Connections handed to an idle worker and to a worker forked
+        # on demand.
+        self.hits = 0
+        self.misses = 0
+
+        self.listener = None
+        self.selector = None
+
+    def serve(self):
+        """
+        Serves the front ends until the supervisor is stopped.
+        Workers playing a game are left to finish it.
+        """
+
+        # Banner is rendered once, the workers share it.
+        banner()
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(self.path)
+        self.listener.listen(128)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+
+        # Stopping the supervisor removes it's socket.
+        signal.signal(signal.SIGTERM, _stop)
+        self._refill()
+        print(f"Serving Minesweeper workers on {self.path}", flush=True)
+
+        try:
+            while True:
+                for key, _ in self.selector.select(timeout=1.):
+                    if key.fileobj is self.listener:
+                        self._accept()
+                    elif key.fileobj in self.requests:
+                        self._read_request(key.fileobj)
+                    else:
+                        # Idle worker closed it's control socket.
+                        self._drop(key.data)
+
+                self._expire()
+                self._reap()
+                self._refill()
+        finally:
+            for conn in self.requests:
+                conn.close()
+            for control in self.idle.values():
+                control.close()
+            self.listener.close()
+            os.remove(self.path)
+
+    def stats(self):
+        """
+        Gets the pool stats.
+
+        :return: Hits, misses, idle and busy workers.
+        :rtype: dict
+        """
+
+        return {"hits": self.hits, "misses": self.misses,
+                "idle": len(self.idle), "busy": len(self.busy)}
+
+    def _accept(self):
+        """
+        Accepts the new connection and waits for it's request line.
+        """
+
+        try:
+            conn, _ = self.listener.accept()
+        except OSError:
+            return
+
+        conn.setblocking(False)
+        self.requests[conn] = [b"", monotonic() + REQUEST_TIMEOUT]
+        self.selector.register(conn, selectors.EVENT_READ)
+
+    def _read_request(self, conn):
+        """
+        Reads the arrived bytes of the request line, and answers
+        the request once the line is complete.
+
+        :param conn: Connection of the front end.
+        :type conn: socket.socket
+        """
+
+        request = self.requests[conn]
+
+        try:
+            # Bytes after the line are the game's input.
+            data = conn.recv(MAX_REQUEST + 1, socket.MSG_PEEK)
+            end = data.find(b"\n") + 1 or len(data)
+            data = conn.recv(end) if data else b""
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+
+        request[0] += data
+        if len(request[0]) > MAX_REQUEST:
+            self._finish(conn)
+            conn.close()
+        elif not data or data.endswith(b"\n"):
+            # Line ends with the connection too.
+            self._finish(conn)
+            self._answer(conn, request[0])
+
+    def _answer(self, conn, line):
+        """
+        Answers the request line and closes the supervisor's end
+        of the connection.
+
+        :param conn: Connection of the front end.
+        :type conn: socket.socket
+        :param line: Request line.
+        :type line: bytes
+        """
+
+        try:
+            request = json.loads(line)
+
+            if request.get("cmd") == "stats":
+                conn.sendall(json.dumps(self.stats()).encode() + b"\n")
+            elif request.get("cmd") == "play":
+                self._hand_off(conn, request)
+        except (OSError, ValueError, AttributeError):
+            pass
+        finally:
+            conn.close()
+
+    def _finish(self, conn):
+        """
+        Stops waiting for the request line of the connection.
+
+        :param conn: Connection of the front end.
+        :type conn: socket.socket
+        """
+
+        del self.requests[conn]
+        self.selector.unregister(conn)
+
+    def _expire(self):
+        """
+        Closes the connections that didn't send their request line
+        in time.
+        """
+
+        now = monotonic()
+
+        for conn, (_, deadline) in list(self.requests.items()):
+            if now > deadline:
+                self._finish(conn)
+                conn.close()
+
+    def _hand_off(self, conn, request):
+        """
+        Passes the connection and the request to an idle worker,
+        or to a worker forked on demand.
+
+        :param conn: Connection of the front end.
+        :type conn: socket.socket
+        :param request: Play request.
+        :type request: dict
+        """
+
+        if len(self.busy) >= self.max_sessions:
+            conn.sendall(b"Server is full, try again later.\r\n")
+            return
+
+        if self.idle:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._fork(conn)
+
+        pid, control = self.idle.popitem()
+        self.selector.unregister(control)
+
+        socket.send_fds(control, [json.dumps(request).encode()],
+                        [conn.fileno()])
+        control.close()
+        self.busy.add(pid)
+
+    def _refill(self):
+        """
+        Forks workers until enough of them are idle.
+        """
+
+        while len(self.idle) < self.workers:
+            self._fork()
+
+    def _fork(self, conn=None):
+        """
+        Forks an idle worker.
+
+        :param conn: Connection the supervisor holds, closed
+            in the worker.
+        :type conn: socket.socket/None
+        """
+
+        control, worker_control = socket.socketpair()
+        pid = os.fork()
+
+        if pid == 0:
+            # Worker keeps only it's own control socket, and never
+            # returns to the supervisor's loop.
+            try:
+                for inherited in [self.listener, self.selector, control,
+                                  conn, *self.idle.values(),
+                                  *self.requests]:
+                    if inherited is not None:
+                        inherited.close()
+
+                _worker(worker_control)
+            finally:
+                os._exit(0)
+
+        worker_control.close()
+        self.idle[pid] = control
+        self.selector.register(control, selectors.EVENT_READ, pid)
+
+    def _drop(self, pid):
+        """
+        Forgets the idle worker that exited.
+
+        :param pid: Pid of the worker.
+        :type pid: int
+        """
+
+        control = self.idle.pop(pid)
+        self.selector.unregister(control)
+        control.close()
+
+    def _reap(self):
+        """
+        Collects the exited workers.
+        """
+
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+
+            if pid == 0:
+                return
+
+            self.busy.discard(pid)
+
+
+def _stop(signum, frame):
+    """
+    Stops the supervisor on the signal.
+
+    :param signum: Received signal.
+    :type signum: int
+    :param frame: Interrupted stack frame.
+    :type frame: frame
+    :raises SystemExit: Always.
+    """
+
+    raise SystemExit(0)
+
+
+def _worker(control):
+    """
+    Waits for a connection and plays it's game on a pseudo terminal.
+
+    :param control: Control socket of the worker.
+    :type control: socket.socket
+    """
+
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    # Forked workers would share the random state.
+    random.seed()
+
+    try:
+        message, fds, _, _ = socket.recv_fds(control, MAX_REQUEST, 1)
+    except OSError:
+        return
+    finally:
+        control.close()
+
+    if not fds:
+        return
+
+    # Connection was read without blocking by the supervisor.
+    conn = socket.socket(fileno=fds[0])
+    conn.setblocking(True)
+    request = json.loads(message)
+
+    pid, master = pty.fork()
+    if pid == 0:
+        conn.close()
+        _play(request)
+
+    _relay(conn, master)
+
+    try:
+        os.kill(pid, signal.SIGHUP)
+    except ProcessLookupError:
+        pass
+
+    os.waitpid(pid, 0)
+
+
+def _play(request):
+    """
+    Runs the terminal game of the request on the pseudo terminal
+    and exits.
+
+    :param request: Play request.
+    :type request: dict
+    """
+
+    fcntl.ioctl(0, termios.TIOCSWINSZ, struct.pack(
+        "HHHH", int(request.get("lines", 24)), int(request.get("cols", 80)),
+        0, 0))
+    os.environ["TERM"] = "xterm-color"
+
+    # Streams of the supervisor may be pipes, reopened as the terminal.
+    sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout = open(1, "w", buffering=1, encoding="utf-8", closefd=False)
+    sys.stderr = open(2, "w", buffering=1, encoding="utf-8", closefd=False)
+    sys.argv = ["run.py", *[str(arg) for arg in request.get("args", [])]]
+
+    code = 0
+    try:
+        run.main()
+    except SystemExit as error:
+        code = error.code if isinstance(error.code, int) else 0
+    except (EOFError, KeyboardInterrupt):
+        code = 1
+    finally:
+        sys.stdout.flush()
+
+    os._exit(code)
+
+
+def _relay(conn, master):
+    """
+    Copies the bytes between the connection and the terminal
+    until either side ends.
+
+    :param conn: Connection of the front end.
+    :type conn: socket.socket
+    :param master: Master side of the game's pseudo terminal.
+    :type master: int
+    """
+
+    selector = selectors.DefaultSelector()
+    selector.register(conn, selectors.EVENT_READ)
+    selector.register(master, selectors.EVENT_READ)
+
+    try:
+        while True:
+            for key, _ in selector.select():
+                if key.fileobj is conn:
+                    data = conn.recv(65536)
+                    if not data:
+                        return
+                    os.write(master, data)
+                else:
+                    # Terminal raises once the game exits.
+                    data = os.read(master, 65536)
+                    if not data:
+                        return
+                    conn.sendall(data)
+    except OSError:
+        return
+    finally:
+        selector.close()
+        conn.close()
+        os.close(master)
+
+
+def parse_args():
+    """
+    Parses the command line arguments.
+
+    :return: Parsed arguments.
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Keeps warm Minesweeper game processes.")
+    parser.add_argument("--socket", metavar="PATH", default="prefork.sock",
+                        help="path of the unix socket")
+    parser.add_argument("--workers", metavar="N", type=int, default=4,
+                        help="number of idle workers kept")
+    parser.add_argument("--max-sessions", metavar="N", type=int,
+                        default=1000,
+                        help="games played at once")
+    parser.add_argument("--stats", action="store_true",
+                        help="print the stats of the running supervisor")
+
+    return parser.parse_args()
+
+
+def main():
+    """
+    Main program function.
+
+    Runs the supervisor until it's interrupted, or prints
+    the stats of the running one.
+    """
+
+    args = parse_args()
+
+    if args.stats:
+        with connect(args.socket, {"cmd": "stats"}) as conn:
+            print(conn.makefile().readline().strip())
+        return
+
+    try:
+        PreforkSupervisor(args.socket, args.workers,
+                          args.max_sessions).serve()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
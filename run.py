@@ -4,15 +4,62 @@ Minesweeper app.
 Main module of the application.
 Runs the app.
 
+Without arguments the game is played interactively. With "--moves"
+the actions are read from a file, or the standard input for "-",
+and applied in order without player input. Lines carry one or more
+actions separated by ";", empty lines and lines starting with "#"
+are skipped. The board is rendered at the end, or every N moves
+with "--render-every". Scripted games are neither saved nor scored,
+"--session", "--no-guess" and "--leaderboard" are refused with them.
+
+With "--record DIR" every game writes it's replay to the directory.
+With "--replay FILE" the recorded game is played again at full speed
+and rendered like the moves file, or not at all with "--quiet".
+
+With "--session KEY" the game is saved after every move and resumed
+by the next run with the same key, so a reconnecting player
+continues the game.
+
+Interactive games take their boards from a pool generated in the
+background, starting while the welcome screens are shown, so a new
+game doesn't wait for it's board. With "--no-guess" the boards are
+searched for on the first move instead, so they can be cleared
+without guessing.
+
+The banner of the screens is rendered once and cached in "cache",
+so startup imports "art" only when the cache is empty.
+
+With "--leaderboard BACKEND" the scores of the finished games are
+stored on the leaderboard from a background thread, so the game
+doesn't wait for the write. The SQLite leaderboard is
+"leaderboard.db", or "--leaderboard-db PATH", and the games are
+played as "--player".
+
 Functions:
     - print_screen()
+    - parse_args()
+    - play_moves()
+    - play_replay_file()
+    - replay_path()
     - main()
 """
 
 import os
-from art import tprint
+import sys
+import argparse
+from time import perf_counter
+from modules.banner import print_banner
 from modules.minesweeper import Minesweeper
-from modules.user_alert import ContinueAlert, YesOrNoAlert
+from modules.engine import GameEngine, PLAYING
+from modules.board_pool import BoardPool
+from modules.leaderboard import BACKENDS, DEFAULT_PLAYER, ScoreSubmitter, \
+    create_backend
+from modules.player_action import PlayerAction
+from modules.renderer import DiffRenderer
+from modules.replay import ReplayRecorder, write_replay, read_replay, \
+    play_replay
+from modules.snapshot import SnapshotStore
+from modules.user_alert import CONTINUE_ALERT, YES_OR_NO_ALERT
 
 
 def print_screen(screen):
@@ -24,30 +71,252 @@ def print_screen(screen):
     """
     os.system("clear")
 
-    header = " "*3 + "MINESWEEPER"
-    tprint(header, font="avatar")
+    print_banner()
+
+    CONTINUE_ALERT.call_alert(screen)
+
+
+def parse_args():
+    """
+    Parses the command line arguments.
+
+    :return: Parsed arguments.
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(description="Minesweeper game.")
+    parser.add_argument("--rows", type=int, default=10,
+                        help="number of board rows")
+    parser.add_argument("--cols", type=int, default=10,
+                        help="number of board columns")
+    parser.add_argument("--mines", type=int, default=10,
+                        help="number of mines")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for the mine placement")
+    parser.add_argument("--moves", metavar="FILE",
+                        help="play the actions of the file, - for stdin")
+    parser.add_argument("--render-every", metavar="N", type=int, default=0,
+                        help="render every N moves, only at the end if 0")
+    parser.add_argument("--record", metavar="DIR",
+                        help="write the replay of every game to DIR")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="play the recorded game of the replay file")
+    parser.add_argument("--quiet", action="store_true",
+                        help="don't render the replayed game")
+    parser.add_argument("--session", metavar="KEY",
+                        help="save the game under KEY and resume it")
+    parser.add_argument("--session-dir", metavar="DIR", default="sessions",
+                        help="directory of the saved games")
+    parser.add_argument("--no-guess", action="store_true",
+                        help="play boards that can be cleared without"
+                        " guessing")
+    parser.add_argument("--leaderboard", choices=BACKENDS,
+                        help="store the scores in the backend, no scores"
+                        " are kept without it")
+    parser.add_argument("--leaderboard-db", metavar="PATH",
+                        default="leaderboard.db",
+                        help="file of the SQLite leaderboard")
+    parser.add_argument("--player", metavar="NAME", default=DEFAULT_PLAYER,
+                        help="name of the player on the leaderboard")
+
+    args = parser.parse_args()
+
+    if args.rows < 1 or args.cols < 1:
+        parser.error("--rows and --cols must be at least 1")
+    if not 0 <= args.mines < args.rows * args.cols:
+        parser.error(f"{args.mines} mines don't fit on a"
+                     f" {args.rows}x{args.cols} board")
+    # Scripted games are played on a seeded board, without saving
+    # and without scores.
+    if args.moves and (args.no_guess or args.session or args.leaderboard):
+        parser.error("--no-guess, --session and --leaderboard can't be"
+                     " used with --moves")
+
+    return args
+
+
+def play_moves(args):
+    """
+    Plays the actions of the moves file until they run out
+    or the game is over, then renders the board and the result.
+
+    :param args: Parsed arguments.
+    :type args: argparse.Namespace
+    """
+
+    engine = GameEngine()
+    engine.new_game(args.rows, args.cols, args.mines, args.seed)
+    recorder = ReplayRecorder(engine) if args.record else None
+    pl_action = PlayerAction(args.rows, args.cols)
+    renderer = DiffRenderer()
+    moves = 0
+
+    def render():
+        # Scripted games are drawn without the row by row animation.
+        engine.pl_board.initial_run = False
+        renderer.render(engine.pl_board,
+                        f"\nMOVES: {moves}\tSTATE: {engine.state}"
+                        f"\tSCORE: {engine.score}")
+
+    moves_file = sys.stdin if args.moves == "-" else open(args.moves)
+
+    with moves_file:
+        for line_num, line in enumerate(moves_file, 1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+
+            try:
+                actions = pl_action.parse_line(line)
+            except ValueError as error:
+                sys.exit(f"{args.moves}:{line_num}: {error}")
+
+            for action, row, col in actions:
+                if action == "goto":
+                    renderer.pan_to(row, col)
+                    continue
+                # Hints are for the player, scripted moves skip them.
+                if action == "hint":
+                    continue
+
+                engine.step(action, row, col)
+                moves += 1
+
+                if recorder is not None:
+                    recorder.record(action, row, col)
+
+                if args.render_every and moves % args.render_every == 0:
+                    render()
 
-    ContinueAlert().call_alert(screen)
+                if engine.state != PLAYING:
+                    break
+
+            if engine.state != PLAYING:
+                break
+
+    render()
+
+    if recorder is not None:
+        write_replay(replay_path(args.record), recorder.replay())
+
+
+def play_replay_file(args):
+    """
+    Plays the recorded game of the replay file at full speed,
+    then prints the result and the replay speed.
+
+    :param args: Parsed arguments.
+    :type args: argparse.Namespace
+    """
+
+    replay = read_replay(args.replay)
+    engine = GameEngine()
+    renderer = DiffRenderer()
+
+    def render(move, result):
+        engine.pl_board.initial_run = False
+        renderer.render(engine.pl_board,
+                        f"\nMOVES: {move}\tSTATE: {result.state}"
+                        f"\tSCORE: {result.score}")
+
+    def on_step(move, result):
+        if args.render_every and move % args.render_every == 0:
+            render(move, result)
+
+    start = perf_counter()
+    result = play_replay(replay, engine,
+                         None if args.quiet else on_step)
+    seconds = perf_counter() - start
+
+    if not args.quiet:
+        render(len(replay.moves), result)
+
+    print(f"REPLAY: {len(replay.moves)} moves of {replay.rows}x{replay.cols}"
+          f"/{replay.mines} in {seconds * 1000:.2f}ms,"
+          f" {result.state}, score {result.score}")
+
+
+def replay_path(directory):
+    """
+    Gets the path of the next replay in the directory.
+
+    :param directory: Directory of the replays.
+    :type directory: str
+    :return: Path of the first game-N.msr file that doesn't exist.
+    :rtype: str
+    """
+
+    os.makedirs(directory, exist_ok=True)
+
+    game = 1
+    while os.path.exists(os.path.join(directory, f"game-{game}.msr")):
+        game += 1
+
+    return os.path.join(directory, f"game-{game}.msr")
 
 
 def main():
     """
     Main program function.
 
-    Creates welcome and info screen and runs a a game
-    until the player decides to exit.
+    Plays the replay or the moves file if given, otherwise creates
+    welcome and info screen and runs a a game until the player
+    decides to exit.
     """
-    print_screen('welcome screen')
-    print_screen('info screen')
+    args = parse_args()
+
+    if args.replay:
+        play_replay_file(args)
+        return
+
+    if args.moves:
+        play_moves(args)
+        return
+
+    store = SnapshotStore(args.session_dir) if args.session else None
+
+    # No guess boards depend on the first move, they can't be pooled.
+    if args.no_guess:
+        # Process pool of the generator is imported only if it's used.
+        from modules.no_guess import NoGuessGenerator
+
+        board_pool, no_guess = None, NoGuessGenerator()
+    else:
+        board_pool, no_guess = BoardPool([(args.rows, args.cols,
+                                           args.mines)]), None
+        board_pool.start()
+
+    # Scores are written in the background, from the welcome screens.
+    backend = create_backend(args.leaderboard, args.leaderboard_db) \
+        if args.leaderboard else None
+    leaderboard = ScoreSubmitter(backend) if backend is not None else None
+    if leaderboard is not None:
+        leaderboard.start()
+
+    # Saved game continues without the welcome screens.
+    if store is None or store.load(args.session) is None:
+        print_screen('welcome screen')
+        print_screen('info screen')
 
     while True:
-        game = Minesweeper(10, 10, 10)
+        game = Minesweeper(
+            args.rows, args.cols, args.mines,
+            replay_path=replay_path(args.record) if args.record else None,
+            session=args.session, store=store, board_pool=board_pool,
+            no_guess=no_guess, leaderboard=leaderboard, player=args.player
+            )
         game.run()
 
-        play_again = YesOrNoAlert().call_alert('play again')
+        play_again = YES_OR_NO_ALERT.call_alert('play again')
 
         if not play_again:
             break
+
+    if board_pool is not None:
+        board_pool.close()
+    if no_guess is not None:
+        no_guess.close()
+    if leaderboard is not None:
+        leaderboard.close()
     os.system("clear")
     exit()
 
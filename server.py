@@ -0,0 +1,405 @@
+"""
+Minesweeper server.
+
+Hosts many game sessions in one process. Every TCP connection is
+a session played as a coroutine on one asyncio event loop, with the
+connection as it's input and output instead of the terminal, so
+a session costs only the memory of it's game. Sessions speak plain
+text with ANSI escape codes, a telnet client or a websocket bridge
+is their terminal:
+    python3 server.py --port 8023
+    telnet localhost 8023
+
+Sessions play the games of the terminal, Minesweeper answered from
+the connection: the welcome and info screens, then games until the
+player doesn't want to play again. Frames are
+drawn for a terminal of "--term-size" and without the row by row
+animation of the first frame, as sleeping would stop every session.
+Boards of the game size come from a pool shared by the sessions.
+
+Sessions keep only their game, alerts and messages are shared.
+With "--compact" the boards are stored as bytes instead of lists,
+for packing many idle sessions into the process.
+
+With "--leaderboard BACKEND" the scores of the finished games are
+submitted to the leaderboard, shared by the sessions and written
+in batches from a background thread, so no session waits for
+the write.
+
+The script requires:
+    - Built in utility "argparse" for the command line arguments.
+    - Built in utility "asyncio" for the server and the sessions.
+    - "minesweeper" module from the game package, and it's:
+        - Minesweeper class,
+        - ACTION_INPUT, ACTION_ALERT, CONFIRM - requests of the game.
+    - "board_pool" module from the game package, and it's class:
+        - BoardPool.
+    - "leaderboard" module from the game package, and it's:
+        - ScoreSubmitter class,
+        - create_backend - function creating the backend,
+        - BACKENDS - available backends.
+    - "user_alert" module from the game package, and it's:
+        - PlayerActionAlert class,
+        - CONTINUE_ALERT, YES_OR_NO_ALERT - alerts shared by
+            the sessions,
+        - ACTION_PROMPT, CONTINUE_PROMPT, YES_OR_NO_PROMPT - prompts
+            of the player input.
+
+The file contains following classes:
+    - GameSession
+
+Functions:
+    - parse_args()
+    - serve()
+    - main()
+"""
+
+import argparse
+import asyncio
+from modules.minesweeper import Minesweeper, ACTION_INPUT, ACTION_ALERT, \
+    CONFIRM
+from modules.board_pool import BoardPool
+from modules.leaderboard import BACKENDS, ScoreSubmitter, create_backend
+from modules.user_alert import PlayerActionAlert, CONTINUE_ALERT, \
+    YES_OR_NO_ALERT, ACTION_PROMPT, CONTINUE_PROMPT, YES_OR_NO_PROMPT
+
+
+class GameSession:
+    """
+    GameSession class plays the game with one connection.
+    Games are played by Minesweeper, the session answers their
+    requests from the connection and is the output stream of their
+    renderer, frames are buffered and sent once the player is asked
+    for input.
+
+    Public methods:
+        run()
+        write()
+        flush()
+    """
+
+    __slots__ = ("reader", "writer", "rows", "cols", "mines", "term_size",
+                 "idle_timeout", "compact", "board_pool", "leaderboard",
+                 "game")
+
+    def __init__(self, reader, writer, rows, cols, mines, term_size,
+                 board_pool=None, idle_timeout=None, compact=False,
+                 leaderboard=None):
+        """
+        Constructor method.
+
+        :param reader: Input of the connection.
+        :type reader: asyncio.StreamReader
+        :param writer: Output of the connection.
+        :type writer: asyncio.StreamWriter
+        :param rows: Number of Minesweeper grid rows.
+        :type rows: int
+        :param cols: Number of Minesweeper grid columns.
+        :type cols: int
+        :param mines: Number of Minesweeper mines in the grid.
+        :type mines: int
+        :param term_size: Columns and lines of the player's terminal.
+        :type term_size: tuple
+        :param board_pool: Pool of pregenerated boards.
+        :type board_pool: BoardPool/None
+        :param idle_timeout: Seconds the player has for every input,
+            no limit if None.
+        :type idle_timeout: float/None
+        :param compact: Use compact storage of the boards.
+        :type compact: bool
+        :param leaderboard: Submitter of the scores, the score is not
+            kept if None.
+        :type leaderboard: ScoreSubmitter/None
+        """
+
+        self.reader = reader
+        self.writer = writer
+        self.rows = rows
+        self.cols = cols
+        self.mines = mines
+        self.term_size = term_size
+        self.idle_timeout = idle_timeout
+        self.compact = compact
+        self.board_pool = board_pool
+        self.leaderboard = leaderboard
+
+        # Game being played, created for every game.
+        self.game = None
+
+    async def run(self):
+        """
+        Runs the session until the player leaves, disconnects
+        or is idle for too long.
+        """
+
+        try:
+            await self._alert(CONTINUE_ALERT.get_alert("welcome screen"))
+            await self._alert(CONTINUE_ALERT.get_alert("info screen"))
+
+            while True:
+                await self._play()
+
+                if not await self._yes_or_no(
+                        YES_OR_NO_ALERT.alerts["play again"]):
+                    break
+        except (EOFError, ConnectionError, asyncio.TimeoutError):
+            pass
+        finally:
+            self.writer.close()
+
+    def write(self, text):
+        """
+        Buffers the text for the connection, with the line endings
+        of a telnet terminal.
+
+        :param text: Text to send.
+        :type text: str
+        """
+
+        self.writer.write(text.replace("\n", "\r\n").encode())
+
+    def flush(self):
+        """
+        Does nothing, the buffer is sent once the player is asked
+        for input.
+        """
+
+    async def _play(self):
+        """
+        Plays one game until it's won or lost, answering the requests
+        of the game from the connection.
+        """
+
+        self.game = Minesweeper(self.rows, self.cols, self.mines,
+                                self.compact, board_pool=self.board_pool,
+                                leaderboard=self.leaderboard, out=self,
+                                size=self.term_size)
+        # Sleeping between the rows would stop every session.
+        self.game.engine.pl_board.initial_run = False
+
+        game = self.game.play()
+        answer = None
+
+        while True:
+            try:
+                request = game.send(answer)
+            except StopIteration:
+                return
+
+            answer = await self._answer(request)
+
+    async def _answer(self, request):
+        """
+        Answers the request of the game with the player's input.
+
+        :param request: Request yielded by Minesweeper.play().
+        :type request: tuple
+        :return: Answer sent back to the game.
+        :rtype: str/bool/None
+        """
+
+        if request[0] == ACTION_INPUT:
+            return await self._input(ACTION_PROMPT)
+
+        if request[0] == ACTION_ALERT:
+            await self._action_alert()
+        elif request[0] == CONFIRM:
+            return await self._yes_or_no(YES_OR_NO_ALERT.alerts[request[1]])
+        else:
+            await self._alert(CONTINUE_ALERT.get_alert(request[1],
+                                                       request[2]))
+
+        return None
+
+    async def _input(self, prompt):
+        """
+        Sends the buffered output and the prompt, and reads
+        the player's line.
+
+        :param prompt: Prompt of the input.
+        :type prompt: str
+        :raises EOFError: Player disconnected, or sent a line over
+            the limit of the reader.
+        :raises asyncio.TimeoutError: Player was idle for too long.
+        :return: Line without the line ending.
+        :rtype: str
+        """
+
+        self.write(prompt)
+        await self.writer.drain()
+
+        try:
+            line = await asyncio.wait_for(self.reader.readline(),
+                                          self.idle_timeout)
+        except ValueError as error:
+            raise EOFError("Line is too long.") from error
+
+        if not line:
+            raise EOFError("Player disconnected.")
+
+        return line.decode(errors="replace").rstrip("\r\n")
+
+    async def _alert(self, lines):
+        """
+        Shows the alert and waits for the player to continue.
+
+        :param lines: Lines of the alert.
+        :type lines: list
+        """
+
+        self._separator()
+        self.write("".join(f"{line}\n" for line in lines))
+        await self._input(CONTINUE_PROMPT)
+
+    async def _yes_or_no(self, lines):
+        """
+        Shows the alert and asks the player until the answer
+        is "y" or "n".
+
+        :param lines: Lines of the alert.
+        :type lines: list
+        :return: True if the answer is "y", False otherwise.
+        :rtype: bool
+        """
+
+        self._separator()
+        self.write("".join(f"{line}\n" for line in lines))
+
+        while True:
+            answer = (await self._input(YES_OR_NO_PROMPT)).strip().lower()
+            if answer in ("y", "n"):
+                break
+
+            self.write("\n\033[31;1mIncorrect value entered!\033[0m\n")
+
+        return answer == "y"
+
+    async def _action_alert(self):
+        """
+        Shows the alerts of the incorrect action line and the help.
+        """
+
+        alert = PlayerActionAlert(self.rows, self.cols,
+                                  self.game.pl_action.alerts,
+                                  self.game.pl_action.arg_num)
+
+        self._separator()
+        await self._alert([alert.alerts[received]
+                           for received in alert.received_alerts] +
+                          alert.action_info)
+
+    def _separator(self):
+        """
+        Writes the separator between sections, as wide as
+        the player's terminal.
+        """
+
+        self.write(f"\n\033[37;2m{'=' * self.term_size[0]}\033[0m\n\n")
+
+
+def parse_args():
+    """
+    Parses the command line arguments.
+
+    :return: Parsed arguments.
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Serves Minesweeper sessions over TCP.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address to listen on")
+    parser.add_argument("--port", type=int, default=8023,
+                        help="port to listen on, 0 for any free port")
+    parser.add_argument("--rows", type=int, default=10,
+                        help="number of board rows")
+    parser.add_argument("--cols", type=int, default=10,
+                        help="number of board columns")
+    parser.add_argument("--mines", type=int, default=10,
+                        help="number of mines")
+    parser.add_argument("--term-size", metavar=("COLS", "LINES"), type=int,
+                        nargs=2, default=(80, 24),
+                        help="terminal size of the players")
+    parser.add_argument("--max-sessions", metavar="N", type=int,
+                        default=10000,
+                        help="connections over N are refused")
+    parser.add_argument("--idle-timeout", metavar="SECONDS", type=float,
+                        default=600.,
+                        help="close sessions idle for SECONDS")
+    parser.add_argument("--compact", action="store_true",
+                        help="store the boards compactly, for many idle"
+                        " sessions")
+    parser.add_argument("--leaderboard", choices=BACKENDS,
+                        help="store the scores in the backend, no scores"
+                        " are kept without it")
+    parser.add_argument("--leaderboard-db", metavar="PATH",
+                        default="leaderboard.db",
+                        help="file of the SQLite leaderboard")
+
+    return parser.parse_args()
+
+
+async def serve(args):
+    """
+    Serves the sessions until the server is stopped.
+
+    :param args: Parsed arguments.
+    :type args: argparse.Namespace
+    """
+
+    board_pool = BoardPool([(args.rows, args.cols, args.mines)], size=8,
+                           watermark=4, compact=args.compact)
+    board_pool.start()
+    backend = create_backend(args.leaderboard, args.leaderboard_db) \
+        if args.leaderboard else None
+    leaderboard = ScoreSubmitter(backend) if backend is not None else None
+    if leaderboard is not None:
+        leaderboard.start()
+    sessions = set()
+
+    async def on_connect(reader, writer):
+        if len(sessions) >= args.max_sessions:
+            writer.write(b"Server is full, try again later.\r\n")
+            writer.close()
+            return
+
+        session = GameSession(reader, writer, args.rows, args.cols,
+                              args.mines, tuple(args.term_size),
+                              board_pool, args.idle_timeout, args.compact,
+                              leaderboard)
+        sessions.add(session)
+        try:
+            await session.run()
+        finally:
+            sessions.discard(session)
+
+    server = await asyncio.start_server(on_connect, args.host, args.port)
+    host, port = server.sockets[0].getsockname()[:2]
+    print(f"Serving Minesweeper on {host}:{port}", flush=True)
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        board_pool.close()
+        if leaderboard is not None:
+            leaderboard.close()
+
+
+def main():
+    """
+    Main program function.
+
+    Runs the server until it's interrupted.
+    """
+
+    args = parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Minesweeper simulation.
+
+Plays headless games of one size and density with the solver bot,
+spread across a pool of worker processes, and reports the win rate,
+the throughput and where the time goes.
+
+The bot displays the middle field first, then plays the hint of the
+solver, or displays the field least likely to be a mine when no field
+is certain. Game N is played with the seed "--seed" + N, so runs with
+the same arguments play the same games on any number of workers.
+
+Every game is timed in three phases:
+    - generation - creating the game and placing the mines,
+    - reveal - the engine's moves,
+    - solving - updating the solver and choosing the move.
+
+Used for tuning the difficulty of the board sizes and as a throughput
+benchmark that scales with the cores:
+    python3 simulate.py --rows 16 --cols 30 --mines 99 --games 1000
+
+The script requires:
+    - Built in utility "os" for the number of cores.
+    - Built in utility "argparse" for the command line arguments.
+    - Built in utility "time" and it's method "perf_counter".
+    - Built in utility "collections" and it's function "namedtuple"
+        for the game results.
+    - Built in utility "functools" and it's function "partial".
+    - Built in utility "concurrent.futures" and it's class
+        "ProcessPoolExecutor" for the worker processes.
+    - "engine" module from the game package, and it's:
+        - GameEngine class,
+        - PLAYING, WON - game states.
+    - "solver" module from the game package, and it's class:
+        - Solver.
+    - "probability" module from the game package, and it's class:
+        - MineProbability.
+
+The file contains following classes:
+    - GameResult
+
+Functions:
+    - parse_args()
+    - bot_move()
+    - play_game()
+    - simulate()
+    - report()
+    - main()
+"""
+
+import os
+import argparse
+from time import perf_counter
+from collections import namedtuple
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from modules.engine import GameEngine, PLAYING, WON
+from modules.solver import Solver
+from modules.probability import MineProbability
+
+
+# Games sent to a worker at once.
+CHUNK_SIZE = 8
+
+GameResult = namedtuple("GameResult", ["won", "moves", "guesses",
+                                       "generation", "reveal", "solving"])
+GameResult.__doc__ = """
+    GameResult class is the result of one simulated game.
+
+    won - True if the bot won the game,
+    moves - number of moves made,
+    guesses - number of displayed fields that were not certainly safe,
+        the first move included,
+    generation, reveal, solving - seconds spent in the game's phases.
+    """
+
+
+def parse_args():
+    """
+    Parses the command line arguments.
+
+    :return: Parsed arguments.
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Plays Minesweeper games with the solver bot.")
+    parser.add_argument("--rows", type=int, default=10,
+                        help="number of board rows")
+    parser.add_argument("--cols", type=int, default=10,
+                        help="number of board columns")
+    parser.add_argument("--mines", type=int, default=10,
+                        help="number of mines")
+    parser.add_argument("--games", type=int, default=100,
+                        help="number of games to play")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="number of worker processes, 1 plays the"
+                        " games in this process")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the first game")
+    parser.add_argument("--compact", action="store_true",
+                        help="use compact storage of the boards")
+
+    args = parser.parse_args()
+
+    if args.games < 1 or args.workers < 1:
+        parser.error("--games and --workers must be at least 1")
+    if not 0 <= args.mines < args.rows * args.cols:
+        parser.error(f"{args.mines} mines don't fit on a"
+                     f" {args.rows}x{args.cols} board")
+
+    return args
+
+
+def bot_move(engine, solver, probability):
+    """
+    Gets the move of the bot; the middle field on the first move,
+    then the hint of the solver, or the field least likely to be
+    a mine.
+
+    :param engine: Engine playing the game.
+    :type engine: GameEngine
+    :param solver: Hint solver of the game.
+    :type solver: Solver
+    :param probability: Mine chances of the game.
+    :type probability: MineProbability
+    :return: Action, row and column of the move, and True if the move
+        is a guess.
+    :rtype: tuple
+    """
+
+    if not engine.gm_board.generated:
+        return "display", engine.rows // 2, engine.cols // 2, True
+
+    hint = solver.hint()
+    if hint is not None:
+        return (*hint, False)
+
+    row, col, _ = probability.safest()
+
+    return "display", row, col, True
+
+
+def play_game(seed, rows, cols, mines, compact=False):
+    """
+    Plays one game with the bot until it's won or lost.
+
+    :param seed: Seed for the mine placement.
+    :type seed: int
+    :param rows: Number of Minesweeper grid rows.
+    :type rows: int
+    :param cols: Number of Minesweeper grid columns.
+    :type cols: int
+    :param mines: Number of Minesweeper mines in the grid.
+    :type mines: int
+    :param compact: Use compact storage of the boards.
+    :type compact: bool
+    :return: Result of the game.
+    :rtype: GameResult
+    """
+
+    start = perf_counter()
+    engine = GameEngine(compact)
+    engine.new_game(rows, cols, mines, seed)
+    generation = perf_counter() - start
+
+    solver = Solver(engine.pl_board)
+    probability = MineProbability(solver, mines)
+    moves = guesses = 0
+    reveal = solving = 0.
+
+    while engine.state == PLAYING:
+        start = perf_counter()
+        action, row, col, guess = bot_move(engine, solver, probability)
+        solving += perf_counter() - start
+
+        start = perf_counter()
+        if not engine.gm_board.generated:
+            # Timed apart from the move, as the game's first move
+            # places the mines.
+            engine.gm_board.generate(row, col)
+            generated = perf_counter()
+            generation += generated - start
+            start = generated
+
+        result = engine.step(action, row, col)
+        reveal += perf_counter() - start
+
+        moves += 1
+        guesses += guess
+
+        if result.state == PLAYING:
+            start = perf_counter()
+            solver.update(result.revealed)
+            solving += perf_counter() - start
+
+    return GameResult(engine.state == WON, moves, guesses,
+                      generation, reveal, solving)
+
+
+def simulate(args):
+    """
+    Plays the games of the arguments on the worker processes.
+
+    :param args: Parsed arguments.
+    :type args: argparse.Namespace
+    :return: Results of the games and the seconds they took.
+    :rtype: tuple
+    """
+
+    seeds = range(args.seed, args.seed + args.games)
+    play = partial(play_game, rows=args.rows, cols=args.cols,
+                   mines=args.mines, compact=args.compact)
+
+    start = perf_counter()
+
+    if args.workers == 1:
+        results = [play(seed) for seed in seeds]
+    else:
+        with ProcessPoolExecutor(args.workers) as executor:
+            results = list(executor.map(play, seeds, chunksize=CHUNK_SIZE))
+
+    return results, perf_counter() - start
+
+
+def report(args, results, seconds):
+    """
+    Prints the win rate, the throughput and the phase timings
+    of the games.
+
+    :param args: Parsed arguments.
+    :type args: argparse.Namespace
+    :param results: Results of the games.
+    :type results: list
+    :param seconds: Seconds the games took.
+    :type seconds: float
+    """
+
+    games = len(results)
+    wins = sum(result.won for result in results)
+    moves = sum(result.moves for result in results)
+    guesses = sum(result.guesses for result in results)
+    phases = {phase: sum(getattr(result, phase) for result in results)
+              for phase in ("generation", "reveal", "solving")}
+    total = sum(phases.values()) or 1.
+
+    print(f"SIMULATE: {games} games of {args.rows}x{args.cols}/{args.mines}"
+          f" on {args.workers} worker{'s' if args.workers > 1 else ''}")
+    print(f"WINS: {wins} ({wins / games:.1%}),"
+          f" {guesses / games:.2f} guesses and {moves / games:.1f} moves"
+          " per game")
+    print(f"SPEED: {games / seconds:.1f} games/s, {moves / seconds:.0f}"
+          f" moves/s in {seconds:.2f}s")
+    print("PHASES: " + ", ".join(
+        f"{phase} {time / games * 1000:.3f}ms ({time / total:.0%})"
+        for phase, time in phases.items()) + " per game")
+
+
+def main():
+    """
+    Main program function.
+
+    Plays the games and prints the report.
+    """
+
+    args = parse_args()
+    results, seconds = simulate(args)
+    report(args, results, seconds)
+
+
+if __name__ == "__main__":
+    main()
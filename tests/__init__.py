@@ -0,0 +1,14 @@
+"""
+Tests package.
+
+Tests package contains the tests of the game package, run from the
+repository root:
+    python3 -m pytest
+
+Tests package includes following modules:
+    - helpers - player boards set up by the tests.
+    - test_engine - timer and scores of the game engine.
+    - test_solver - certain fields found by the hint solver.
+    - test_probability - mine chances against brute force.
+    - test_minesweeper - game start from the saved snapshots.
+"""
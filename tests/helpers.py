@@ -0,0 +1,29 @@
+"""
+Test helpers.
+
+Helpers setting up the game objects shared by the tests.
+
+Functions:
+    - player_board()
+"""
+
+from modules.board import PlayerBoard
+from modules.consts import HIDDEN, FLAG
+
+
+def player_board(board):
+    """
+    Creates a player board showing the fields.
+
+    :param board: Fields of the board rows.
+    :type board: list
+    :return: Player board.
+    :rtype: PlayerBoard
+    """
+
+    pl_board = PlayerBoard(len(board), len(board[0]), None)
+    pl_board.board = [list(row) for row in board]
+    pl_board.hidden_count = sum(row.count(HIDDEN) for row in board)
+    pl_board.flag_count = sum(row.count(FLAG) for row in board)
+
+    return pl_board
@@ -0,0 +1,77 @@
+"""
+Engine tests.
+
+Tests of the game engine's timer and scores on a clock set by
+the tests.
+
+Functions:
+    - test_timer_starts_with_play()
+    - test_scores_hold_back_a_second()
+    - test_game_finished_at_once_scores_zero()
+"""
+
+from modules.engine import GameEngine, PLAYING, WON, LOST
+
+
+def test_timer_starts_with_play():
+    """
+    Time before the play begins isn't counted.
+    """
+
+    now = [100.]
+    engine = GameEngine(clock=lambda: now[0])
+    engine.new_game(3, 3, 1, seed=1)
+
+    now[0] = 130.
+    engine.start_timer()
+    now[0] = 135.2
+
+    assert engine.elapsed() == 4
+
+
+def test_scores_hold_back_a_second():
+    """
+    Won game scores the elapsed seconds less one, lost game
+    the same negated.
+    """
+
+    now = [0.]
+    engine = GameEngine(clock=lambda: now[0])
+
+    engine.new_game(2, 2, 1, mine_fields=[0])
+    now[0] = 10.
+    for row, col in ((0, 1), (1, 0), (1, 1)):
+        result = engine.step("display", row, col)
+
+    assert (result.state, result.score) == (WON, 9)
+
+    engine.new_game(2, 2, 1, mine_fields=[0])
+    now[0] = 17.
+    result = engine.step("display", 0, 0)
+
+    assert (result.state, result.score) == (LOST, -6)
+
+
+def test_game_finished_at_once_scores_zero():
+    """
+    Games won or lost in under the held back second score 0,
+    the timer never goes negative.
+    """
+
+    now = [0.]
+    engine = GameEngine(clock=lambda: now[0])
+
+    engine.new_game(2, 2, 1, mine_fields=[0])
+    assert engine.elapsed() == 0
+    for row, col in ((0, 1), (1, 0), (1, 1)):
+        result = engine.step("display", row, col)
+
+    assert (result.state, result.score) == (WON, 0)
+
+    engine.new_game(2, 2, 1, mine_fields=[0])
+    now[0] = .3
+    result = engine.step("display", 0, 1)
+    assert result.state == PLAYING
+    result = engine.step("display", 0, 0)
+
+    assert (result.state, result.score) == (LOST, 0)
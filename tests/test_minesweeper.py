@@ -0,0 +1,82 @@
+"""
+Minesweeper tests.
+
+Tests of the game's start from the saved snapshots of a session,
+and of it's hints.
+
+Functions:
+    - test_corrupt_snapshot_starts_new_game()
+    - test_session_start_takes_one_pool_board()
+    - test_first_move_hint_is_any_field()
+"""
+
+import io
+from modules.board_pool import BoardPool
+from modules.consts import HIDDEN
+from modules.engine import PLAYING
+from modules.minesweeper import Minesweeper
+from modules.snapshot import SnapshotStore, dump_snapshot
+
+
+def test_corrupt_snapshot_starts_new_game(tmp_path):
+    """
+    Snapshot that can't be restored is deleted, and a new game
+    is started instead.
+    """
+
+    store = SnapshotStore(str(tmp_path))
+    store.save("player", b"not a snapshot")
+
+    game = Minesweeper(4, 5, 3, session="player", store=store,
+                       out=io.StringIO(), size=(80, 24))
+
+    assert not game.resumed
+    assert store.load("player") is None
+    assert (game.engine.rows, game.engine.cols) == (4, 5)
+    assert game.engine.state == PLAYING
+    assert game.engine.pl_board.hidden_count == 20
+    assert game.engine.pl_board.board[0][0] == HIDDEN
+
+
+def test_session_start_takes_one_pool_board(tmp_path):
+    """
+    New game takes one board of the pool, resumed game takes none,
+    it's mines are restored from the snapshot.
+    """
+
+    store = SnapshotStore(str(tmp_path))
+    # Pool is not started, every board is generated on request.
+    pool = BoardPool([(9, 9, 10)])
+
+    game = Minesweeper(9, 9, 10, session="player", store=store,
+                       board_pool=pool, out=io.StringIO(), size=(80, 24))
+
+    assert not game.resumed
+    assert pool.hits + pool.misses == 1
+
+    game.engine.step("display", 4, 4)
+    store.save("player", dump_snapshot(game.engine))
+
+    game = Minesweeper(9, 9, 10, session="player", store=store,
+                       board_pool=pool, out=io.StringIO(), size=(80, 24))
+
+    assert game.resumed
+    assert pool.hits + pool.misses == 1
+
+
+def test_first_move_hint_is_any_field():
+    """
+    Hint before the first move says any field is safe, rather than
+    the mine chance of a board without mines placed yet.
+    """
+
+    game = Minesweeper(9, 9, 10, out=io.StringIO(), size=(80, 24))
+    game._hint()
+
+    assert "any field is safe" in game.hint
+
+    game.engine.step("display", 4, 4)
+    game.solver.rebuild()
+    game._hint()
+
+    assert "any field is safe" not in game.hint
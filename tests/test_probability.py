@@ -0,0 +1,135 @@
+"""
+Probability tests.
+
+Tests of the mine chances against counting every mine placement
+that fits the player board.
+
+The script requires:
+    - Built in utility "random" and it's class "Random" for the boards.
+    - Built in utility "itertools" and it's function "combinations"
+        for the mine placements.
+
+Functions:
+    - random_game()
+    - brute_force()
+    - test_flags_next_to_empty()
+    - test_random_boards_match_brute_force()
+"""
+
+from random import Random
+from itertools import combinations
+from modules.board import PlayerBoard
+from modules.solver import Solver
+from modules.probability import MineProbability
+from modules.consts import HIDDEN, EMPTY, FLAG
+from tests.helpers import player_board
+
+
+# Random boards checked by brute force.
+GAMES = 300
+
+
+def random_game(rng):
+    """
+    Plays a few random moves of a small random game, flags are placed
+    first, so the flood fill stops at them.
+
+    :param rng: Random generator of the game.
+    :type rng: Random
+    :return: Player board fields and number of mines.
+    :rtype: tuple
+    """
+
+    rows, cols = rng.randint(2, 4), rng.randint(2, 4)
+    mines = rng.randint(1, rows * cols // 2)
+    mine_fields = set(rng.sample(range(rows * cols), mines))
+    topology = PlayerBoard(rows, cols, None).topology
+
+    board = [[HIDDEN] * cols for _ in range(rows)]
+    for field in rng.sample(range(rows * cols), rng.randint(0, 3)):
+        board[field // cols][field % cols] = FLAG
+
+    for _ in range(rng.randint(1, 3)):
+        start = rng.randrange(rows * cols)
+        if start in mine_fields or \
+                board[start // cols][start % cols] != HIDDEN:
+            continue
+
+        stack = [start]
+        while stack:
+            field = stack.pop()
+            row, col = divmod(field, cols)
+            if board[row][col] != HIDDEN:
+                continue
+
+            adjacent = topology.adjacent_fields(field)
+            value = len(mine_fields.intersection(adjacent))
+            board[row][col] = value or EMPTY
+            if not value:
+                stack.extend(adjacent)
+
+    return board, mines
+
+
+def brute_force(board, mines):
+    """
+    Counts the mine placements that fit the displayed fields.
+
+    :param board: Player board fields.
+    :type board: list
+    :param mines: Number of mines.
+    :type mines: int
+    :return: Mine chance of every hidden field, keyed by it's flat
+        index.
+    :rtype: dict
+    """
+
+    rows, cols = len(board), len(board[0])
+    topology = PlayerBoard(rows, cols, None).topology
+    values = {row * cols + col: 0 if value == EMPTY else value
+              for row in range(rows) for col, value in enumerate(board[row])
+              if value not in (HIDDEN, FLAG)}
+    hidden = [field for field in range(rows * cols) if field not in values]
+
+    counts = dict.fromkeys(hidden, 0)
+    solutions = 0
+    for placement in combinations(hidden, mines):
+        placed = set(placement)
+        if all(len(placed.intersection(topology.adjacent_fields(field)))
+               == value for field, value in values.items()):
+            solutions += 1
+            for field in placement:
+                counts[field] += 1
+
+    return {field: count / solutions for field, count in counts.items()}
+
+
+def test_flags_next_to_empty():
+    """
+    Flagged field next to an EMPTY field has no mine chance.
+    """
+
+    odds = MineProbability(Solver(player_board([[EMPTY, EMPTY, EMPTY],
+                                                [1, 1, EMPTY],
+                                                [FLAG, FLAG, EMPTY]])),
+                           1).odds()
+
+    assert odds.fields == {6: 1., 7: 0.}
+
+
+def test_random_boards_match_brute_force():
+    """
+    Mine chances of small random boards, with flags stopping the flood
+    fill, are the chances of counting every mine placement.
+    """
+
+    rng = Random(17)
+
+    for _ in range(GAMES):
+        board, mines = random_game(rng)
+        odds = MineProbability(Solver(player_board(board)), mines).odds()
+
+        assert odds.exact
+        for field, chance in brute_force(board, mines).items():
+            assert abs(odds.fields.get(field, odds.other) - chance) < 1e-9, \
+                (board, mines, field)
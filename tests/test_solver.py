@@ -0,0 +1,42 @@
+"""
+Solver tests.
+
+Tests of the hint solver on player boards set up by the tests.
+
+Functions:
+    - test_empty_decides_flagged_neighbour()
+    - test_empty_decides_flag_in_flood_fill()
+"""
+
+from modules.solver import Solver
+from modules.consts import EMPTY, FLAG
+from tests.helpers import player_board
+
+
+def test_empty_decides_flagged_neighbour():
+    """
+    Flagged field next to an EMPTY field is safe, and the mine
+    is the other field of the number.
+    """
+
+    solver = Solver(player_board([[EMPTY, EMPTY, EMPTY],
+                                  [1, 1, EMPTY],
+                                  [FLAG, FLAG, EMPTY]]))
+
+    assert solver.safe == {7}
+    assert solver.mines == {6}
+    assert solver.hint() == ("display", 2, 1)
+
+
+def test_empty_decides_flag_in_flood_fill():
+    """
+    Flag stopping the flood fill of an EMPTY region is safe,
+    with no number to tell it.
+    """
+
+    solver = Solver(player_board([[EMPTY, EMPTY, EMPTY],
+                                  [EMPTY, FLAG, EMPTY],
+                                  [EMPTY, EMPTY, EMPTY]]))
+
+    assert solver.safe == {4}
+    assert solver.hint() == ("display", 1, 1)